@@ -0,0 +1,117 @@
+'''Attackers of every square, kept up to date square write by square write.
+
+An `AttackTable` holds two lists of 64 masks in the layout of
+`chess.attacks` (a1 = bit 0):
+
+    attackers - per square, the pieces of both colors attacking it
+    attacks   - per square, the squares its piece attacks, 0 when empty
+
+A write on one square changes the attacks of the piece written there and
+of the sliders whose rays reach it, they now stop at or run past the
+square. Only those are recomputed, a move costs two or three writes, so
+asking who attacks a square becomes a list lookup.
+
+Boards keep a table when `Board.tracks_attacks` is set, perft and search
+leave it off and pay nothing.
+
+>>> from chess.board import Board
+>>> board = Board.from_fen('4k3/8/8/8/8/2n5/8/R3K3 w - - 0 1')
+>>> board.tracks_attacks = True
+>>> [Position.from_square(square) for square in iter_squares(board.attackers_of(Position.from_str('b1')))]
+[A1, C3]
+'''
+from __future__ import annotations
+
+from chess.attacks import KING_ATTACKS, KNIGHT_ATTACKS, PAWN_ATTACKS, iter_squares
+from chess.constants import FigureType as Type
+from chess.magics import bishop_attacks, rook_attacks
+from chess.position import Position
+
+_SLIDERS = (Type.BISHOP, Type.ROOK, Type.QUEEN)
+
+
+def piece_attacks(piece, square: int, occupancy: int) -> int:
+    '''The squares `piece` attacks from `square`, 0 for an empty square.'''
+    if piece is None:
+        return 0
+
+    figure_type = piece.figure_type
+    if figure_type is Type.PAWN:
+        return PAWN_ATTACKS[piece.color][square]
+    if figure_type is Type.KNIGHT:
+        return KNIGHT_ATTACKS[square]
+    if figure_type is Type.BISHOP:
+        return bishop_attacks(square, occupancy)
+    if figure_type is Type.ROOK:
+        return rook_attacks(square, occupancy)
+    if figure_type is Type.QUEEN:
+        return bishop_attacks(square, occupancy) | rook_attacks(square, occupancy)
+    if figure_type is Type.KING:
+        return KING_ATTACKS[square]
+
+    return 0
+
+
+class AttackTable:
+    __slots__ = ('attackers', 'attacks')
+
+    def __init__(self):
+        self.attackers = [0] * 64
+        self.attacks = [0] * 64
+
+    @classmethod
+    def of(cls, board) -> AttackTable:
+        '''Computes the table of `board` from scratch.'''
+        table = cls()
+        occupancy = board.occupancy
+
+        for square in iter_squares(occupancy):
+            table._set(square, piece_attacks(board._piece_at(square), square, occupancy))
+
+        return table
+
+    def copy(self) -> AttackTable:
+        table = self.__class__.__new__(self.__class__)
+        table.attackers = list(self.attackers)
+        table.attacks = list(self.attacks)
+
+        return table
+
+    def update(self, board, square: int, piece) -> None:
+        '''`piece` was written on `square`, the occupancy of `board` already includes it.
+
+        Every other square must hold its piece already, the written one need not.
+        '''
+        occupancy = board.occupancy
+
+        # the sliders seeing the square, their rays now stop at it or run past it
+        for attacker in iter_squares(self.attackers[square]):
+            slider = board._piece_at(attacker)
+            if slider.figure_type in _SLIDERS:
+                self._set(attacker, piece_attacks(slider, attacker, occupancy))
+
+        self._set(square, piece_attacks(piece, square, occupancy))
+
+    def _set(self, square: int, attacked: int) -> None:
+        attackers = self.attackers
+        bit = 1 << square
+        old = self.attacks[square]
+
+        for target in iter_squares(old & ~attacked):
+            attackers[target] &= ~bit
+        for target in iter_squares(attacked & ~old):
+            attackers[target] |= bit
+
+        self.attacks[square] = attacked
+
+    def __eq__(self, other):
+        if not isinstance(other, AttackTable):
+            return NotImplemented
+
+        return self.attackers == other.attackers and self.attacks == other.attacks
+
+    __hash__ = None
+
+    def __repr__(self):
+        attacked = sum(1 for attackers in self.attackers if attackers)
+        return f'{self.__class__.__name__}(attacked_squares={attacked})'
@@ -0,0 +1,138 @@
+'''Precomputed attack tables.
+
+Every table is indexed by square index (a1 = 0, b1 = 1, ..., h8 = 63,
+see `Position.square`) and is built once, at import time.
+
+    *_TARGETS - tuples of the attacked positions, for list based boards
+    *_ATTACKS - the same squares packed in a 64-bit mask, for bitboards
+    RAYS      - per square and direction, the squares a slider passes through
+
+The symmetry tables map every square to its image, `FLIP_RANKS` swaps
+rank 1 with rank 8, `MIRROR_FILES` file a with file h and
+`ROTATE_CLOCKWISE` turns the board a quarter, a1 going to a8.
+
+>>> KNIGHT_TARGETS[Position.from_str('a1').square]
+(C2, B3)
+>>> PAWN_TARGETS[Color.BLACK][Position.from_str('e5').square]
+(D4, F4)
+>>> PAWN_PUSHES[Color.WHITE][Position.from_str('e2').square]
+(E3, E4)
+>>> RAYS[Position.from_str('f6').square][UP_RIGHT]
+(54, 63)
+>>> [Position.from_square(table[Position.from_str('b3').square]) for table in (FLIP_RANKS, MIRROR_FILES)]
+[B6, G3]
+'''
+from typing import Iterator
+
+from chess.constants import Diagonal, Direction
+from chess.constants import FigureColor as Color
+from chess.position import Position
+
+# Ray directions, the first four walk towards the higher square indices
+UP, RIGHT, UP_RIGHT, UP_LEFT, DOWN, LEFT, DOWN_LEFT, DOWN_RIGHT = range(8)
+
+STRAIGHT = (UP, RIGHT, DOWN, LEFT)
+DIAGONAL = (UP_RIGHT, UP_LEFT, DOWN_LEFT, DOWN_RIGHT)
+
+# Whole files and ranks as masks, for shifting pawns set-wise
+FILE_A = 0x0101010101010101
+FILE_H = FILE_A << 7
+RANK_3 = 0xff << 16
+RANK_6 = 0xff << 40
+
+# Symmetries, the square every square is carried to
+FLIP_RANKS = tuple(square ^ 56 for square in range(64))
+MIRROR_FILES = tuple(square ^ 7 for square in range(64))
+ROTATE_CLOCKWISE = tuple((7 - (square & 7)) * 8 + (square >> 3) for square in range(64))
+
+DIRECTION_INDEX = {
+    Direction.UP: UP,
+    Direction.RIGHT: RIGHT,
+    Direction.DOWN: DOWN,
+    Direction.LEFT: LEFT,
+    Diagonal.UP_RIGHT: UP_RIGHT,
+    Diagonal.UP_LEFT: UP_LEFT,
+    Diagonal.DOWN_LEFT: DOWN_LEFT,
+    Diagonal.DOWN_RIGHT: DOWN_RIGHT,
+}
+
+_RAY_STEPS = [(1, 0), (0, 1), (1, 1), (1, -1), (-1, 0), (0, -1), (-1, -1), (-1, 1)]
+_KNIGHT_STEPS = [(2, 1), (1, 2), (-1, 2), (-2, 1), (-2, -1), (-1, -2), (1, -2), (2, -1)]
+_KING_STEPS = [(1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)]
+_PAWN_STEPS = {
+    Color.WHITE: [(1, -1), (1, 1)],
+    Color.BLACK: [(-1, -1), (-1, 1)],
+}
+
+
+def iter_squares(mask: int) -> Iterator[int]:
+    '''Yields the indices of the set bits, lowest first.
+
+    >>> list(iter_squares(0b1010))
+    [1, 3]
+    '''
+    while mask:
+        lsb = mask & -mask
+        yield lsb.bit_length() - 1
+        mask ^= lsb
+
+
+def _step_mask(square: int, steps) -> int:
+    rank, file = divmod(square, 8)
+    mask = 0
+
+    for d_rank, d_file in steps:
+        r, f = rank + d_rank, file + d_file
+        if 0 <= r < 8 and 0 <= f < 8:
+            mask |= 1 << (r * 8 + f)
+
+    return mask
+
+
+def _ray(square: int, d_rank: int, d_file: int):
+    rank, file = divmod(square, 8)
+    squares = []
+
+    rank, file = rank + d_rank, file + d_file
+    while 0 <= rank < 8 and 0 <= file < 8:
+        squares.append(rank * 8 + file)
+        rank, file = rank + d_rank, file + d_file
+
+    return tuple(squares)
+
+
+def _targets(masks):
+    return [tuple(map(Position.from_square, iter_squares(mask))) for mask in masks]
+
+
+def _pushes(color: Color, square: int):
+    rank, file = divmod(square, 8)
+    forward, starting_rank = (1, 1) if color is Color.WHITE else (-1, 6)
+
+    if not 0 <= rank + forward < 8:
+        return ()
+
+    pushes = [Position.from_square(square + 8 * forward)]
+    if rank == starting_rank:
+        pushes.append(Position.from_square(square + 16 * forward))
+
+    return tuple(pushes)
+
+
+KNIGHT_ATTACKS = [_step_mask(square, _KNIGHT_STEPS) for square in range(64)]
+KING_ATTACKS = [_step_mask(square, _KING_STEPS) for square in range(64)]
+PAWN_ATTACKS = {
+    color: [_step_mask(square, steps) for square in range(64)]
+    for color, steps in _PAWN_STEPS.items()
+}
+
+KNIGHT_TARGETS = _targets(KNIGHT_ATTACKS)
+KING_TARGETS = _targets(KING_ATTACKS)
+PAWN_TARGETS = {color: _targets(masks) for color, masks in PAWN_ATTACKS.items()}
+
+# One and, from the starting rank, two squares forward
+PAWN_PUSHES = {color: [_pushes(color, square) for square in range(64)] for color in Color}
+
+# RAYS[square][direction] - the squares in that direction, nearest first
+RAYS = [tuple(_ray(square, *step) for step in _RAY_STEPS) for square in range(64)]
+RAY_ATTACKS = [tuple(sum(1 << s for s in ray) for ray in rays) for rays in RAYS]
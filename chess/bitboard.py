@@ -0,0 +1,254 @@
+'''Bitboard backend for `chess.board.Board`.
+
+The position is kept in twelve 64-bit integers, one per (color, piece type),
+plus an occupancy mask per color. Squares are numbered little-endian rank-file,
+a1 = 0, b1 = 1, ..., h8 = 63.
+
+`BitBoard` keeps the public API of `Board` - `board[rank][file]` indexing,
+`is_empty`, `are_enemies`, `kings` etc. still work, but attack detection,
+sliding and castling checks are answered with bit operations.
+
+>>> board = BitBoard.standard_configuration()
+>>> board[Rank.ONE][File.E]
+White King
+>>> board.is_empty(Position(Rank.FOUR, File.E))
+True
+'''
+from __future__ import annotations
+
+import itertools
+from typing import Iterator, List, Optional, Union
+
+from chess.attacks import KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, FILE_A, FILE_H, iter_squares
+from chess.attacks import DIAGONAL, STRAIGHT, DIRECTION_INDEX
+from chess.board import Board, _RankView, square_of, _CODE_PIECES
+from chess.constants import Diagonal, Direction
+from chess.constants import FigureColor as Color, FigureType as Type
+from chess.constants import Rank, File
+from chess.magics import bishop_attacks, rook_attacks, slider_attacks
+from chess.movegen import CheckInfo
+from chess.position import Position
+from chess.utils import method_dispatch
+
+WHITE, BLACK = 0, 1
+
+_ALL_SQUARES = (1 << 64) - 1
+_NOT_FILE_A = _ALL_SQUARES ^ FILE_A
+_NOT_FILE_H = _ALL_SQUARES ^ FILE_H
+
+# the pawn attacks of each color, spares attackers_of the lookups keyed by the Color enum
+_WHITE_PAWN_ATTACKS, _BLACK_PAWN_ATTACKS = PAWN_ATTACKS[Color.WHITE], PAWN_ATTACKS[Color.BLACK]
+
+
+def _between(a: int, b: int) -> int:
+    '''The squares strictly between two squares on a common line, 0 if they share none.'''
+    a_bit, b_bit = 1 << a, 1 << b
+
+    if rook_attacks(a, 0) & b_bit:
+        return rook_attacks(a, b_bit) & rook_attacks(b, a_bit)
+    if bishop_attacks(a, 0) & b_bit:
+        return bishop_attacks(a, b_bit) & bishop_attacks(b, a_bit)
+
+    return 0
+
+
+def _color_index(color: Color) -> int:
+    return WHITE if color is Color.WHITE else BLACK
+
+
+# index into BitBoard._pieces of every piece, keyed by the piece objects themselves
+_PIECE_INDEX = {piece: code - 1 for code, piece in _CODE_PIECES.items() if piece is not None}
+
+
+_PAWN, _BISHOP, _ROOK, _KNIGHT, _QUEEN, _KING = (t.value - 1 for t in (
+    Type.PAWN, Type.BISHOP, Type.ROOK, Type.KNIGHT, Type.QUEEN, Type.KING
+))
+
+
+class BitBoard(Board):
+    def empty(self) -> List[Optional['ChessPiece']]:  # noqa: F821
+        '''Resets the bitboards and returns the per square piece lookup.
+
+        The bitboards answer every question about the position, the lookup
+        only exists so `board[rank][file]` can hand back the same piece objects.
+        '''
+        self._pieces = [0] * 12
+        # board[rank] hands these out, views hold no state besides their rank
+        self._rank_views = [_RankView(self, rank) for rank in range(12)]
+
+        return [None] * 64
+
+    def copy(self) -> BitBoard:
+        board = super().copy()
+        board._pieces = list(self._pieces)
+        board._rank_views = [_RankView(board, rank) for rank in range(12)]
+
+        return board
+
+    def _copy_squares(self, board: BitBoard) -> List[Optional['ChessPiece']]:  # noqa: F821
+        return list(self._board)
+
+    def __getitem__(self, key: Union[int, Rank, slice]):
+        return self._rank_views[key]
+
+    def _put(self, square: int, piece) -> None:
+        bit = 1 << square
+        old = self._board[square]
+
+        if old is not None:
+            self._pieces[_PIECE_INDEX[old]] &= ~bit
+
+        if piece is not None:
+            self._pieces[_PIECE_INDEX[piece]] |= bit
+
+        # the masks of each color are kept by _track
+        self._track(square, old, piece)
+        self._board[square] = piece
+
+    def _piece_at(self, square: int):
+        return self._board[square]
+
+    def _rank_pieces(self, rank_index: int) -> Iterator:
+        return itertools.islice(self._board, rank_index * 8, rank_index * 8 + 8)
+
+    def pieces_mask(self, color: Color, figure_type: Type) -> int:
+        '''The bitboard of all pieces of the given color and type.'''
+        return self._pieces[_color_index(color) * 6 + figure_type.value - 1]
+
+    def is_empty(self, position: Union[Position, int]):
+        square = square_of(position)
+        return square is not None and self._board[square] is None
+
+    def is_out_of_bounds(self, pos: Union[Position, int]):
+        return square_of(pos) is None
+
+    @method_dispatch
+    def are_enemies(self, pos1, pos2):  # pragma: no cover
+        pass
+
+    @are_enemies.register(Position)
+    @are_enemies.register(int)
+    def _(self, pos1: Union[Position, int], pos2: Union[Position, int]) -> bool:
+        square1, square2 = square_of(pos1), square_of(pos2)
+
+        if square1 is None or square2 is None:
+            return False
+
+        piece1, piece2 = self._board[square1], self._board[square2]
+        return piece1 is not None and piece2 is not None and piece1.color is not piece2.color
+
+    @are_enemies.register
+    def _(self, color: Color, pos2: Union[Position, int]) -> bool:
+        square = square_of(pos2)
+        piece = self._board[square] if square is not None else None
+
+        return piece is not None and piece.color is not color
+
+    def attackers_of(self, square: Union[Position, int], occupancy: int = None) -> int:
+        if type(square) is not int:
+            square = square.square
+        if occupancy is None:
+            if self._attack_table is not None:
+                return self._attack_table.attackers[square]
+            occupancy = self.occupancy
+
+        pieces = self._pieces
+        queens = pieces[_QUEEN] | pieces[6 + _QUEEN]
+        diagonal = pieces[_BISHOP] | pieces[6 + _BISHOP] | queens
+        straight = pieces[_ROOK] | pieces[6 + _ROOK] | queens
+
+        return occupancy & (
+            (KNIGHT_ATTACKS[square] & (pieces[_KNIGHT] | pieces[6 + _KNIGHT])) |
+            (KING_ATTACKS[square] & (pieces[_KING] | pieces[6 + _KING])) |
+            (_BLACK_PAWN_ATTACKS[square] & pieces[_PAWN]) |
+            (_WHITE_PAWN_ATTACKS[square] & pieces[6 + _PAWN]) |
+            (diagonal and bishop_attacks(square, occupancy) & diagonal) |
+            (straight and rook_attacks(square, occupancy) & straight)
+        )
+
+    def attackers_mask(self, square: int, color: Color, occupancy: int = None) -> int:
+        '''Bitboard of the enemies of `color` that attack `square`.'''
+        return self.attackers_of(square, occupancy) & (self.occupancy ^ self._occupied[color])
+
+    def _compute_check_info(self, color: Color) -> CheckInfo:
+        king_pos = self.kings[color]
+        if king_pos is None:
+            return CheckInfo(king_pos)
+
+        square = king_pos.square
+        us = _color_index(color)
+        them = (1 - us) * 6
+        own = self._occupied[color]
+        enemies = self.occupancy ^ own
+        pieces = self._pieces
+
+        checks = [
+            (checker, _between(square, checker) | 1 << checker)
+            for checker in iter_squares(self.attackers_mask(square, color))
+        ]
+
+        pins = {}
+        queens = pieces[them + _QUEEN]
+        sliders = [
+            (pieces[them + _BISHOP] | queens, bishop_attacks),
+            (pieces[them + _ROOK] | queens, rook_attacks),
+        ]
+
+        for candidates, slider_attacks_from in sliders:
+            # looking through our own pieces, the first enemy slider on a line pins a lone blocker
+            for pinner in iter_squares(slider_attacks_from(square, enemies) & candidates):
+                line = _between(square, pinner)
+                blockers = line & own
+
+                if blockers and not blockers & (blockers - 1):
+                    pins[blockers.bit_length() - 1] = line | 1 << pinner
+
+        return CheckInfo.from_checks(king_pos, checks, pins)
+
+    def get_moves_in_direction(
+            self,
+            start_pos: Position,
+            *directions: Union[Direction, Diagonal, int]
+    ) -> List[Position]:
+        square = start_pos.square
+        white, black = self._occupied[Color.WHITE], self._occupied[Color.BLACK]
+        own = white if white >> square & 1 else black
+        occupancy = white | black
+
+        rays = tuple(d if type(d) is int else DIRECTION_INDEX[d] for d in directions)
+
+        if rays == DIAGONAL:
+            moves = bishop_attacks(square, occupancy)
+        elif rays == STRAIGHT:
+            moves = rook_attacks(square, occupancy)
+        else:
+            moves = slider_attacks(square, occupancy, rays)
+
+        moves &= ~own
+
+        return [Position.from_square(target) for target in iter_squares(moves)]
+
+    def _compute_attack_map(self, color: Color) -> int:
+        us = _color_index(color)
+        them = (1 - us) * 6
+        pieces = self._pieces
+        occupancy = self.occupancy & ~pieces[us * 6 + _KING]
+
+        pawns = pieces[them + _PAWN]
+        if them:  # black pawns attack downwards
+            attacked = (pawns >> 7 & _NOT_FILE_A) | (pawns >> 9 & _NOT_FILE_H)
+        else:
+            attacked = (pawns << 9 & _NOT_FILE_A | pawns << 7 & _NOT_FILE_H) & _ALL_SQUARES
+
+        for square in iter_squares(pieces[them + _KNIGHT]):
+            attacked |= KNIGHT_ATTACKS[square]
+        for square in iter_squares(pieces[them + _KING]):
+            attacked |= KING_ATTACKS[square]
+
+        queens = pieces[them + _QUEEN]
+        for square in iter_squares(pieces[them + _BISHOP] | queens):
+            attacked |= bishop_attacks(square, occupancy)
+        for square in iter_squares(pieces[them + _ROOK] | queens):
+            attacked |= rook_attacks(square, occupancy)
+
+        return attacked
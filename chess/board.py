@@ -2,11 +2,18 @@ from __future__ import annotations
 
 import contextlib
 import functools as fp
-import math
-from typing import Generator, Union, Dict, Iterator, Iterable, List
+import itertools
+import struct
+from collections.abc import Sequence
+from typing import Union, Callable, Dict, Iterator, Iterable, List, NamedTuple, Optional, Tuple
 
 from functional import seq
 
+from chess import attacks, zobrist
+from chess.attack_table import AttackTable, piece_attacks
+from chess.move import Move, PROMOTION_TYPES
+from chess.move import QUIET, DOUBLE_PUSH, KING_CASTLE, QUEEN_CASTLE, CAPTURE, EN_PASSANT
+from chess.movegen import ALL_SQUARES, CheckInfo, MoveList
 from chess.pieces import (
     Rook, Bishop, King, Queen, Pawn, Knight
 )
@@ -14,11 +21,140 @@ from chess.constants import CastlingPerm
 from chess.constants import Diagonal, Direction
 from chess.constants import FigureColor as Color, FigureType as Type
 from chess.constants import Rank, File
+from chess.magics import bishop_attacks, rook_attacks
 from chess.position import Position
+from chess.snapshot import Snapshot
 from chess.utils import method_dispatch
 
 P = Position.from_str
 
+# (rank, file) indices into the padded board for every square index
+_CELLS = [(9 - square // 8, 2 + square % 8) for square in range(64)]
+_SQUARES = [Position.from_square(square) for square in range(64)]
+# square index of every cell of a padded row, None on the padding
+_ROW_SQUARES = [[Position(rank, file).square for file in range(12)] for rank in range(12)]
+
+_PIECE_CLASSES = {
+    Type.PAWN: Pawn,
+    Type.KNIGHT: Knight,
+    Type.BISHOP: Bishop,
+    Type.ROOK: Rook,
+    Type.QUEEN: Queen,
+    Type.KING: King,
+}
+
+# 4 bit piece codes of `Board.to_bytes`, 0 is an empty square
+_PIECE_CODES = {
+    (color, figure_type): 6 * color_index + figure_type.value
+    for color_index, color in enumerate((Color.WHITE, Color.BLACK))
+    for figure_type in _PIECE_CLASSES
+}
+_CODE_PIECES = {code: _PIECE_CLASSES[figure_type](color) for (color, figure_type), code in _PIECE_CODES.items()}
+_CODE_PIECES[0] = None
+
+_NO_SQUARE = 64
+
+_PIECE_KEYS = zobrist.PIECE_KEYS
+
+# squares, side to move and castling rights, en passant square, kings, clocks, plies of history
+_STATE = struct.Struct('<32sBBBBHHH')
+# touched squares, castling rights, kings, en passant square, half move clock
+_UNDO = struct.Struct('<BBBBBH')
+
+_SLIDER_RAYS = [
+    (attacks.DIAGONAL, (Type.BISHOP, Type.QUEEN)),
+    (attacks.STRAIGHT, (Type.ROOK, Type.QUEEN)),
+]
+
+
+def _piece_code(piece) -> int:
+    if piece is None:
+        return 0
+
+    code = _PIECE_CODES.get((getattr(piece, 'color', None), getattr(piece, 'figure_type', None)))
+    if code is None:
+        raise ValueError(f'{piece!r} is not a piece that can be packed')
+
+    return code
+
+
+def _square_code(position: Optional[Position]) -> int:
+    return _NO_SQUARE if position is None else position.square
+
+
+def _code_square(code: int) -> Optional[Position]:
+    return None if code == _NO_SQUARE else _SQUARES[code]
+
+
+class _CastlingPath(NamedTuple):
+    '''The squares of one castling move, as squares and bit masks.'''
+    king: int
+    rook: int
+    empty: int  # between the king and the rook
+    safe: int  # the king's square and the two it passes and lands on
+
+
+def _castling_paths():
+    paths = {}
+
+    for color, base in [(Color.WHITE, 0), (Color.BLACK, 56)]:
+        king = base + 4
+        paths[color, CastlingPerm.KING_SIDE] = _CastlingPath(
+            king, base + 7, empty=0b01100000 << base, safe=0b01110000 << base,
+        )
+        paths[color, CastlingPerm.QUEEN_SIDE] = _CastlingPath(
+            king, base, empty=0b00001110 << base, safe=0b00011100 << base,
+        )
+
+    return paths
+
+
+_CASTLING_PATHS = _castling_paths()
+
+
+def _castling_rights_kept():
+    '''The castling rights that survive a move from or to each square.
+
+    Packed like in `to_bytes`, white in bits 0-1 and black in bits 2-3. A king
+    or a rook leaving its square, or a rook being taken on it, clears the
+    rights that need it.
+    '''
+    kept = [0b1111] * 64
+
+    for (color, side), path in _CASTLING_PATHS.items():
+        shift = 0 if color is Color.WHITE else 2
+        kept[path.king] &= ~(CastlingPerm.ALL << shift)
+        kept[path.rook] &= ~(side << shift)
+
+    return kept
+
+
+_CASTLING_RIGHTS_KEPT = _castling_rights_kept()
+
+
+def _castling_rook_squares(move: Move) -> Tuple[int, int]:
+    '''Where the rook of a castling move stands and where it goes.'''
+    to_square = move.to_square
+    return (to_square - 2, to_square + 1) if move.flags == QUEEN_CASTLE else (to_square + 1, to_square - 1)
+
+
+_ROOKS = {color: Rook(color) for color in Color}
+
+# every piece to its counterpart of the other color
+_COLOR_SWAPPED = {
+    piece: _CODE_PIECES[code + 6 if code <= 6 else code - 6]
+    for code, piece in _CODE_PIECES.items() if piece is not None
+}
+
+
+class _Undo(NamedTuple):
+    '''Everything `Board.pop` needs to take a move back.'''
+    squares: Tuple[Tuple[Position, Optional['ChessPiece']], ...]  # noqa: F821
+    castling_perms: Tuple[CastlingPerm, CastlingPerm]
+    kings: Tuple[Optional[Position], Optional[Position]]
+    en_passant_pos: Optional[Position]
+    half_move: int
+
 
 class OutOfBounds:
     pass
@@ -29,78 +165,214 @@ OutOfBounds = OutOfBounds()
 
 class _RankList(list):
     """A bit hacky way to make `board[rank][file] = new_piece`
-        Update board state like the kings' position dict
+        Update board state like the piece squares, the kings and the zobrist key, see `Board._track`
     """
     def __init__(self, *args, rank, board, **kwargs):
         self.__board = board
-        self.__rank = rank
+        self.__squares = _ROW_SQUARES[int(rank)]
 
         super().__init__(*args, **kwargs)
 
     def __setitem__(self, key, value):
-        if hasattr(value, 'figure_type') and value.figure_type is Type.KING:
-            self.__board.kings[value.color] = Position(self.__rank, key)
+        if isinstance(key, slice):
+            files, value = range(len(self))[key], list(value)
+            assert len(files) == len(value), 'slice assignment must not resize a rank'
+
+            for file, piece in zip(files, value):
+                self[file] = piece
+            return
+
+        square = self.__squares[key]
+        if square is not None:
+            self.__board._track(square, self[key], value)
 
         super().__setitem__(key, value)
 
 
-def _maybe_castle(board_move_func):
-    @fp.wraps(board_move_func)
-    def maybe_castle_wrapper(board, *, from_pos: Position, to_pos: Position):
-        board_move_func(board, from_pos=from_pos, to_pos=to_pos)
+class _CastlingPerms(dict):
+    """The castling rights of both colors, keeping their share of the zobrist key up to date."""
+    def __init__(self, perms=()):
+        super().__init__()
+        self.zobrist_key = 0
+        self.update(perms)
+
+    def __setitem__(self, color, perms):
+        self.zobrist_key ^= zobrist.castling_key(color, self.get(color, CastlingPerm.NONE))
+        self.zobrist_key ^= zobrist.castling_key(color, perms)
+        super().__setitem__(color, perms)
+
+    def __delitem__(self, color):
+        self.zobrist_key ^= zobrist.castling_key(color, self[color])
+        super().__delitem__(color)
+
+    def update(self, *args, **kwargs):
+        for color, perms in dict(*args, **kwargs).items():
+            self[color] = perms
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, color, perms=CastlingPerm.NONE):
+        if color not in self:
+            self[color] = perms
+        return self[color]
+
+    def pop(self, color, *default):
+        if color not in self:
+            return super().pop(color, *default)
+
+        perms = self[color]
+        del self[color]
+        return perms
+
+    def popitem(self):
+        color, perms = super().popitem()
+        self.zobrist_key ^= zobrist.castling_key(color, perms)
+        return color, perms
+
+    def clear(self):
+        super().clear()
+        self.zobrist_key = 0
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def copy(self) -> _CastlingPerms:
+        perms = self.__class__()
+        dict.update(perms, self)
+        perms.zobrist_key = self.zobrist_key
+        return perms
+
+
+def square_of(position: Union[Position, int]) -> Optional[int]:
+    '''The square index of a position, None if it points at the padding.
+
+    >>> square_of(Position(Rank.ONE, File.A)), square_of(63), square_of(Position(0, 0)) is None
+    (0, 63, True)
+    '''
+    if type(position) is int:
+        return position if 0 <= position < 64 else None
+
+    return position.square
+
 
-        square = board[to_pos.rank][to_pos.file]
-        if getattr(square, 'figure_type', None) is Type.KING:
-            board.castling_perms[square.color] = CastlingPerm.NONE
+class _RankView:
+    '''Makes `board[rank][file]` read and write a board that keeps its squares flat.
 
-            if from_pos.dist(to_pos) == 2:  # Castling -> Move rook
-                direction = from_pos.relative_direction_towards_position(to_pos)
+    Behaves like one padded row of the list based board, 12 cells wide,
+    the outer two on each side being OutOfBounds. Reads go through the
+    board's `_piece_at`, writes through its `_put`.
+    '''
+    __slots__ = ('_board', '_rank', '_squares')
 
-                old_file, new_file = ('a', 'd') if direction is Direction.LEFT else ('h', 'f')
-                rank = '1' if square.color is Color.WHITE else '8'
+    def __init__(self, board: Board, rank: int):
+        self._board = board
+        self._rank = rank
+        self._squares = _ROW_SQUARES[rank]
 
-                board.move(from_pos=P(f'{old_file}{rank}'), to_pos=P(f'{new_file}{rank}'))
+    def __getitem__(self, file):
+        if isinstance(file, slice):
+            return [self[f] for f in range(12)[file]]
 
-    return maybe_castle_wrapper
+        square = self._squares[file]
+        if square is None:
+            return OutOfBounds
 
+        return self._board._piece_at(square)
 
-def _set_or_clear_en_passant(board_move_func):
-    @fp.wraps(board_move_func)
-    def en_passant_handler(board, *, from_pos: Position, to_pos: Position):
-        board_move_func(board, from_pos=from_pos, to_pos=to_pos)
+    def __setitem__(self, file, value):
+        if isinstance(file, slice):
+            files = range(12)[file]
+            value = list(value)
+            assert len(files) == len(value), 'slice assignment must not resize a rank'
 
-        square = board[to_pos.rank][to_pos.file]
-        if to_pos == board.en_passant_pos:  # capture(delete) the pawn
-            assert isinstance(square, Pawn)
-            board[from_pos.rank][to_pos.file] = None
+            for f, piece in zip(files, value):
+                self[f] = piece
+            return
 
-        board.en_passant_pos = None
-        if hasattr(square, 'figure_type') and square.figure_type is Type.PAWN and from_pos.dist(to_pos) == 2:
-            direction = square.color.forward_direction
-            board.en_passant_pos = Position(to_pos.rank - direction, to_pos.file)
+        square = self._squares[file]
+        assert square is not None, f'cannot place a piece on the padding [{self._rank}][{file}]'
 
-    return en_passant_handler
+        self._board._put(square, value)
 
+    def __len__(self):
+        return 12
 
-def _promote_if_necessary(board_move_func):
-    @fp.wraps(board_move_func)
-    def conditional_promote_wrapper(board, *, from_pos: Position, to_pos: Position):
-        board_move_func(board, from_pos=from_pos, to_pos=to_pos)
-        square = board[to_pos.rank][to_pos.file]
+    def __iter__(self):
+        return (self[f] for f in range(12))
 
-        if hasattr(square, 'figure_type') and square.figure_type is Type.PAWN:
-            last_rank = Rank.EIGHT if square.color == Color.WHITE else Rank.ONE
 
-            if to_pos.rank == last_rank:
-                piece_cls = board.promotion_cb()
+class _ProjectionRow(Sequence):
+    '''One rank of `Board.projection`, files a to h, read straight from the board.'''
+    __slots__ = ('_board', '_squares')
 
-                board[to_pos.rank][to_pos.file] = piece_cls(square.color)
+    def __init__(self, board: Board, rank_index: int):
+        self._board = board
+        self._squares = range(rank_index * 8, rank_index * 8 + 8)
 
-    return conditional_promote_wrapper
+    def __getitem__(self, file):
+        if isinstance(file, slice):
+            return [self._board._piece_at(square) for square in self._squares[file]]
+
+        return self._board._piece_at(self._squares[file])
+
+    def __len__(self):
+        return 8
+
+    def __iter__(self):
+        return self._board._rank_pieces(self._squares.start >> 3)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class _Projection(Sequence):
+    '''The 8x8 read-only view of `Board.projection`, rank 8 first, following the board as it changes.'''
+    __slots__ = ('_board',)
+
+    def __init__(self, board: Board):
+        self._board = board
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[r] for r in range(8)[row]]
+
+        return _ProjectionRow(self._board, 7 - range(8)[row])
+
+    def __len__(self):
+        return 8
+
+    def __iter__(self):
+        return (_ProjectionRow(self._board, rank_index) for rank_index in range(7, -1, -1))
+
+    def __repr__(self):
+        return repr([list(row) for row in self])
 
 
 class Board:
     def __init__(self, promotion_cb=None):
+        # bumped on every square write, invalidates the values cached for the position
+        self._revision = 0
+        self._cache = (None, {})
+
+        # the occupied squares of each color, as bit masks
+        self._occupied = {Color.WHITE: 0, Color.BLACK: 0}
+        # the attackers of every square, only kept when tracks_attacks is set
+        self._attack_table = None
+        # the last snapshot taken and the ranks written since, one bit per rank
+        self._snapshot = None
+        self._dirty_ranks = 0xff
+        self.kings = {
+            Color.WHITE: None,
+            Color.BLACK: None,
+        }
+
+        # pieces, en passant file and side to move, see zobrist_key for the castling rights
+        self._zobrist = 0
+        self._player = Color.WHITE
+        self._en_passant_pos = None
+
         self._board = self.empty()
         self.player, self.enemy = Color.WHITE, Color.BLACK
         self.en_passant_pos = None
@@ -109,10 +381,102 @@ class Board:
             Color.WHITE: CastlingPerm.ALL,
             Color.BLACK: CastlingPerm.ALL
         }
-        self.kings = {
-            Color.WHITE: None,
-            Color.BLACK: None,
-        }
+        self.half_move = 0
+        self.full_move = 1
+        self._undo_stack = []
+        # called with the changed squares after every move, see subscribe
+        self._subscribers = []
+
+    def _track(self, square: int, old, new) -> None:
+        '''Bookkeeping of a write of `new` over `old` on `square`.
+
+        Keeps the squares of each color, the kings, the zobrist key, the revision
+        and the attack table, when there is one, current. It runs before the
+        square is written. Objects that are not pieces of a known color, like
+        test doubles, are only stored.
+        '''
+        self._revision += 1
+        self._dirty_ranks |= 1 << (square >> 3)
+
+        occupied = self._occupied
+        bit = 1 << square
+
+        # one probe per piece, misses for empty squares and anything that is not a piece
+        old_keys = _PIECE_KEYS.get(old)
+        if old_keys is not None:
+            self._zobrist ^= old_keys[square]
+            occupied[old.color] &= ~bit
+
+            if old.figure_type is Type.KING and self.kings[old.color] is _SQUARES[square]:
+                self.kings[old.color] = None
+
+        new_keys = _PIECE_KEYS.get(new)
+        if new_keys is not None:
+            self._zobrist ^= new_keys[square]
+            occupied[new.color] |= bit
+
+            if new.figure_type is Type.KING:
+                self.kings[new.color] = _SQUARES[square]
+
+        if self._attack_table is not None:
+            self._attack_table.update(self, square, new if new_keys is not None else None)
+
+    @property
+    def player(self) -> Color:
+        return self._player
+
+    @player.setter
+    def player(self, color: Color):
+        if color is not self._player:
+            self._zobrist ^= zobrist.BLACK_TO_MOVE
+        self._player = color
+
+    @property
+    def en_passant_pos(self) -> Optional[Position]:
+        return self._en_passant_pos
+
+    @en_passant_pos.setter
+    def en_passant_pos(self, position: Optional[Position]):
+        self._zobrist ^= zobrist.en_passant_key(self._en_passant_pos) ^ zobrist.en_passant_key(position)
+        self._en_passant_pos = position
+
+    @property
+    def castling_perms(self) -> _CastlingPerms:
+        return self._castling_perms
+
+    @castling_perms.setter
+    def castling_perms(self, perms: Dict[Color, CastlingPerm]):
+        self._castling_perms = _CastlingPerms(perms)
+
+    @property
+    def tracks_attacks(self) -> bool:
+        '''Whether the attackers of every square are kept up to date on each write.
+
+        It makes `attackers_of` and `get_attackers` a lookup at the cost of
+        slower writes, worth it where one position is asked about many times.
+        Off by default and not kept by `to_bytes`.
+        '''
+        return self._attack_table is not None
+
+    @tracks_attacks.setter
+    def tracks_attacks(self, enabled: bool):
+        if enabled and self._attack_table is None:
+            self._attack_table = AttackTable.of(self)
+        elif not enabled:
+            self._attack_table = None
+
+    @property
+    def zobrist_key(self) -> int:
+        '''A 64-bit key of the position, kept up to date on every change.
+
+        >>> board = Board.standard_configuration()
+        >>> start = board.zobrist_key
+        >>> for move in ['g1f3', 'g8f6', 'f3g1', 'f6g8']:
+        ...     board.push((P(move[:2]), P(move[2:])))
+        >>> board.zobrist_key == start
+        True
+        '''
+        return self._zobrist ^ self._castling_perms.zobrist_key
 
     @classmethod
     def standard_configuration(cls):
@@ -157,11 +521,9 @@ class Board:
         'Q': Queen
     }
 
-    # XXX: For now half_move_clock and full_move_clock
-    #  are ignored
     @classmethod
     def from_fen(cls, fen: str):
-        fen_board, active_side, castling, en_passant, _, _ = fen.split()
+        fen_board, active_side, castling, en_passant, half_move, full_move = fen.split()
 
         board = cls()
         board.player = Color.WHITE if active_side.lower() == 'w' else Color.BLACK
@@ -180,26 +542,25 @@ class Board:
                     piece = piece_class(color)
                     board[rank][p_file] = piece
 
-                    if char.upper() == 'K':
-                        board.kings[color] = Position(rank, p_file)
-
                     col_i += 1
 
                 else:
                     count_empty = int(char)
                     col_i += count_empty
 
-        board.castling_perms[Color.WHITE] = CastlingPerm.NONE
-        board.castling_perms[Color.BLACK] = CastlingPerm.NONE
-
-        board.castling_perms[Color.WHITE] |= int('K' in castling) << int(math.log2(CastlingPerm.KING_SIDE))
-        board.castling_perms[Color.WHITE] |= int('Q' in castling) << int(math.log2(CastlingPerm.QUEEN_SIDE))
-        board.castling_perms[Color.BLACK] |= int('k' in castling) << int(math.log2(CastlingPerm.KING_SIDE))
-        board.castling_perms[Color.BLACK] |= int('q' in castling) << int(math.log2(CastlingPerm.QUEEN_SIDE))
+        board.castling_perms = {
+            Color.WHITE: (CastlingPerm.KING_SIDE if 'K' in castling else CastlingPerm.NONE)
+            | (CastlingPerm.QUEEN_SIDE if 'Q' in castling else CastlingPerm.NONE),
+            Color.BLACK: (CastlingPerm.KING_SIDE if 'k' in castling else CastlingPerm.NONE)
+            | (CastlingPerm.QUEEN_SIDE if 'q' in castling else CastlingPerm.NONE),
+        }
 
         if en_passant != '-':
             board.en_passant_pos = Position.from_str(en_passant)
 
+        board.half_move = int(half_move)
+        board.full_move = int(full_move)
+
         return board
 
     @classmethod
@@ -246,43 +607,403 @@ class Board:
                 board[r][f] = obj
         return board
 
+    def copy(self) -> Board:
+        '''An independent board in the same position, the move history included.
+
+        Pieces and positions are immutable and shared, only the containers holding them are cloned.
+
+        >>> board = Board.standard_configuration()
+        >>> clone = board.copy()
+        >>> clone.push((P('e2'), P('e4')))
+        >>> board[Rank.TWO][File.E], clone[Rank.TWO][File.E]
+        (White Pawn, None)
+        '''
+        board = self.__class__.__new__(self.__class__)
+        board.__dict__.update(self.__dict__)
+
+        board._board = self._copy_squares(board)
+        board._occupied = dict(self._occupied)
+        board.kings = dict(self.kings)
+        board._castling_perms = self._castling_perms.copy()
+        board._undo_stack = list(self._undo_stack)
+        board._subscribers = []
+
+        if self._attack_table is not None:
+            board._attack_table = self._attack_table.copy()
+
+        revision, cache = self._cache
+        board._cache = (revision, dict(cache))
+
+        return board
+
+    def _copy_squares(self, board: Board) -> list:
+        '''A copy of the square storage that writes through to `board`.'''
+        rows = self._board
+        return rows[:2] + [_RankList(row, rank=rank, board=board) for rank, row in enumerate(rows[2:10], 2)] + rows[10:]
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def to_bytes(self) -> bytes:
+        '''The position and its move history packed in a compact byte string.
+
+        The 64 squares take a nibble each, the side to move, castling rights,
+        en passant square, kings and clocks another 10 bytes. Every ply of
+        history adds 7 bytes plus 2 per square it changed.
+        The promotion callback is not packed.
+
+        >>> board = Board.standard_configuration()
+        >>> board.push((P('e2'), P('e4')))
+        >>> data = board.to_bytes()
+        >>> len(data), Board.from_bytes(data).zobrist_key == board.zobrist_key
+        (53, True)
+        '''
+        codes = [_piece_code(self._piece_at(square)) for square in range(64)]
+        perms = self.castling_perms
+
+        chunks = [_STATE.pack(
+            bytes(low | high << 4 for low, high in zip(codes[::2], codes[1::2])),
+            (self.player is Color.BLACK) | perms[Color.WHITE] << 1 | perms[Color.BLACK] << 3,
+            _square_code(self.en_passant_pos),
+            _square_code(self.kings[Color.WHITE]),
+            _square_code(self.kings[Color.BLACK]),
+            self.half_move,
+            self.full_move,
+            len(self._undo_stack),
+        )]
+
+        for undo in self._undo_stack:
+            white_perms, black_perms = undo.castling_perms
+            white_king, black_king = undo.kings
+
+            chunks.append(_UNDO.pack(
+                len(undo.squares),
+                white_perms | black_perms << 2,
+                _square_code(white_king),
+                _square_code(black_king),
+                _square_code(undo.en_passant_pos),
+                undo.half_move,
+            ))
+            chunks.append(bytes(code for pos, piece in undo.squares for code in (pos.square, _piece_code(piece))))
+
+        return b''.join(chunks)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, promotion_cb=None):
+        '''The board packed by `to_bytes`.'''
+        squares, flags, en_passant, white_king, black_king, half_move, full_move, plies = _STATE.unpack_from(data)
+
+        board = cls(promotion_cb=promotion_cb)
+
+        for square in range(64):
+            piece = _CODE_PIECES[squares[square >> 1] >> 4 * (square & 1) & 15]
+
+            if piece is not None:
+                rank, file = _CELLS[square]
+                board[rank][file] = piece
+
+        board.kings = {Color.WHITE: _code_square(white_king), Color.BLACK: _code_square(black_king)}
+        board.player, board.enemy = (Color.BLACK, Color.WHITE) if flags & 1 else (Color.WHITE, Color.BLACK)
+        board.castling_perms = {
+            Color.WHITE: CastlingPerm(flags >> 1 & 3),
+            Color.BLACK: CastlingPerm(flags >> 3 & 3),
+        }
+        board.en_passant_pos = _code_square(en_passant)
+        board.half_move, board.full_move = half_move, full_move
+
+        offset = _STATE.size
+        for _ in range(plies):
+            count, perms, white_king, black_king, en_passant, half_move = _UNDO.unpack_from(data, offset)
+            offset += _UNDO.size
+
+            touched = data[offset:offset + 2 * count]
+            offset += 2 * count
+            squares = zip(touched[::2], touched[1::2])
+
+            board._undo_stack.append(_Undo(
+                squares=tuple((_SQUARES[square], _CODE_PIECES[code]) for square, code in squares),
+                castling_perms=(CastlingPerm(perms & 3), CastlingPerm(perms >> 2)),
+                kings=(_code_square(white_king), _code_square(black_king)),
+                en_passant_pos=_code_square(en_passant),
+                half_move=half_move,
+            ))
+
+        return board
+
+    def snapshot(self) -> Snapshot:
+        '''The position as an immutable and hashable `Snapshot`, the move history left out.
+
+        Only the ranks written since the previous snapshot are read again,
+        the tuples of the rest are shared with it, and an unchanged position
+        gives back the very same snapshot.
+
+        >>> board = Board.standard_configuration()
+        >>> board.snapshot() is board.snapshot()
+        True
+        '''
+        last, dirty = self._snapshot, self._dirty_ranks
+
+        if last is None:
+            ranks = tuple(tuple(self._rank_pieces(rank)) for rank in range(8))
+        elif dirty:
+            ranks = list(last.ranks)
+
+            for rank in attacks.iter_squares(dirty):
+                pieces = tuple(self._rank_pieces(rank))
+                if pieces != ranks[rank]:
+                    ranks[rank] = pieces
+
+            ranks = tuple(ranks)
+        else:
+            ranks = last.ranks
+
+        snapshot = Snapshot(
+            zobrist_key=self.zobrist_key,
+            ranks=ranks,
+            player=self.player,
+            castling_perms=(self.castling_perms[Color.WHITE], self.castling_perms[Color.BLACK]),
+            en_passant_pos=self.en_passant_pos,
+            half_move=self.half_move,
+            full_move=self.full_move,
+        )
+
+        if snapshot == last:
+            return last
+
+        self._snapshot, self._dirty_ranks = snapshot, 0
+        return snapshot
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Snapshot, promotion_cb=None):
+        '''A live board in the position of `snapshot`, with no moves to take back.'''
+        board = cls(promotion_cb=promotion_cb)
+
+        for square in range(64):
+            piece = snapshot.piece_at(square)
+
+            if piece is not None:
+                rank, file = _CELLS[square]
+                board[rank][file] = piece
+
+        board.player, board.enemy = (Color.BLACK, Color.WHITE) if snapshot.player is Color.BLACK \
+            else (Color.WHITE, Color.BLACK)
+        board.castling_perms = dict(zip((Color.WHITE, Color.BLACK), snapshot.castling_perms))
+        board.en_passant_pos = snapshot.en_passant_pos
+        board.half_move, board.full_move = snapshot.half_move, snapshot.full_move
+
+        board._snapshot, board._dirty_ranks = snapshot, 0
+        return board
+
+    def mirrored(self) -> Board:
+        '''The position reflected left to right, the a-file becoming the h-file.
+
+        No king and rook stand where castling expects them any more, so the
+        castling rights are dropped, the rest of the state is kept.
+
+        >>> board = Board.from_fen('4k3/8/8/8/8/8/1P6/4K3 w - - 0 1').mirrored()
+        >>> board.kings[Color.WHITE], board[Rank.TWO][File.G]
+        (D1, White Pawn)
+        '''
+        board = self.transformed(attacks.MIRROR_FILES)
+        board.castling_perms = {Color.WHITE: CastlingPerm.NONE, Color.BLACK: CastlingPerm.NONE}
+
+        return board
+
+    def color_flipped(self) -> Board:
+        '''The same position with the colors swapped, rank 1 becoming rank 8.
+
+        Every piece changes color, so do the side to move and the castling
+        rights, a position and its flip are equally good for the side to move.
+
+        >>> board = Board.from_fen('4k3/8/8/8/4P3/8/8/4K2R b K e3 0 1').color_flipped()
+        >>> board[Rank.FIVE][File.E], board.player.name, board.en_passant_pos, board.castling_perms[Color.BLACK].name
+        (Black Pawn, 'WHITE', E6, 'KING_SIDE')
+        '''
+        board = self.transformed(attacks.FLIP_RANKS, swap_colors=True)
+        board.player, board.enemy = self.enemy, self.player
+        board.castling_perms = {
+            Color.WHITE: self.castling_perms[Color.BLACK],
+            Color.BLACK: self.castling_perms[Color.WHITE],
+        }
+
+        return board
+
+    def transformed(self, squares: Sequence[int], *, swap_colors: bool = False) -> Board:
+        '''A new board with the piece on every square moved to `squares[square]`, the history left out.
+
+        `squares` is a symmetry table of `chess.attacks`, like `ROTATE_CLOCKWISE`,
+        `swap_colors` hands every piece to the other side. The en passant square
+        is carried along with the pieces, the rest of the state copied as is,
+        `mirrored()` and `color_flipped()` fix it up for their symmetry.
+
+        >>> board = Board.from_fen('4k3/8/8/8/8/8/8/R3K3 w - - 0 1').transformed(attacks.ROTATE_CLOCKWISE)
+        >>> board.kings[Color.WHITE], board[Rank.EIGHT][File.A]
+        (A4, White Rook)
+        '''
+        board = self.__class__(promotion_cb=self.promotion_cb)
+
+        for square in range(64):
+            piece = self._piece_at(square)
+
+            if piece is not None:
+                if swap_colors:
+                    piece = _COLOR_SWAPPED.get(piece, piece)
+
+                rank, file = _CELLS[squares[square]]
+                board[rank][file] = piece
+
+        board.player, board.enemy = self.player, self.enemy
+        board.castling_perms = self.castling_perms
+        if self.en_passant_pos is not None:
+            board.en_passant_pos = _SQUARES[squares[self.en_passant_pos.square]]
+        board.half_move, board.full_move = self.half_move, self.full_move
+
+        return board
+
+    def __eq__(self, other):
+        '''Boards are equal when they hold the same position.
+
+        That is the pieces, the side to move, the castling rights and the en
+        passant square. Clocks, history and the backend do not count.
+
+        Different positions nearly always differ in their zobrist keys, which are
+        compared first, only boards with equal keys are compared square by square.
+        Neither board is changed, not even its cached snapshot.
+
+        >>> transposed = Board.standard_configuration()
+        >>> for move in ['g1f3', 'g8f6', 'b1c3']:
+        ...     transposed.push((P(move[:2]), P(move[2:])))
+        >>> board = Board.standard_configuration()
+        >>> for move in ['b1c3', 'g8f6', 'g1f3']:
+        ...     board.push((P(move[:2]), P(move[2:])))
+        >>> board == transposed, len({board, transposed, Board.standard_configuration()})
+        (True, 2)
+        '''
+        if not isinstance(other, Board):
+            return NotImplemented
+        if self is other:
+            return True
+
+        if self.zobrist_key != other.zobrist_key:
+            return False
+
+        # read only, comparing must not touch the state of either board
+        return (
+            self.player is other.player
+            and self.castling_perms == other.castling_perms
+            and self.en_passant_pos == other.en_passant_pos
+            and all(tuple(self._rank_pieces(rank)) == tuple(other._rank_pieces(rank)) for rank in range(8))
+        )
+
+    def __hash__(self):
+        '''The zobrist key, a board must not be moved while it is a key of a set or a dict.
+
+        Hold a `snapshot()` instead where the board keeps playing.
+        '''
+        return self.zobrist_key
+
+    def __reduce__(self):
+        '''Pickles as the output of `to_bytes`, small enough to ship boards to worker processes.'''
+        return self.__class__.from_bytes, (self.to_bytes(),)
+
     def next_turn(self):
         self.player, self.enemy = self.enemy, self.player
 
     @property
-    def projection(self):
+    def projection(self) -> Sequence[Sequence[Optional['ChessPiece']]]:  # noqa: F821
         """
         Returns 8x8 representation, the internal representation
         need not be 8x8. So use this or index the board with constants.Rank & File
 
+        Nothing is copied, the rows read the board when indexed, so a
+        projection taken once shows the later moves too.
+
+        >>> board = Board.standard_configuration()
+        >>> view = board.projection
+        >>> view[0][4], view[-1][4], len(view), len(view[0])
+        (Black King, White King, 8, 8)
+        >>> board.move(from_pos=P('e2'), to_pos=P('e4'))
+        >>> view[4][4]
+        White Pawn
         """
-        return [row[2:-2] for row in self[2:-2]]
+        return _Projection(self)
+
+    def subscribe(self, callback: Callable[[Tuple[Tuple[Position, Optional['ChessPiece']], ...]], None]):  # noqa: F821
+        '''Calls `callback` after every `move()`, `push()` and `pop()` with the squares it changed.
+
+        It receives (position, piece) pairs, the piece being what the square
+        holds now, None when it was emptied. Castling reports both rooks'
+        squares, en passant the square of the taken pawn and a promotion
+        the promoted piece. The call comes once the board is done, after a
+        `push()` it is already the other side's turn. Returns `callback`,
+        for `unsubscribe`.
+
+        >>> board = Board.from_fen('4k3/8/8/8/8/8/8/4K2R w K - 0 1')
+        >>> _ = board.subscribe(print)
+        >>> board.push((P('e1'), P('g1')))
+        ((E1, None), (G1, White King), (H1, None), (F1, White Rook))
+        '''
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback) -> None:
+        self._subscribers.remove(callback)
+
+    def _notify(self, positions: Iterable[Position]) -> None:
+        changes = tuple((pos, self._piece_at(pos.square)) for pos in positions)
+
+        for callback in list(self._subscribers):
+            callback(changes)
+
+    def is_empty(self, position: Union[Position, int]):
+        if type(position) is int:
+            square = square_of(position)
+            return square is not None and self._piece_at(square) is None
 
-    def is_empty(self, position: Position):
         square = self[position.rank][position.file]
         return square is None
 
-    def is_out_of_bounds(self, pos: Position):
+    def is_out_of_bounds(self, pos: Union[Position, int]):
+        if type(pos) is int:
+            return square_of(pos) is None
+
         square = self[pos.rank][pos.file]
         return type(square) is type(OutOfBounds)
 
-    def is_in_bounds(self, pos: Position):
+    def is_in_bounds(self, pos: Union[Position, int]):
         return not self.is_out_of_bounds(pos)
 
+    def _contents(self, position: Union[Position, int]):
+        '''Whatever is on `position`, OutOfBounds for a square index off the board too.'''
+        if type(position) is int:
+            square = square_of(position)
+            return OutOfBounds if square is None else self._piece_at(square)
+
+        return self[position.rank][position.file]
+
     @method_dispatch
     def are_enemies(self, pos1, pos2):  # pragma: no cover
         pass
 
-    @are_enemies.register
-    def _(self, pos1: Position, pos2: Position) -> bool:
-        piece1 = self[pos1.rank][pos1.file]
-        piece2 = self[pos2.rank][pos2.file]
+    @are_enemies.register(Position)
+    @are_enemies.register(int)
+    def _(self, pos1: Union[Position, int], pos2: Union[Position, int]) -> bool:
+        piece1, piece2 = self._contents(pos1), self._contents(pos2)
+
+        if piece1 is OutOfBounds or piece2 is OutOfBounds:
+            return False
 
         return piece1 and piece2 and piece1.color != piece2.color
 
     @are_enemies.register
-    def _(self, color: Color, pos2: Position) -> bool:
-        piece = self[pos2.rank][pos2.file]
+    def _(self, color: Color, pos2: Union[Position, int]) -> bool:
+        piece = self._contents(pos2)
+
+        if piece is OutOfBounds:
+            return False
 
         return piece and color != piece.color
 
@@ -295,27 +1016,9 @@ class Board:
             self,
             start_pos: Position,
             direction: Union[Direction, Diagonal]
-    ) -> Generator[Position, None, None]:
-        rank, file = start_pos.rank, start_pos.file
-
-        delta_rank = delta_file = None
-
-        if direction in [Direction.UP, Direction.DOWN]:
-            delta_rank, delta_file = direction, 0
-
-        if direction in [Direction.RIGHT, Direction.LEFT]:
-            delta_rank, delta_file = 0, direction
-
-        if isinstance(direction, Diagonal):
-            delta_rank, delta_file = direction.composites()
-
-        curr_pos = Position(rank + delta_rank, file + delta_file)
-
-        while self.is_in_bounds(curr_pos):
-            yield Position(curr_pos.rank, curr_pos.file)
-
-            curr_pos.rank += delta_rank
-            curr_pos.file += delta_file
+    ) -> Iterator[Position]:
+        ray = attacks.RAYS[start_pos.square][attacks.DIRECTION_INDEX[direction]]
+        return map(Position.from_square, ray)
 
     def get_positions_in_direction(
             self,
@@ -330,78 +1033,644 @@ class Board:
             for direction in directions
         }
 
+    def get_moves_in_direction(
+            self,
+            start_pos: Position,
+            *directions: Union[Direction, Diagonal, int]
+    ) -> List[Position]:
+        '''Slides from `start_pos` in each of the directions.
+
+        Every direction stops at the first non-empty square, which is included
+        only if it holds an enemy of the piece standing on `start_pos`.
+        The directions are either enums or `chess.attacks` ray indices.
+        '''
+        board = self._board
+        piece = self[start_pos.rank][start_pos.file]
+        rays = attacks.RAYS[start_pos.square]
+        moves = []
+
+        for direction in directions:
+            if type(direction) is not int:
+                direction = attacks.DIRECTION_INDEX[direction]
+
+            for square in rays[direction]:
+                rank, file = _CELLS[square]
+                target = board[rank][file]
+
+                if target is not None:
+                    if piece is not None and target.color != piece.color:
+                        moves.append(Position.from_square(square))
+                    break
+
+                moves.append(Position.from_square(square))
+
+        return moves
+
+    def _get_leaper_attackers(self, square: int, color: Color) -> Iterator[Position]:
+        board = self._board
+        leapers = [
+            (attacks.KNIGHT_TARGETS[square], Type.KNIGHT),
+            (attacks.KING_TARGETS[square], Type.KING),
+            # enemy pawns attack the squares our pawns would attack from here
+            (attacks.PAWN_TARGETS[color][square], Type.PAWN),
+        ]
+
+        for positions, figure_type in leapers:
+            for position in positions:
+                piece = board[position.rank][position.file]
+
+                if piece is not None and piece.figure_type is figure_type and piece.color != color:
+                    yield position
+
+    @property
+    def occupancy(self) -> int:
+        '''The occupied squares as a bit mask, a1 = bit 0.'''
+        return self._occupied[Color.WHITE] | self._occupied[Color.BLACK]
+
+    def occupancy_of(self, color: Color) -> int:
+        '''The squares occupied by the pieces of `color` as a bit mask.'''
+        return self._occupied[color]
+
+    def attackers_of(self, square: Union[Position, int], occupancy: int = None) -> int:
+        '''The pieces of both colors attacking `square`, as a bit mask.
+
+        Squares outside `occupancy` count as empty, they neither block nor
+        attack, so removing a piece from it shows what attacks through it.
+        Defaults to the squares occupied on the board.
+
+        >>> board = Board.from_fen('4k3/8/8/8/8/2n5/8/R3K3 w - - 0 1')
+        >>> positions = lambda mask: [Position.from_square(s) for s in attacks.iter_squares(mask)]
+        >>> positions(board.attackers_of(P('b1')))
+        [A1, C3]
+        >>> positions(board.attackers_of(P('f1'))), positions(board.attackers_of(P('f1'), board.occupancy ^ 1 << 4))
+        ([E1], [A1])
+        '''
+        if type(square) is not int:
+            square = square.square
+        if occupancy is None:
+            if self._attack_table is not None:
+                return self._attack_table.attackers[square]
+            occupancy = self.occupancy
+
+        diagonal = bishop_attacks(square, occupancy)
+        straight = rook_attacks(square, occupancy)
+        knights = attacks.KNIGHT_ATTACKS[square]
+        kings = attacks.KING_ATTACKS[square]
+        # a pawn attacks the square if it stands where an enemy pawn on the square would attack
+        white_pawns = attacks.PAWN_ATTACKS[Color.BLACK][square]
+        black_pawns = attacks.PAWN_ATTACKS[Color.WHITE][square]
+
+        candidates = (diagonal | straight | knights | kings | white_pawns | black_pawns) & occupancy
+        attackers = 0
+
+        for candidate in attacks.iter_squares(candidates):
+            piece = self._piece_at(candidate)
+            if piece is None:
+                continue
+
+            figure_type = piece.figure_type
+            if figure_type is Type.PAWN:
+                reach = white_pawns if piece.color is Color.WHITE else black_pawns
+            elif figure_type is Type.KNIGHT:
+                reach = knights
+            elif figure_type is Type.BISHOP:
+                reach = diagonal
+            elif figure_type is Type.ROOK:
+                reach = straight
+            elif figure_type is Type.QUEEN:
+                reach = diagonal | straight
+            else:
+                reach = kings
+
+            attackers |= reach & 1 << candidate
+
+        return attackers
+
     def get_attackers(
             self,
             start_pos: Position,
             color: Color
-    ) -> Generator[Position, None, None]:
-        all_directions = list(Diagonal) + list(Direction)
+    ) -> Iterator[Position]:
+        '''The enemies of `color` attacking `start_pos`.'''
+        enemy = Color.BLACK if color is Color.WHITE else Color.WHITE
+        attackers = self.attackers_of(start_pos.square) & self._occupied[enemy]
+
+        return map(Position.from_square, attacks.iter_squares(attackers))
+
+    def _piece_at(self, square: int):
+        rank, file = _CELLS[square]
+        return self._board[rank][file]
+
+    def _put(self, square: int, piece) -> None:
+        rank, file = _CELLS[square]
+        self._board[rank][file] = piece
+
+    def _rank_pieces(self, rank_index: int) -> Iterator:
+        '''The contents of the rank with index `rank_index` (0 for rank 1), file a first.'''
+        rank, file = _CELLS[rank_index * 8]
+        return itertools.islice(self._board[rank], file, file + 8)
+
+    def _pieces_of(self, color: Color) -> Iterator[Tuple[Position, 'ChessPiece']]:  # noqa: F821
+        '''The pieces of `color` with their positions, costs as much as there are pieces.'''
+        for square in attacks.iter_squares(self._occupied[color]):
+            yield _SQUARES[square], self._piece_at(square)
+
+    def _generate_legal_moves(self, moves: MoveList, *, captures: bool, quiets: bool) -> MoveList:
+        if moves is None:
+            moves = MoveList()
+        else:
+            moves.clear()
+
+        pawns = 0
+
+        for position, piece in self._pieces_of(self.player):
+            if piece.figure_type is Type.PAWN:
+                pawns |= 1 << position.square
+                continue
+
+            for target in piece.generate_moves(self, position):
+                move = self.encode_move(position, target)
+
+                if captures if move.is_capture else quiets:
+                    moves.append(move)
+
+        self._generate_pawn_moves(moves, pawns, captures=captures, quiets=quiets)
+
+        return moves
+
+    def _generate_pawn_moves(self, moves: MoveList, pawns: int, *, captures: bool, quiets: bool) -> None:
+        '''The moves of all the `pawns` of the side to move at once, shifting the whole mask per kind of move.'''
+        color = self.player
+        info = self.check_info(color)
+        occupancy = self.occupancy
+        empty = ~occupancy & ALL_SQUARES
+        enemies = occupancy & ~self._occupied[color]
+
+        if color is Color.WHITE:
+            forward = 8
+            pushes = pawns << 8 & empty
+            double_pushes = (pushes & attacks.RANK_3) << 8 & empty
+            west = pawns << 7 & ~attacks.FILE_H & ALL_SQUARES
+            east = pawns << 9 & ~attacks.FILE_A & ALL_SQUARES
+        else:
+            forward = -8
+            pushes = pawns >> 8 & empty
+            double_pushes = (pushes & attacks.RANK_6) >> 8 & empty
+            west = pawns >> 9 & ~attacks.FILE_H
+            east = pawns >> 7 & ~attacks.FILE_A
+
+        groups = []
+        if quiets:
+            groups += [(pushes, forward, QUIET), (double_pushes, 2 * forward, DOUBLE_PUSH)]
+        if captures:
+            groups += [(west & enemies, forward - 1, CAPTURE), (east & enemies, forward + 1, CAPTURE)]
+
+        pins = info.pins
+        for targets, delta, flags in groups:
+            for to_square in attacks.iter_squares(targets & info.evasions):
+                from_square = to_square - delta
+
+                if from_square in pins and not pins[from_square] >> to_square & 1:
+                    continue
+
+                move = Move.encode(from_square, to_square, flags)
+
+                if to_square >> 3 in (0, 7):
+                    for figure_type in PROMOTION_TYPES:
+                        moves.append(move.with_promotion(figure_type))
+                else:
+                    moves.append(move)
 
-        positions_by_dir = self.get_positions_in_direction(start_pos, *all_directions)
-        positions_by_dir['Knight'] = filter(self.is_in_bounds, Knight.possible_positions(start_pos))
-        diagonals = [d.name for d in Diagonal]  # TODO(yavor): cleanup from bug fix
-        directions = [d.name for d in Direction]
+        en_passant = self.en_passant_pos
+        if captures and en_passant is not None and en_passant.square >> 3 == (5 if color is Color.WHITE else 2):
+            to_square = en_passant.square
+            enemy = Color.BLACK if color is Color.WHITE else Color.WHITE
 
-        for direction, positions in positions_by_dir.items():
-            direction = getattr(direction, 'name', direction)  # TODO(yavor): cleanup bug fix
-            for position in positions:
-                if not self.is_empty(position) and self.are_enemies(color, position):
-                    enemy = self[position.rank][position.file]
-                    enemy_type = enemy.figure_type
+            for from_square in attacks.iter_squares(attacks.PAWN_ATTACKS[enemy][to_square] & pawns):
+                if self.is_legal_en_passant(from_square, to_square):
+                    moves.append(Move.encode(from_square, to_square, EN_PASSANT))
+
+    def legal_moves(self, moves: MoveList = None) -> MoveList:
+        '''Every legal move of `self.player`.
+
+        Pass a MoveList to have it cleared and reused.
+
+        >>> len(Board.standard_configuration().legal_moves())
+        20
+        '''
+        return self._generate_legal_moves(moves, captures=True, quiets=True)
 
-                    if direction == 'Knight' and enemy_type is Type.KNIGHT:
-                        yield position
+    def legal_captures(self, moves: MoveList = None) -> MoveList:
+        '''The legal moves of `self.player` that take a piece, en passant included.'''
+        return self._generate_legal_moves(moves, captures=True, quiets=False)
 
-                    if direction in diagonals and enemy_type in [Type.BISHOP, Type.QUEEN]:
-                        yield position
+    def legal_quiet_moves(self, moves: MoveList = None) -> MoveList:
+        '''The legal moves of `self.player` that do not take a piece.'''
+        return self._generate_legal_moves(moves, captures=False, quiets=True)
 
-                    elif direction in directions and enemy_type in [Type.ROOK, Type.QUEEN]:
-                        yield position
+    def is_legal(self, from_pos: Union[Position, int], to_pos: Union[Position, int], promotion: Type = None) -> bool:
+        '''Whether the side to move may play `from_pos` to `to_pos`, without generating any moves.
 
-                    elif enemy_type is Type.KING and start_pos.dist(position) == 1:
-                        yield position
+        The move is matched against the reach of the piece alone and then against
+        the cached check info. A pawn reaching the last rank may name its
+        promotion or leave it to `promotion_cb`, no other move takes one.
 
-                    elif enemy_type is Type.PAWN:
-                        direction = Direction.DOWN if enemy.color == Color.WHITE else Direction.UP
-                        pawn_positions = {
-                            Position(rank=start_pos.rank + direction, file=start_pos.file + Direction.RIGHT),
-                            Position(rank=start_pos.rank + direction, file=start_pos.file + Direction.LEFT)
-                        }
-                        if position in pawn_positions:
-                            yield position
+        >>> board = Board.from_fen('4k3/8/8/b7/8/8/3P4/4K3 w - - 0 1')
+        >>> board.is_legal(P('d2'), P('d4')), board.is_legal(P('e1'), P('d1')), board.is_legal(P('e1'), P('e3'))
+        (False, True, False)
+        '''
+        from_square, to_square = square_of(from_pos), square_of(to_pos)
+        if from_square is None or to_square is None or from_square == to_square:
+            return False
+
+        color = self.player
+        piece = self._piece_at(from_square)
+        target = self._piece_at(to_square)
+
+        if piece is None or piece.color != color or (target is not None and target.color == color):
+            return False
+
+        figure_type = piece.figure_type
+        if promotion is not None and (
+                promotion not in PROMOTION_TYPES or figure_type is not Type.PAWN or to_square >> 3 not in (0, 7)):
+            return False
+
+        if figure_type is Type.KING:
+            return self._is_legal_king_move(piece, from_square, to_square)
+
+        occupancy = self.occupancy
+        en_passant = False
+
+        if figure_type is Type.PAWN:
+            forward = 8 if color is Color.WHITE else -8
+
+            if attacks.PAWN_ATTACKS[color][from_square] >> to_square & 1:
+                en_passant = target is None and self.en_passant_pos is _SQUARES[to_square]
+                reaches = target is not None or en_passant
+            elif to_square == from_square + forward:
+                reaches = target is None
+            elif to_square == from_square + 2 * forward and from_square >> 3 == (1 if color is Color.WHITE else 6):
+                reaches = not occupancy >> (from_square + forward) & 1 and target is None
+            else:
+                reaches = False
+
+        elif figure_type is Type.KNIGHT:
+            reaches = attacks.KNIGHT_ATTACKS[from_square] >> to_square & 1
+        elif figure_type is Type.BISHOP:
+            reaches = bishop_attacks(from_square, occupancy) >> to_square & 1
+        elif figure_type is Type.ROOK:
+            reaches = rook_attacks(from_square, occupancy) >> to_square & 1
+        else:
+            reaches = (bishop_attacks(from_square, occupancy) | rook_attacks(from_square, occupancy)) >> to_square & 1
+
+        if not reaches:
+            return False
+
+        if en_passant:
+            return self.is_legal_en_passant(from_square, to_square)
+
+        return bool(self.check_info(color).allowed(from_square) >> to_square & 1)
+
+    def is_legal_en_passant(self, from_pos: Union[Position, int], to_pos: Union[Position, int]) -> bool:
+        '''Whether the pawn on `from_pos` may take en passant on `to_pos` without exposing its king.
+
+        Two pawns leave the rank at once, which no pin mask describes - a rook
+        behind them may see the king - so the capture is replayed on the occupancy.
+        Only the king's safety is checked, the capture itself is taken as given.
+
+        >>> board = Board.from_fen('8/8/8/KPp4r/8/8/8/4k3 w - c6 0 1')
+        >>> board.is_legal_en_passant(P('b5'), P('c6'))
+        False
+        '''
+        from_square, to_square = square_of(from_pos), square_of(to_pos)
+
+        color = self._piece_at(from_square).color
+        king = self.kings[color]
+        if king is None:
+            return True
+
+        occupancy = self.occupancy
+        captured = 1 << ((from_square & ~7) | (to_square & 7))
+        after = occupancy & ~(1 << from_square | captured) | 1 << to_square
+        enemies = occupancy & ~self._occupied[color] & ~captured
+
+        return not self.attackers_of(king.square, after) & enemies
+
+    def _is_legal_king_move(self, king, from_square: int, to_square: int) -> bool:
+        color = king.color
 
-                elif not self.is_empty(position) and direction != 'Knight':
-                    # every other piece is blockable so we can stop going further
+        if attacks.KING_ATTACKS[from_square] >> to_square & 1:
+            if self.kings[color] is _SQUARES[from_square]:
+                return not self.attack_map(color) >> to_square & 1
+
+            return not king.is_in_check(self, _SQUARES[to_square], ignore=[_SQUARES[from_square]])
+
+        for side, step in [(CastlingPerm.KING_SIDE, 2), (CastlingPerm.QUEEN_SIDE, -2)]:
+            path = _CASTLING_PATHS[color, side]
+
+            if from_square == path.king and to_square == path.king + step:
+                return self.is_able_to_castle(color, side)
+
+        return False
+
+    def check_info(self, color: Color) -> CheckInfo:
+        '''Checkers and pins against the king of `color`, computed once per position.
+
+        >>> board = Board.from_fen('4k3/8/8/b7/8/8/3P4/4K3 w - - 0 1')
+        >>> info = board.check_info(Color.WHITE)
+        >>> info.in_check, [Position.from_square(square) for square in info.pins]
+        (False, [D2])
+        '''
+        cache = self._position_cache()
+
+        info = cache.get(('check_info', color))
+        if info is None or info.king is not self.kings[color]:
+            info = cache['check_info', color] = self._compute_check_info(color)
+
+        return info
+
+    def attack_map(self, color: Color) -> int:
+        '''The squares the enemies of `color` attack, looking through the king of `color`.
+
+        Those are the squares that king may not step on, computed once per position.
+
+        >>> board = Board.from_fen('4k3/8/8/8/8/8/8/r3K3 w - - 0 1')
+        >>> [Position.from_square(square) for square in attacks.iter_squares(board.attack_map(Color.WHITE))][:9]
+        [B1, C1, D1, E1, F1, G1, H1, A2, A3]
+        '''
+        cache = self._position_cache()
+        king = self.kings[color]
+
+        cached = cache.get(('attack_map', color))
+        if cached is None or cached[0] is not king:
+            if self._attack_table is not None:
+                attacked = self._attack_map_from_table(color)
+            else:
+                attacked = self._compute_attack_map(color)
+
+            cached = cache['attack_map', color] = (king, attacked)
+
+        return cached[1]
+
+    def _compute_attack_map(self, color: Color) -> int:
+        enemy = Color.BLACK if color is Color.WHITE else Color.WHITE
+        occupancy = self.occupancy
+        if self.kings[color] is not None:
+            occupancy &= ~(1 << self.kings[color].square)
+
+        attacked = 0
+        for position, piece in self._pieces_of(enemy):
+            square = position.square
+            figure_type = piece.figure_type
+
+            if figure_type is Type.PAWN:
+                attacked |= attacks.PAWN_ATTACKS[enemy][square]
+            elif figure_type is Type.KNIGHT:
+                attacked |= attacks.KNIGHT_ATTACKS[square]
+            elif figure_type is Type.BISHOP:
+                attacked |= bishop_attacks(square, occupancy)
+            elif figure_type is Type.ROOK:
+                attacked |= rook_attacks(square, occupancy)
+            elif figure_type is Type.QUEEN:
+                attacked |= bishop_attacks(square, occupancy) | rook_attacks(square, occupancy)
+            else:
+                attacked |= attacks.KING_ATTACKS[square]
+
+        return attacked
+
+    def _attack_map_from_table(self, color: Color) -> int:
+        '''`attack_map` out of the attack table, only the sliders hitting the king are looked at again.'''
+        table = self._attack_table
+        enemies = self._occupied[Color.BLACK if color is Color.WHITE else Color.WHITE]
+
+        attacked = 0
+        for square in attacks.iter_squares(enemies):
+            attacked |= table.attacks[square]
+
+        king = self.kings[color]
+        if king is not None:
+            occupancy = self.occupancy & ~(1 << king.square)
+
+            for square in attacks.iter_squares(table.attackers[king.square] & enemies):
+                attacked |= piece_attacks(self._piece_at(square), square, occupancy)
+
+        return attacked
+
+    def _position_cache(self) -> dict:
+        '''Values derived from the position, dropped on every square write.'''
+        revision, cache = self._cache
+        if revision != self._revision:
+            cache = {}
+            self._cache = (self._revision, cache)
+
+        return cache
+
+    def _compute_check_info(self, color: Color) -> CheckInfo:
+        king_pos = self.kings[color]
+        if king_pos is None:
+            return CheckInfo(king_pos)
+
+        square = king_pos.square
+        checks = [
+            (attacker.square, 1 << attacker.square)
+            for attacker in self._get_leaper_attackers(square, color)
+        ]
+        pins = {}
+
+        board = self._board
+        rays = attacks.RAYS[square]
+
+        for directions, figure_types in _SLIDER_RAYS:
+            for direction in directions:
+                line, shield = 0, None
+
+                for ray_square in rays[direction]:
+                    line |= 1 << ray_square
+                    rank, file = _CELLS[ray_square]
+                    piece = board[rank][file]
+
+                    if piece is None:
+                        continue
+
+                    if piece.color == color:
+                        if shield is not None:
+                            break
+                        shield = ray_square
+                        continue
+
+                    if piece.figure_type in figure_types:
+                        if shield is None:
+                            checks.append((ray_square, line))
+                        else:
+                            pins[shield] = line
                     break
 
-    @_promote_if_necessary
-    @_maybe_castle
-    @_set_or_clear_en_passant
-    def move(self, *, from_pos: Position, to_pos: Position) -> None:
+        return CheckInfo.from_checks(king_pos, checks, pins)
+
+    def encode_move(self, from_pos: Position, to_pos: Position, promotion: Type = None) -> Move:
+        '''Builds the `Move` of whatever is on `from_pos` to `to_pos`, its flags are read off the board.
+
+        >>> board = Board.from_fen('4k3/1P6/8/8/8/8/4P3/4K2R w K - 0 1')
+        >>> board.encode_move(P('e1'), P('g1')).is_castling, board.encode_move(P('e2'), P('e4')).is_double_push
+        (True, True)
+        >>> board.encode_move(P('b7'), P('b8'), Type.QUEEN)
+        Move(B7B8=Q)
+        '''
+        piece = self[from_pos.rank][from_pos.file]
+        from_square, to_square = from_pos.square, to_pos.square
+
+        if piece.figure_type is Type.PAWN and to_pos == self.en_passant_pos:
+            flags = EN_PASSANT
+        elif not self.is_empty(to_pos):
+            flags = CAPTURE
+        elif piece.figure_type is Type.PAWN and abs(to_square - from_square) == 16:
+            flags = DOUBLE_PUSH
+        elif piece.figure_type is Type.KING and abs(to_square - from_square) == 2:
+            flags = KING_CASTLE if to_square > from_square else QUEEN_CASTLE
+        else:
+            flags = QUIET
+
+        move = Move.encode(from_square, to_square, flags)
+        return move.with_promotion(promotion) if promotion else move
+
+    def move(self, move: Union[Move, int] = None, *, from_pos: Position = None, to_pos: Position = None) -> None:
         """
-        Move whatever is in `from_pos` to `to_pos`.
+        Plays `move` or, when given positions, moves whatever is in `from_pos` to `to_pos`.
         move() is permissive it won't deny a move or check for it's validity.
         It also doesn't care about who's turn is it.
+
+        A promotion takes its piece from the move, only a pawn reaching
+        the last rank without one falls back to asking `promotion_cb`.
+        A plain int, like the entries of a `MoveList`'s array, is read as a `Move`.
         """
-        square = self[from_pos.rank][from_pos.file]
+        if move is None:
+            move = self.encode_move(from_pos, to_pos)
+        elif not isinstance(move, Move):
+            move = Move(move)
+
+        self._play(move)
+
+        if self._subscribers:
+            self._notify(self._touched(move))
+
+    def _play(self, move: Move) -> None:
+        '''Writes `move` on the board, `move()` without telling the subscribers.'''
+        # squares rather than board[rank][file], this runs for every move of a search
+        from_square, to_square = move.from_square, move.to_square
+        square = self._piece_at(from_square)
 
         assert square is not None and square is not OutOfBounds
         # assert to_pos in square.generate_moves(self, from_pos)  # potentially
         # expensive, hence the commenting out
 
-        if square.figure_type is Type.ROOK:
-            if self.castling_perms[square.color]:
-                if from_pos.file == File.A:
-                    remove_mask = ~CastlingPerm.QUEEN_SIDE
-                elif from_pos.file == File.H:
-                    remove_mask = ~CastlingPerm.KING_SIDE
-                else:
-                    remove_mask = ~CastlingPerm.NONE
+        kept = _CASTLING_RIGHTS_KEPT[from_square] & _CASTLING_RIGHTS_KEPT[to_square]
+        if kept != 0b1111:
+            perms = self.castling_perms
+            perms[Color.WHITE] &= kept & 0b11
+            perms[Color.BLACK] &= kept >> 2
+
+        self._put(to_square, square)
+        self._put(from_square, None)
+
+        self.en_passant_pos = None
+
+        if move.is_en_passant:  # capture(delete) the pawn
+            self._put(from_square & ~7 | to_square & 7, None)
+
+        elif move.is_double_push:
+            self.en_passant_pos = _SQUARES[(from_square + to_square) >> 1]
+
+        elif move.is_castling:  # move the rook
+            old_square, new_square = _castling_rook_squares(move)
+
+            self._put(new_square, self._piece_at(old_square))
+            self._put(old_square, None)
+
+        if move.is_promotion:
+            piece_cls = _PIECE_CLASSES[move.promotion]
+            self._put(to_square, piece_cls(square.color))
+
+        elif square.figure_type is Type.PAWN and to_square >> 3 in (0, 7):
+            piece_cls = self.promotion_cb()
+            self._put(to_square, piece_cls(square.color))
+
+    @staticmethod
+    def _touched(move: Move) -> List[Position]:
+        '''The squares `move` writes, the rook's and the en passant victim's included.'''
+        from_square, to_square = move.from_square, move.to_square
+
+        touched = [_SQUARES[from_square], _SQUARES[to_square]]
+        if move.is_castling:
+            touched += [_SQUARES[square] for square in _castling_rook_squares(move)]
+        elif move.is_en_passant:
+            touched.append(_SQUARES[from_square & ~7 | to_square & 7])
+
+        return touched
+
+    def push(self, move: Union[Move, int, Tuple[Position, Position]]) -> None:
+        '''Plays `move` for the side to move and passes the turn.
+
+        A (from_pos, to_pos) pair is accepted too and encoded with `encode_move`,
+        a plain int is read as a `Move`.
+        Unlike `move()` the change is recorded and `pop()` restores the position exactly.
+
+        >>> board = Board.standard_configuration()
+        >>> board.push(board.encode_move(P('e2'), P('e4')))
+        >>> board[Rank.FOUR][File.E], board.en_passant_pos, board.player.name
+        (White Pawn, E3, 'BLACK')
+        >>> board.pop()
+        >>> board[Rank.TWO][File.E], board.en_passant_pos, board.player.name
+        (White Pawn, None, 'WHITE')
+        '''
+        if not isinstance(move, int):
+            move = self.encode_move(*move)
+        elif not isinstance(move, Move):
+            move = Move(move)
 
-                self.castling_perms[square.color] &= remove_mask
+        piece = self._piece_at(move.from_square)
+        target = self._piece_at(move.to_square)
 
-        self[to_pos.rank][to_pos.file] = self[from_pos.rank][from_pos.file]
-        self[from_pos.rank][from_pos.file] = None
+        self._undo_stack.append(_Undo(
+            squares=tuple((pos, self._piece_at(pos.square)) for pos in self._touched(move)),
+            castling_perms=(self.castling_perms[Color.WHITE], self.castling_perms[Color.BLACK]),
+            kings=(self.kings[Color.WHITE], self.kings[Color.BLACK]),
+            en_passant_pos=self.en_passant_pos,
+            half_move=self.half_move,
+        ))
+
+        self._play(move)
+
+        if piece.figure_type is Type.PAWN or target is not None:
+            self.half_move = 0
+        else:
+            self.half_move += 1
+
+        if self.player is Color.BLACK:
+            self.full_move += 1
+
+        self.next_turn()
+
+        if self._subscribers:
+            self._notify(self._touched(move))
+
+    def pop(self) -> None:
+        '''Takes back the last `push()`.'''
+        undo = self._undo_stack.pop()
+
+        self.next_turn()
+        if self.player is Color.BLACK:
+            self.full_move -= 1
+
+        for pos, piece in reversed(undo.squares):
+            self._put(pos.square, piece)
+
+        self.castling_perms[Color.WHITE], self.castling_perms[Color.BLACK] = undo.castling_perms
+        self.kings[Color.WHITE], self.kings[Color.BLACK] = undo.kings
+        self.en_passant_pos = undo.en_passant_pos
+        self.half_move = undo.half_move
+
+        if self._subscribers:
+            self._notify(pos for pos, _ in undo.squares)
 
     @contextlib.contextmanager
     def temporarily_remove_position(self, *positions):
@@ -424,36 +1693,12 @@ class Board:
         3) A king may not move if he is, will be or passes through a check.
 
         '''
-
         if not self.castling_perms[color] & castling_side:
             return False
 
-        king_pos = self.kings[color]
-        king = self[king_pos.rank][king_pos.file]
+        path = _CASTLING_PATHS[color, castling_side]
 
-        if king.is_in_check(self, king_pos):
+        if self.kings[color] is not _SQUARES[path.king] or self._piece_at(path.rook) is not _ROOKS[color]:
             return False
 
-        queen_side = castling_side == CastlingPerm.QUEEN_SIDE
-        direction = Direction.LEFT if queen_side else Direction.RIGHT
-
-        target_file = File.A if queen_side else File.H
-
-        ps = seq(self.get_positions_in_direction(king_pos, direction))\
-            .take_while(self.is_empty)
-        ps += seq(self.get_positions_in_direction(king_pos, direction))\
-            .drop_while(self.is_empty).take(1)
-
-        last_pos = ps[-1] if ps else None
-
-        # the predicates are wrapped in lambdas because laziness is desired
-        predicates = seq(
-            lambda: bool(ps),
-            lambda: last_pos.file == target_file,
-            lambda: not self.is_empty(last_pos),
-            lambda: self[last_pos.rank][last_pos.file].figure_type == Type.ROOK,
-            lambda: not self.are_enemies(king_pos, last_pos),
-            lambda: ps.take(2).map(lambda p: not king.is_in_check(self, p)).all()
-        )
-
-        return predicates.map(lambda f: f()).all()
+        return not (self.occupancy & path.empty or self.attack_map(color) & path.safe)
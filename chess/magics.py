@@ -0,0 +1,184 @@
+'''Magic bitboard lookups for the sliding pieces.
+
+The attacks of a rook or a bishop on an occupied board are found with one
+multiply-shift-lookup:
+
+    index = ((occupancy & mask) * magic mod 2**64) >> shift
+
+where the mask holds the squares that can block the slider (its rays without
+the board edge) and the magic number maps every blocker subset to a unique
+slot of a precomputed table. Squares and occupancies use the bitboard layout
+of `chess.attacks` (a1 = bit 0, h8 = bit 63).
+
+The magic numbers below were found with `find_magic` and are loaded as is,
+the attack tables are built from them at import time and kept in `array`s.
+
+>>> from chess.position import Position
+>>> d4 = Position.from_str('d4').square
+>>> attacks = rook_attacks(d4, 1 << Position.from_str('d6').square)
+>>> sorted(str(Position.from_square(s)) for s in iter_squares(attacks))[:6]
+['A4', 'B4', 'C4', 'D1', 'D2', 'D3']
+>>> bin(bishop_attacks(0, 0)).count('1')
+7
+'''
+import random
+from array import array
+from typing import Optional
+
+from chess.attacks import RAY_ATTACKS, STRAIGHT, DIAGONAL, DOWN, iter_squares
+
+_U64 = (1 << 64) - 1
+
+_RANK_EDGES = 0xff000000000000ff
+_FILE_EDGES = 0x8181818181818181
+
+
+def slider_attacks(square: int, occupancy: int, directions) -> int:
+    '''Slow reference attacks: walks every ray up to its first blocker.'''
+    attacks = 0
+    ray_attacks = RAY_ATTACKS[square]
+
+    for direction in directions:
+        ray = ray_attacks[direction]
+        blockers = ray & occupancy
+
+        if blockers:
+            if direction < DOWN:  # walks towards the higher squares
+                blocker = (blockers & -blockers).bit_length() - 1
+            else:
+                blocker = blockers.bit_length() - 1
+
+            ray ^= RAY_ATTACKS[blocker][direction]
+
+        attacks |= ray
+
+    return attacks
+
+
+def _relevant_mask(square: int, directions) -> int:
+    '''The squares whose occupancy changes the attacks, that is the rays without their last square.'''
+    rank_edges = _RANK_EDGES & ~(0xff << (square & ~7))
+    file_edges = _FILE_EDGES & ~(0x0101010101010101 << (square & 7))
+
+    return slider_attacks(square, 0, directions) & ~(rank_edges | file_edges)
+
+
+def _subsets(mask: int):
+    '''Every subset of the bits in mask, the Carry-Rippler trick.'''
+    subset = 0
+    while True:
+        yield subset
+        subset = (subset - mask) & mask
+        if not subset:
+            return
+
+
+def find_magic(square: int, directions, rng: Optional[random.Random] = None, tries: int = 10 ** 7) -> int:
+    '''Searches for a magic number of `square` for a slider moving along `directions`.
+
+    Used to generate the constants of this module. A search can take
+    seconds per square, so it is never run at import time.
+    '''
+    rng = rng or random.Random()
+    mask = _relevant_mask(square, directions)
+    shift = 64 - bin(mask).count('1')
+
+    occupancies = list(_subsets(mask))
+    attacks = [slider_attacks(square, occ, directions) for occ in occupancies]
+
+    for _ in range(tries):
+        magic = rng.getrandbits(64) & rng.getrandbits(64) & rng.getrandbits(64)
+
+        if bin((mask * magic) & 0xff00000000000000).count('1') < 6:
+            continue
+
+        used = {}
+        for occ, attack in zip(occupancies, attacks):
+            index = ((occ * magic) & _U64) >> shift
+            if used.setdefault(index, attack) != attack:
+                break
+        else:
+            return magic
+
+    raise ValueError(f'no magic found for square {square}')
+
+
+_ROOK_MAGICS = [
+    0x0380002a1281c000, 0x0200102302408200, 0x3480200289100080, 0x0480100208008004,
+    0x0280080180040002, 0x0600100600040831, 0x0400300401084082, 0x1a00020040810024,
+    0x0082002080420101, 0x0202002080410200, 0x0210801000200882, 0x2408801000080080,
+    0x5090800800840080, 0x0222000488908200, 0x0004001002080104, 0x0c20800080005900,
+    0x924380800820c011, 0x0040484010002000, 0x0020008020801000, 0x1020808010000804,
+    0x0402850008009100, 0x8054008002008004, 0x400004005f100802, 0x00c65a0004164a81,
+    0x0c00408200210200, 0x041002c240002000, 0x0020004100210010, 0x0600100080080082,
+    0xc208008880040080, 0x0400020080040080, 0xe000420400614810, 0x0020008200104104,
+    0x0800804000800038, 0x0290002008400048, 0x2080200282801000, 0x0c1600100a004120,
+    0xc100800800800402, 0x04a0020080800400, 0x0208480184000210, 0x1801010082000044,
+    0x1000400080008024, 0x100120100040c000, 0xa025002002450010, 0xc240080010008080,
+    0x842b010801050010, 0x0080040002008080, 0x0040821001840008, 0x0000412040920004,
+    0x0421400680002480, 0x0100400080200080, 0x0018801042002200, 0x0800480080100280,
+    0x0685800402080080, 0x0089008400020900, 0x5044302802018400, 0x0200005084110200,
+    0x0020310080012441, 0x0000204104120086, 0x00004010800a2202, 0x2002082010000501,
+    0x0002006010440882, 0x8002004150381402, 0x050004a502181004, 0xc200002081004402,
+]
+
+_BISHOP_MAGICS = [
+    0x0020202210404086, 0x0082480101020000, 0x00044902120000a0, 0x8008285302400064,
+    0x8002021000008100, 0x040288200a000000, 0x0080440208400840, 0x1b02010042022000,
+    0x4080c14808008080, 0x3200901031090021, 0x0080086808488000, 0x48150404218c2200,
+    0x2000040504409000, 0x0040084110100900, 0x0002040101082042, 0x8e00202108088408,
+    0x00040a0810041800, 0x0002a00802140408, 0x8088041008881013, 0x9000800802094032,
+    0x544400ce01215008, 0x0804212200900800, 0x0041001401280200, 0x4100800100411090,
+    0x000ea80c41886800, 0x000a1800b1010808, 0x0805100021040820, 0x4021080344004010,
+    0x2102840008802000, 0x0810010040240101, 0x0084004000882408, 0x0000848401004840,
+    0x2028201000044408, 0x000090484004a800, 0x4041040100a88800, 0x0010c20080180082,
+    0x0021100400008020, 0x0002174501020088, 0x8085040404093300, 0xc048044840090500,
+    0x1811010920204000, 0x02c2085b0c014820, 0x0000082488007000, 0x8004020122088400,
+    0x00403a0202005412, 0x8c40080089010020, 0x020408009400a100, 0x0402008101029208,
+    0x2004008404208000, 0x08008080a8208000, 0x0201004a08040804, 0xa12000020a020002,
+    0x8004113102022104, 0x0262040408120200, 0x08d002b001120000, 0x2810042804822481,
+    0x0030110410122814, 0x8082042684100800, 0x00c0201210840400, 0x681440000c208810,
+    0x4400000120042400, 0x0022022060420224, 0x0100102008010050, 0x0002200200821081,
+]
+
+
+def _build_table(magics, directions):
+    '''Returns the (mask, magic, shift, offset) of every square and one array with all their attack tables.'''
+    masks = [_relevant_mask(square, directions) for square in range(64)]
+    shifts = [64 - bin(mask).count('1') for mask in masks]
+    offsets = []
+
+    size = 0
+    for shift in shifts:
+        offsets.append(size)
+        size += 1 << (64 - shift)
+
+    table = array('Q', bytes(8 * size))
+    entries = list(zip(masks, magics, shifts, offsets))
+
+    for square, (mask, magic, shift, offset) in enumerate(entries):
+        for occupancy in _subsets(mask):
+            table[offset + (((occupancy * magic) & _U64) >> shift)] = slider_attacks(square, occupancy, directions)
+
+    return entries, table
+
+
+_ROOK_ENTRIES, _ROOK_TABLE = _build_table(_ROOK_MAGICS, STRAIGHT)
+_BISHOP_ENTRIES, _BISHOP_TABLE = _build_table(_BISHOP_MAGICS, DIAGONAL)
+
+
+def rook_attacks(square: int, occupancy: int) -> int:
+    '''Squares attacked by a rook on `square`, first blockers included.'''
+    mask, magic, shift, offset = _ROOK_ENTRIES[square]
+    return _ROOK_TABLE[offset + ((((occupancy & mask) * magic) & _U64) >> shift)]
+
+
+def bishop_attacks(square: int, occupancy: int) -> int:
+    '''Squares attacked by a bishop on `square`, first blockers included.'''
+    mask, magic, shift, offset = _BISHOP_ENTRIES[square]
+    return _BISHOP_TABLE[offset + ((((occupancy & mask) * magic) & _U64) >> shift)]
+
+
+def queen_attacks(square: int, occupancy: int) -> int:
+    '''Squares attacked by a queen on `square`, first blockers included.'''
+    return rook_attacks(square, occupancy) | bishop_attacks(square, occupancy)
@@ -0,0 +1,244 @@
+'''Mailbox backend for `chess.board.Board`.
+
+The 64 squares sit inside a 10x12 grid of one byte cells, a single
+`bytearray` of 120 bytes. The two outer rows at the top and the bottom and
+one column on each side hold OFF_BOARD, so any step or knight jump from a
+real square lands either on a square or on the sentinel, never outside the
+buffer:
+
+    cell = 21 + 10 * (square // 8) + square % 8        a1 = 21, h8 = 98
+
+A cell is EMPTY or the small int code of a piece - the codes `Board.to_bytes`
+packs, white 1-6 and black 7-12. Directions are plain int cell offsets.
+
+`MailboxBoard` keeps the public API of `Board`, `board[rank][file]` reads
+and writes decode and encode the cells.
+
+>>> board = MailboxBoard.standard_configuration()
+>>> board[Rank.ONE][File.E], len(board.cells)
+(White King, 120)
+>>> board.cells[CELLS[Position.from_str('e1').square]]
+6
+'''
+from __future__ import annotations
+
+import itertools
+from typing import Iterator, List, Union
+
+from chess import attacks
+from chess.board import Board, _RankView, square_of, _piece_code, _PIECE_CODES, _CODE_PIECES, _SQUARES
+from chess.constants import Diagonal, Direction
+from chess.constants import FigureColor as Color, FigureType as Type
+from chess.constants import Rank, File
+from chess.movegen import CheckInfo
+from chess.position import Position
+from chess.utils import method_dispatch
+
+EMPTY = 0
+OFF_BOARD = 0xff
+
+CELLS = tuple(21 + 10 * (square >> 3) + (square & 7) for square in range(64))
+CELL_SQUARES = [None] * 120
+for _square, _cell in enumerate(CELLS):
+    CELL_SQUARES[_cell] = _square
+del _square, _cell
+
+_EMPTY_CELLS = bytes(EMPTY if square is not None else OFF_BOARD for square in CELL_SQUARES)
+
+# cell offsets, indexed like the ray directions of `chess.attacks`
+OFFSETS = {
+    attacks.UP: 10,
+    attacks.RIGHT: 1,
+    attacks.UP_RIGHT: 11,
+    attacks.UP_LEFT: 9,
+    attacks.DOWN: -10,
+    attacks.LEFT: -1,
+    attacks.DOWN_LEFT: -11,
+    attacks.DOWN_RIGHT: -9,
+}
+KNIGHT_OFFSETS = (21, 19, 12, 8, -8, -12, -19, -21)
+KING_OFFSETS = tuple(OFFSETS.values())
+# the squares a pawn of the color attacks, enemy pawns attack a square from there
+PAWN_ATTACK_OFFSETS = {
+    Color.WHITE: (9, 11),
+    Color.BLACK: (-9, -11),
+}
+
+_SLIDER_OFFSETS = [
+    (tuple(OFFSETS[direction] for direction in attacks.DIAGONAL), (Type.BISHOP, Type.QUEEN)),
+    (tuple(OFFSETS[direction] for direction in attacks.STRAIGHT), (Type.ROOK, Type.QUEEN)),
+]
+
+_BLACK_CODES = 6  # codes above it are black pieces
+
+
+def _is_black(code: int) -> bool:
+    return code > _BLACK_CODES
+
+
+def _codes(color: Color, *figure_types: Type):
+    return tuple(_PIECE_CODES[(color, figure_type)] for figure_type in figure_types)
+
+
+def _enemy(color: Color) -> Color:
+    return Color.BLACK if color is Color.WHITE else Color.WHITE
+
+
+class MailboxBoard(Board):
+    def empty(self) -> bytearray:
+        '''Returns the 120 cells, every real square EMPTY and the rest OFF_BOARD.'''
+        return bytearray(_EMPTY_CELLS)
+
+    @property
+    def cells(self) -> bytes:
+        '''An immutable copy of the cells, cheap to hash and to share.'''
+        return bytes(self._board)
+
+    def __getitem__(self, key: Union[int, Rank, slice]):
+        if isinstance(key, slice):
+            return [self[rank] for rank in range(12)[key]]
+
+        key = int(key)
+        if not 0 <= key < 12:
+            raise IndexError('board index out of range')
+
+        return _RankView(self, key)
+
+    def _put(self, square: int, piece) -> None:
+        cell = CELLS[square]
+        code = _piece_code(piece)
+
+        self._track(square, _CODE_PIECES[self._board[cell]], piece)
+        self._board[cell] = code
+
+    def _piece_at(self, square: int):
+        return _CODE_PIECES[self._board[CELLS[square]]]
+
+    def _rank_pieces(self, rank_index: int) -> Iterator:
+        cell = CELLS[rank_index * 8]
+        return map(_CODE_PIECES.__getitem__, itertools.islice(self._board, cell, cell + 8))
+
+    def _copy_squares(self, board: MailboxBoard) -> bytearray:
+        return bytearray(self._board)
+
+    def is_empty(self, position: Union[Position, int]):
+        square = square_of(position)
+        return square is not None and self._board[CELLS[square]] == EMPTY
+
+    def is_out_of_bounds(self, pos: Union[Position, int]):
+        return square_of(pos) is None
+
+    @method_dispatch
+    def are_enemies(self, pos1, pos2):  # pragma: no cover
+        pass
+
+    @are_enemies.register(Position)
+    @are_enemies.register(int)
+    def _(self, pos1: Union[Position, int], pos2: Union[Position, int]) -> bool:
+        square1, square2 = square_of(pos1), square_of(pos2)
+
+        if square1 is None or square2 is None:
+            return False
+
+        code1, code2 = self._board[CELLS[square1]], self._board[CELLS[square2]]
+        return bool(code1 and code2 and _is_black(code1) != _is_black(code2))
+
+    @are_enemies.register
+    def _(self, color: Color, pos2: Union[Position, int]) -> bool:
+        square = square_of(pos2)
+
+        if square is None:
+            return False
+
+        code = self._board[CELLS[square]]
+        return bool(code and _is_black(code) != (color is Color.BLACK))
+
+    def get_moves_in_direction(
+            self,
+            start_pos: Position,
+            *directions: Union[Direction, Diagonal, int]
+    ) -> List[Position]:
+        cells = self._board
+        start = CELLS[start_pos.square]
+        code = cells[start]
+        moves = []
+
+        for direction in directions:
+            if type(direction) is not int:
+                direction = attacks.DIRECTION_INDEX[direction]
+
+            offset = OFFSETS[direction]
+            cell = start + offset
+
+            while cells[cell] == EMPTY:
+                moves.append(_SQUARES[CELL_SQUARES[cell]])
+                cell += offset
+
+            target = cells[cell]
+            if target != OFF_BOARD and code and _is_black(target) != _is_black(code):
+                moves.append(_SQUARES[CELL_SQUARES[cell]])
+
+        return moves
+
+    def _get_leaper_attackers(self, square: int, color: Color) -> Iterator[Position]:
+        cells = self._board
+        start = CELLS[square]
+        knight, king, pawn = _codes(_enemy(color), Type.KNIGHT, Type.KING, Type.PAWN)
+
+        leapers = [
+            (KNIGHT_OFFSETS, knight),
+            (KING_OFFSETS, king),
+            (PAWN_ATTACK_OFFSETS[color], pawn),
+        ]
+
+        for offsets, code in leapers:
+            for offset in offsets:
+                if cells[start + offset] == code:
+                    yield _SQUARES[CELL_SQUARES[start + offset]]
+
+    def _compute_check_info(self, color: Color) -> CheckInfo:
+        king_pos = self.kings[color]
+        if king_pos is None:
+            return CheckInfo(king_pos)
+
+        square = king_pos.square
+        checks = [
+            (attacker.square, 1 << attacker.square)
+            for attacker in self._get_leaper_attackers(square, color)
+        ]
+        pins = {}
+
+        cells = self._board
+        start = CELLS[square]
+        black = color is Color.BLACK
+
+        for offsets, figure_types in _SLIDER_OFFSETS:
+            sliders = _codes(_enemy(color), *figure_types)
+
+            for offset in offsets:
+                line, shield = 0, None
+                cell = start + offset
+
+                while cells[cell] != OFF_BOARD:
+                    ray_square = CELL_SQUARES[cell]
+                    line |= 1 << ray_square
+                    code = cells[cell]
+                    cell += offset
+
+                    if code == EMPTY:
+                        continue
+
+                    if _is_black(code) == black:
+                        if shield is not None:
+                            break
+                        shield = ray_square
+                        continue
+
+                    if code in sliders:
+                        if shield is None:
+                            checks.append((ray_square, line))
+                        else:
+                            pins[shield] = line
+                    break
+
+        return CheckInfo.from_checks(king_pos, checks, pins)
@@ -0,0 +1,127 @@
+'''Moves packed in 16 bits.
+
+    bits  0-5   from square (a1 = 0, ..., h8 = 63)
+    bits  6-11  to square
+    bits 12-15  flags
+
+The flags tell what kind of move it is, promotions carry the new piece:
+
+    0  quiet              4  capture
+    1  double pawn push   5  en passant capture
+    2  king side castle   8-11   promotion to knight, bishop, rook, queen
+    3  queen side castle  12-15  promotion with a capture
+
+`Move` is an int, so moves are cheap to store, hash and compare, and it
+unpacks into its two positions.
+
+>>> move = Move.encode(Position.from_str('e7').square, Position.from_str('f8').square, CAPTURE)
+>>> move.with_promotion(FigureType.KNIGHT)
+Move(E7F8=N)
+>>> from_pos, to_pos = move
+>>> from_pos, to_pos, move.is_capture, str(move.with_promotion(FigureType.QUEEN))
+(E7, F8, True, 'e7f8q')
+'''
+from __future__ import annotations
+
+from typing import Iterator, Optional
+
+from chess.constants import FigureType
+from chess.position import Position
+
+QUIET = 0
+DOUBLE_PUSH = 1
+KING_CASTLE = 2
+QUEEN_CASTLE = 3
+CAPTURE = 4
+EN_PASSANT = 5
+PROMOTION = 8
+
+PROMOTION_TYPES = (FigureType.KNIGHT, FigureType.BISHOP, FigureType.ROOK, FigureType.QUEEN)
+
+_PROMOTION_CODES = {figure_type: code for code, figure_type in enumerate(PROMOTION_TYPES)}
+_PROMOTION_LETTERS = {
+    FigureType.KNIGHT: 'n',
+    FigureType.BISHOP: 'b',
+    FigureType.ROOK: 'r',
+    FigureType.QUEEN: 'q',
+}
+
+
+class Move(int):
+    __slots__ = ()
+
+    @classmethod
+    def encode(cls, from_square: int, to_square: int, flags: int = QUIET) -> Move:
+        return cls(from_square | to_square << 6 | flags << 12)
+
+    @property
+    def from_square(self) -> int:
+        return self & 63
+
+    @property
+    def to_square(self) -> int:
+        return self >> 6 & 63
+
+    @property
+    def flags(self) -> int:
+        return self >> 12
+
+    @property
+    def from_pos(self) -> Position:
+        return Position.from_square(self & 63)
+
+    @property
+    def to_pos(self) -> Position:
+        return Position.from_square(self >> 6 & 63)
+
+    @property
+    def is_capture(self) -> bool:
+        return bool(self >> 12 & CAPTURE)
+
+    @property
+    def is_en_passant(self) -> bool:
+        return self >> 12 == EN_PASSANT
+
+    @property
+    def is_double_push(self) -> bool:
+        return self >> 12 == DOUBLE_PUSH
+
+    @property
+    def is_castling(self) -> bool:
+        return self >> 12 in (KING_CASTLE, QUEEN_CASTLE)
+
+    @property
+    def is_promotion(self) -> bool:
+        return bool(self >> 12 & PROMOTION)
+
+    @property
+    def promotion(self) -> Optional[FigureType]:
+        '''The type of the new piece, None if the move is not a promotion.'''
+        if not self >> 12 & PROMOTION:
+            return None
+
+        return PROMOTION_TYPES[self >> 12 & 3]
+
+    def with_promotion(self, figure_type: FigureType) -> Move:
+        '''The same move promoting to `figure_type`.'''
+        flags = (self >> 12 & CAPTURE) | PROMOTION | _PROMOTION_CODES[figure_type]
+        return Move(self & 0xfff | flags << 12)
+
+    def __iter__(self) -> Iterator[Position]:
+        yield self.from_pos
+        yield self.to_pos
+
+    def __str__(self):
+        '''The move in UCI notation.
+
+        >>> str(Move.encode(12, 28, DOUBLE_PUSH))
+        'e2e4'
+        '''
+        promotion = self.promotion
+        suffix = _PROMOTION_LETTERS[promotion] if promotion else ''
+        return f'{str(self.from_pos).lower()}{str(self.to_pos).lower()}{suffix}'
+
+    def __repr__(self):
+        promotion = self.promotion
+        suffix = f'={_PROMOTION_LETTERS[promotion].upper()}' if promotion else ''
+        return f'{self.__class__.__name__}({self.from_pos}{self.to_pos}{suffix})'
@@ -0,0 +1,145 @@
+'''Legal move filtering.
+
+Instead of probing the king after every candidate move, the position is
+inspected once per side to move - from the king outwards - and summarized
+in a `CheckInfo`:
+
+    checkers - the enemy pieces giving check
+    evasions - the squares a non-king move must land on, every square when
+               not in check, the checker and the squares between it and the
+               king when in single check, none when in double check
+    pins     - for every pinned piece the line it may still move along,
+               the pinning piece included
+
+Squares are bit masks in the layout of `chess.attacks` (a1 = bit 0).
+
+>>> info = CheckInfo(king=None)
+>>> info.allowed(12) == ALL_SQUARES
+True
+
+Whole move lists are collected in a `MoveList`, a flat array of packed
+moves that can be cleared and refilled instead of reallocated.
+
+>>> moves = MoveList()
+>>> moves.append(Move.encode(12, 28, DOUBLE_PUSH))
+>>> list(moves), (Position.from_str('e2'), Position.from_str('e4')) in moves
+([Move(E2E4)], True)
+'''
+import functools
+from array import array
+from typing import Dict, Iterator, List, Tuple, Union
+
+from chess.constants import FigureType
+from chess.move import Move, DOUBLE_PUSH
+from chess.position import Position
+
+ALL_SQUARES = (1 << 64) - 1
+
+
+class CheckInfo:
+    __slots__ = ('king', 'checkers', 'evasions', 'pins')
+
+    def __init__(self, king, checkers: int = 0, evasions: int = ALL_SQUARES, pins: dict = None):
+        self.king = king
+        self.checkers = checkers
+        self.evasions = evasions
+        self.pins = pins or {}
+
+    @classmethod
+    def from_checks(cls, king, checks: List[Tuple[int, int]], pins: Dict[int, int]):
+        '''`checks` pairs every checker square with its line, the checker and the squares between it and the king.'''
+        checkers = 0
+        for checker, _ in checks:
+            checkers |= 1 << checker
+
+        if not checks:
+            evasions = ALL_SQUARES
+        elif len(checks) == 1:
+            evasions = checks[0][1]
+        else:
+            evasions = 0
+
+        return cls(king, checkers, evasions, pins)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(king={self.king}, checkers={self.checkers:#x}, pins={sorted(self.pins)})'
+
+    @property
+    def in_check(self) -> bool:
+        return bool(self.checkers)
+
+    def allowed(self, square: int) -> int:
+        '''The squares the piece standing on `square` may move to without exposing its king.'''
+        return self.evasions & self.pins.get(square, ALL_SQUARES)
+
+
+def legal_moves_only(generate_moves):
+    '''Drops the moves that would leave the king of the moving piece in check.
+
+    Meant for every piece but the king, whose moves are checked square by square.
+    '''
+    @functools.wraps(generate_moves)
+    def wrapper(self, board, pos):
+        moves = generate_moves(self, board, pos)
+        allowed = board.check_info(self.color).allowed(pos.square)
+        en_passant = board.en_passant_pos
+
+        if self.figure_type is FigureType.PAWN and en_passant in moves:
+            # en passant may take the checker or uncover the king along the rank, the board replays it
+            legal = [move for move in moves if move != en_passant and allowed >> move.square & 1]
+
+            if board.is_legal_en_passant(pos.square, en_passant.square):
+                legal.append(en_passant)
+
+            return legal
+
+        if allowed == ALL_SQUARES:
+            return moves
+
+        return [move for move in moves if allowed >> move.square & 1]
+
+    return wrapper
+
+
+class MoveList:
+    '''Moves kept as their 16 bit encoding in an array of unsigned shorts.
+
+    Iterating yields `Move`s, which unpack into (from_pos, to_pos).
+    '''
+    __slots__ = ('_moves',)
+
+    def __init__(self):
+        self._moves = array('H')
+
+    def append(self, move: Move) -> None:
+        self._moves.append(move)
+
+    def clear(self) -> None:
+        del self._moves[:]
+
+    def __len__(self):
+        return len(self._moves)
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[Move, 'MoveList']:
+        '''A slice is a new `MoveList` with its own storage.'''
+        if isinstance(idx, slice):
+            moves = self.__class__()
+            moves._moves = self._moves[idx]
+            return moves
+
+        return Move(self._moves[idx])
+
+    def __iter__(self) -> Iterator[Move]:
+        return map(Move, self._moves)
+
+    def __contains__(self, move) -> bool:
+        '''Accepts a `Move` or a (from_pos, to_pos) pair, which matches any flags.'''
+        if isinstance(move, int):
+            return move in self._moves
+
+        from_pos, to_pos = move
+        key = from_pos.square | to_pos.square << 6
+        return any(encoded & 0xfff == key for encoded in self._moves)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({list(self)})'
@@ -8,12 +8,41 @@ from chess.constants import FigureColor, FigureType, Rank, File
 
 
 class ChessPiece(ABC):
-    def __init__(
-        self,
-        color: types.FigureColor,
-    ) -> ChessPiece:
-        self.type = self.figure_type
-        self.color = color
+    '''Pieces are stateless flyweights, there is exactly one per class and color.
+
+    >>> from chess.pieces import Rook
+    >>> Rook(FigureColor.WHITE) is Rook(FigureColor.WHITE)
+    True
+
+    Every subclass must declare `__slots__` too, so pieces carry no `__dict__`.
+    '''
+    __slots__ = ('type', 'color')
+
+    _instances = {}
+
+    def __new__(cls, color: types.FigureColor) -> ChessPiece:
+        piece = ChessPiece._instances.get((cls, color))
+
+        if piece is None:
+            piece = super().__new__(cls)
+            object.__setattr__(piece, 'type', cls.figure_type)
+            object.__setattr__(piece, 'color', color)
+
+            ChessPiece._instances[cls, color] = piece
+
+        return piece
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return self.__class__, (self.color,)
 
     def __repr__(self):
         color = self.color.name.capitalize()
@@ -1,17 +1,14 @@
-import functools as fp
 from typing import List
 
+from chess import attacks
 from chess.pieces.base import ChessPiece
-from chess.constants import (
-    FigureType, Direction, FigureColor, Rank
-)
+from chess.constants import FigureType, FigureColor, Rank
 from chess.position import Position
-from chess.utils import prune_moves_if_king_in_check
-
-from functional import seq
+from chess.movegen import legal_moves_only
 
 
 class Pawn(ChessPiece):
+    __slots__ = ()
     figure_type = FigureType.PAWN
 
     @property
@@ -22,46 +19,23 @@ class Pawn(ChessPiece):
         starting_rank = Rank.TWO if self.is_white else Rank.SEVEN
         return position.rank == starting_rank
 
-    def get_possible_positions(self, position):
-        rank, file = position.rank, position.file
-        forward = Direction.UP if self.is_white else Direction.DOWN
-
-        return {
-            'one_forward': Position(rank + forward, file),
-            'two_forward': Position(rank + 2 * forward, file),
-            'attack_right': Position(rank + forward, file + Direction.RIGHT),
-            'attack_left': Position(rank + forward, file + Direction.LEFT),
-        }
-
     # NOTE: ideally this should be static or class method but it isnt
     # because of is_white check
-    @prune_moves_if_king_in_check
+    @legal_moves_only
     def generate_moves(self, board, pawn_pos: Position) -> List[Position]:
-        potential_positions = self.get_possible_positions(pawn_pos)
-
-        left_attack  = potential_positions['attack_left']
-        right_attack = potential_positions['attack_right']
-        one_forward  = potential_positions['one_forward']
-        two_forward  = potential_positions['two_forward']
-
         positions = []
 
-        if board.is_in_bounds(one_forward) and board.is_empty(one_forward):
-            positions.append(one_forward)
-
-        if self.is_at_starting_pos(pawn_pos) and board.is_empty(two_forward):
-            positions.append(two_forward)
+        for push in attacks.PAWN_PUSHES[self.color][pawn_pos.square]:
+            if not board.is_empty(push):
+                break
+            positions.append(push)
 
-        can_attack = fp.partial(self._can_attack, board, pawn_pos)
+        en_passant_rank = Rank.SIX if self.is_white else Rank.THREE
 
-        if can_attack(left_attack):
-            positions.append(left_attack)
-
-        if can_attack(right_attack):
-            positions.append(right_attack)
+        for attack in attacks.PAWN_TARGETS[self.color][pawn_pos.square]:
+            if board.are_enemies(pawn_pos, attack):
+                positions.append(attack)
+            elif attack == board.en_passant_pos and attack.rank == en_passant_rank:
+                positions.append(attack)
 
         return positions
-
-    @staticmethod
-    def _can_attack(board, from_pos, attack_pos):
-        return board.is_in_bounds(attack_pos) and board.are_enemies(from_pos, attack_pos) or board.en_passant_pos == attack_pos
@@ -2,12 +2,13 @@ from chess.pieces.base import ChessPiece
 from chess.constants import FigureType, Direction
 from chess.position import Position
 from chess.pieces.slider_mixin import PieceSliderMixin
-from chess.utils import prune_moves_if_king_in_check
+from chess.movegen import legal_moves_only
 
 
 class Rook(PieceSliderMixin, ChessPiece):
+    __slots__ = ()
     figure_type = FigureType.ROOK
 
-    @prune_moves_if_king_in_check
+    @legal_moves_only
     def generate_moves(self, board, rook_position: Position = None):
         return super().generate_straight_moves(board, rook_position)
@@ -1,3 +1,5 @@
+from operator import index
+
 from chess.constants import Rank, File, Direction, Diagonal
 
 
@@ -7,45 +9,68 @@ class Position:
     >>> Position(Rank.ONE, File.A)
     A1
 
+    Positions are immutable flyweights, every square of the padded 12x12 board
+    has exactly one instance, so constructing one is a table lookup.
+
+    >>> Position(Rank.ONE, File.A) is Position.from_str('a1')
+    True
+
+    >>> Position(rank=Rank.ONE, file=File.H).file.name
+    'H'
+
+    On board positions carry their square index, a1 = 0, b1 = 1, ..., h8 = 63.
+    It is None for positions on the padding.
+
+    >>> Position.from_str('h8').square
+    63
+
     """
 
-    def __init__(self, rank, file):
-        self.rank = rank
-        self.file = file
+    __slots__ = ('rank', 'file', 'square', '_hash')
 
-    @property
-    def rank(self):
-        """Returns the rank of position.
+    def __new__(cls, rank, file):
+        # int() too, index() of an IntEnum member is the member itself before Python 3.10
+        rank_i, file_i = int(index(rank)), int(index(file))
 
-        >>> Position(rank=Rank.ONE, file=File.A).rank.name
-        'ONE'
+        if 0 <= rank_i < 12 and 0 <= file_i < 12:
+            return _GRID[rank_i][file_i]
 
-        """
-        return self._rank
+        return cls._make(rank_i, file_i)
 
-    @property
-    def file(self):
-        """Return the file of the position.
+    @classmethod
+    def _make(cls, rank: int, file: int):
+        position = object.__new__(cls)
+
+        is_rank, is_file = 2 <= rank <= 9, 2 <= file <= 9
 
-        >>> Position(rank=Rank.ONE, file=File.H).file.name
-        'H'
+        object.__setattr__(position, 'rank', Rank(rank) if is_rank else rank)
+        object.__setattr__(position, 'file', File(file) if is_file else file)
+        object.__setattr__(position, 'square', (9 - rank) * 8 + file - 2 if is_rank and is_file else None)
+        object.__setattr__(position, '_hash', rank * 12 + file)
+
+        return position
+
+    @classmethod
+    def from_square(cls, square: int):
+        """Returns the position of a square index.
+
+        >>> Position.from_square(0), Position.from_square(63)
+        (A1, H8)
 
         """
-        return self._file
+        return _SQUARES[square]
 
-    @rank.setter
-    def rank(self, value):
-        try:
-            self._rank = Rank(value)
-        except ValueError:
-            self._rank = value
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
 
-    @file.setter
-    def file(self, value):
-        try:
-            self._file = File(value)
-        except ValueError:
-            self._file = value
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return self.__class__, (int(self.rank), int(self.file))
 
     def __eq__(self, other):
         """ If a file & rank are equal returns True
@@ -54,9 +79,11 @@ class Position:
         True
 
         """
-        if not isinstance(other, self.__class__):
+        if self is other:
+            return True
+        if not isinstance(other, Position):
             return False
-        return self.rank == other.rank and self.file == other.file
+        return self._hash == other._hash and int(self.rank) == int(other.rank)
 
     def __str__(self):
         """
@@ -78,7 +105,7 @@ class Position:
         True
 
         """
-        return hash(f'{self.rank}{self.file}')
+        return self._hash
 
     @classmethod
     def from_str(cls, string: str):
@@ -107,6 +134,10 @@ class Position:
 
         """
 
+        position = _BY_NAME.get(string)
+        if position is not None:
+            return position
+
         assert len(string) == 2, f'"{string}" is not a valid {cls.__name__}'
         assert string[0].lower() in 'abcdefgh', f'"{string[0].lower()}" not in "abcdefgh"'
         assert string[1].lower() in '12345678', f'"{string[1].lower()}" not in "12345678"'
@@ -188,3 +219,12 @@ class Position:
             return self.file.to_coordinate
 
         raise IndexError('index out of range, supported indeces are 0 and 1')
+
+
+_GRID = [[Position._make(rank, file) for file in range(12)] for rank in range(12)]
+_SQUARES = [_GRID[9 - square // 8][2 + square % 8] for square in range(64)]
+_BY_NAME = {
+    name: position
+    for position in _SQUARES
+    for name in (str(position), str(position).lower())
+}
@@ -0,0 +1,54 @@
+'''Immutable positions taken off a live `Board`.
+
+A `Snapshot` is a plain named tuple - the zobrist key, the pieces as eight
+tuples of eight, one per rank, and the rest of the state. Nothing in it
+can change, so it can be handed to other threads, kept in sets and dicts,
+compared and hashed while the board it came from keeps moving.
+
+`Board.snapshot()` rebuilds only the ranks written since its previous
+snapshot and reuses the tuples of the others, consecutive snapshots of a
+game share most of their storage. Back to a playable board with
+`Board.from_snapshot`.
+
+>>> from chess.board import Board
+>>> board = Board.standard_configuration()
+>>> before = board.snapshot()
+>>> board.push((Position.from_str('e2'), Position.from_str('e4')))
+>>> after = board.snapshot()
+>>> before.piece_at(Position.from_str('e2')), after.piece_at(Position.from_str('e2'))
+(White Pawn, None)
+>>> after.ranks[7] is before.ranks[7], after.ranks[1] is before.ranks[1]
+(True, False)
+'''
+from __future__ import annotations
+
+from typing import NamedTuple, Optional, Tuple, Union
+
+from chess.constants import CastlingPerm
+from chess.constants import FigureColor as Color
+from chess.position import Position
+
+
+class Snapshot(NamedTuple):
+    # first, so that different positions compare unequal on the first field
+    zobrist_key: int
+    # ranks[square >> 3][square & 7], rank 1 and file a first
+    ranks: Tuple[Tuple[Optional['ChessPiece'], ...], ...]  # noqa: F821
+    player: Color
+    # of white and of black
+    castling_perms: Tuple[CastlingPerm, CastlingPerm]
+    en_passant_pos: Optional[Position]
+    half_move: int
+    full_move: int
+
+    def __hash__(self):
+        return self.zobrist_key
+
+    def piece_at(self, position: Union[Position, int]) -> Optional['ChessPiece']:  # noqa: F821
+        square = position if type(position) is int else position.square
+        return self.ranks[square >> 3][square & 7]
+
+    @property
+    def projection(self) -> Tuple[Tuple[Optional['ChessPiece'], ...], ...]:  # noqa: F821
+        '''The ranks the way `Board.projection` lays them out, rank 8 first.'''
+        return self.ranks[::-1]
@@ -0,0 +1,185 @@
+'''A fixed size transposition table.
+
+The table is one preallocated `array('Q')`, sized in megabytes, and never
+grows. Every entry is packed in a single 64-bit word:
+
+    bits  0-15  verification, the top 16 bits of the zobrist key
+    bits 16-31  best move, a 16 bit `chess.move.Move`, 0 when there is none
+    bits 32-47  score, stored with an offset of 2**15
+    bits 48-55  depth
+    bits 56-57  bound, an all zero word is an empty slot
+    bits 58-63  age, the search generation the entry was written in
+
+Entries are grouped in buckets of four, the bucket is picked by the low
+bits of the key. Which entry of a full bucket is overwritten is decided by
+the replacement policy.
+
+>>> tt = TranspositionTable(size_mb=1)
+>>> tt.store(0x1234_5678_9abc_def0, depth=6, bound=Bound.EXACT, score=-35)
+>>> tt.probe(0x1234_5678_9abc_def0)
+TTEntry(depth=6, bound=<Bound.EXACT: 3>, score=-35, move=None)
+>>> tt.probe(0x4321_5678_9abc_def0) is None
+True
+'''
+from array import array
+from enum import Enum, IntEnum
+from typing import NamedTuple, Optional
+
+from chess.move import Move
+
+BUCKET_SIZE = 4
+ENTRY_BYTES = 8
+
+_SCORE_OFFSET = 1 << 15
+_AGES = 64
+
+
+class Bound(IntEnum):
+    LOWER = 1
+    UPPER = 2
+    EXACT = 3
+
+
+class Replacement(Enum):
+    '''How entries are replaced.
+
+    DEPTH_PREFERRED - a full bucket gives up its shallowest entry, entries of older
+                      searches count as shallower; an entry of the same position from
+                      the current search is only replaced by an as deep or an exact one
+    ALWAYS          - depth is ignored, a full bucket gives up an entry of its oldest
+                      search (the first one on a tie) and the same position is always updated
+    '''
+    DEPTH_PREFERRED = 1
+    ALWAYS = 2
+
+
+class TTEntry(NamedTuple):
+    depth: int
+    bound: Bound
+    score: int
+    move: Optional[Move]
+
+
+def _pack(check: int, move: int, score: int, depth: int, bound: int, age: int) -> int:
+    return check | move << 16 | (score + _SCORE_OFFSET) << 32 | depth << 48 | bound << 56 | age << 58
+
+
+class TranspositionTable:
+    def __init__(self, size_mb: float = 16, replacement: Replacement = Replacement.DEPTH_PREFERRED):
+        buckets = int(size_mb * 2 ** 20) // (ENTRY_BYTES * BUCKET_SIZE)
+        if buckets < 1:
+            raise ValueError(f'a table of {size_mb} MB cannot hold a single bucket')
+
+        self.replacement = replacement
+        self._buckets = buckets
+        self._entries = array('Q', bytes(buckets * BUCKET_SIZE * ENTRY_BYTES))
+        self._age = 0
+        self._filled = 0
+
+        self.probes = self.hits = self.stores = self.overwrites = self.rejected = 0
+
+    def __len__(self):
+        '''The number of filled slots.'''
+        return self._filled
+
+    @property
+    def capacity(self) -> int:
+        '''The number of slots, filled or not.'''
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._entries) * self._entries.itemsize
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.probes if self.probes else 0.0
+
+    def new_search(self) -> None:
+        '''Starts a new generation, the entries of earlier searches become the first to be replaced.'''
+        self._age = (self._age + 1) % _AGES
+
+    def clear(self) -> None:
+        self._entries = array('Q', bytes(len(self._entries) * ENTRY_BYTES))
+        self._age = 0
+        self._filled = 0
+        self.probes = self.hits = self.stores = self.overwrites = self.rejected = 0
+
+    def _bucket(self, key: int) -> int:
+        return (key % self._buckets) * BUCKET_SIZE
+
+    def probe(self, key: int) -> Optional[TTEntry]:
+        '''The entry stored for the position with `key`, None on a miss.'''
+        self.probes += 1
+
+        check = key >> 48 & 0xffff
+        entries = self._entries
+        start = self._bucket(key)
+
+        for slot in range(start, start + BUCKET_SIZE):
+            entry = entries[slot]
+
+            if entry >> 56 & 3 and entry & 0xffff == check:
+                self.hits += 1
+                move = entry >> 16 & 0xffff
+
+                return TTEntry(
+                    depth=entry >> 48 & 0xff,
+                    bound=Bound(entry >> 56 & 3),
+                    score=(entry >> 32 & 0xffff) - _SCORE_OFFSET,
+                    move=Move(move) if move else None,
+                )
+
+        return None
+
+    def store(self, key: int, depth: int, bound: Bound, score: int, move: Optional[Move] = None) -> None:
+        if not -_SCORE_OFFSET <= score < _SCORE_OFFSET:
+            raise ValueError(f'score {score} does not fit in 16 bits')
+        if not 0 <= depth < 256:
+            raise ValueError(f'depth {depth} does not fit in 8 bits')
+
+        check = key >> 48 & 0xffff
+        entries = self._entries
+        start = self._bucket(key)
+        victim, victim_rank = start, None
+
+        for slot in range(start, start + BUCKET_SIZE):
+            entry = entries[slot]
+
+            if not entry >> 56 & 3:
+                victim = slot
+                break
+
+            if entry & 0xffff == check:
+                if self.replacement is Replacement.DEPTH_PREFERRED and entry >> 58 == self._age and \
+                        (entry >> 48 & 0xff) > depth and bound is not Bound.EXACT:
+                    self.rejected += 1
+                    return
+
+                victim = slot
+                break
+
+            rank = self._replacement_rank(entry)
+            if victim_rank is None or rank < victim_rank:
+                victim, victim_rank = slot, rank
+        else:
+            self.overwrites += 1
+
+        self.stores += 1
+
+        old = entries[victim]
+        if not old >> 56 & 3:
+            self._filled += 1
+        if move is None and old & 0xffff == check:
+            move = old >> 16 & 0xffff  # keep the best move of a shallower search
+
+        entries[victim] = _pack(check, move or 0, score, depth, int(bound), self._age)
+
+    def _replacement_rank(self, entry: int) -> int:
+        '''Lower ranks are replaced first.'''
+        staleness = (self._age - (entry >> 58)) % _AGES
+
+        if self.replacement is Replacement.ALWAYS:
+            return -staleness
+
+        return (entry >> 48 & 0xff) - 4 * staleness
@@ -0,0 +1,85 @@
+'''Zobrist keys.
+
+A position's key is the XOR of one random 64-bit number per
+(color, piece type, square) that is occupied, plus one for the castling
+rights of each color, one for the file of the en passant square and one
+when black is to move. Each part can be XORed in and out as the board
+changes, so `Board.zobrist_key` is kept up to date move by move.
+
+The numbers come from a seeded generator, keys are stable across runs.
+
+>>> from chess.board import Board
+>>> board = Board.standard_configuration()
+>>> board.zobrist_key == board_key(board)
+True
+'''
+import random
+from typing import Optional
+
+from chess.constants import CastlingPerm
+from chess.constants import FigureColor as Color, FigureType as Type
+from chess.pieces import King, Queen, Rook, Bishop, Knight, Pawn
+from chess.position import Position
+
+_rng = random.Random(0x2b992ddfa23249d6)
+
+PIECES = {
+    (color, figure_type): tuple(_rng.getrandbits(64) for _ in range(64))
+    for color in Color
+    for figure_type in Type if figure_type is not Type.NONE
+}
+
+# the same keys per piece, pieces being flyweights there are twelve of them
+PIECE_KEYS = {
+    piece_cls(color): PIECES[color, piece_cls.figure_type]
+    for color in Color
+    for piece_cls in (King, Queen, Rook, Bishop, Knight, Pawn)
+}
+
+# indexed by the CastlingPerm value, having no rights adds nothing
+CASTLING = {
+    color: (0,) + tuple(_rng.getrandbits(64) for _ in range(CastlingPerm.ALL))
+    for color in Color
+}
+
+EN_PASSANT_FILES = tuple(_rng.getrandbits(64) for _ in range(8))
+
+BLACK_TO_MOVE = _rng.getrandbits(64)
+
+del _rng
+
+
+def piece_key(piece, square: int) -> int:
+    '''The key of `piece` standing on `square`, 0 for an empty square or anything that is not a piece.'''
+    keys = PIECE_KEYS.get(piece)
+    return keys[square] if keys is not None else 0
+
+
+def en_passant_key(position: Optional[Position]) -> int:
+    if position is None or position.square is None:
+        return 0
+
+    return EN_PASSANT_FILES[position.square & 7]
+
+
+def castling_key(color: Color, perms: CastlingPerm) -> int:
+    return CASTLING[color][perms]
+
+
+def board_key(board) -> int:
+    '''Computes the key of a board from scratch, the incremental key must always equal it.'''
+    key = 0
+
+    for square in range(64):
+        position = Position.from_square(square)
+        key ^= piece_key(board[position.rank][position.file], square)
+
+    for color, perms in board.castling_perms.items():
+        key ^= castling_key(color, perms)
+
+    key ^= en_passant_key(board.en_passant_pos)
+
+    if board.player is Color.BLACK:
+        key ^= BLACK_TO_MOVE
+
+    return key
@@ -3,7 +3,7 @@ import unittest
 from chess.pieces import King, Rook
 from chess.board import Board
 from chess.position import Position
-from chess.constants import Rank, File
+from chess.constants import CastlingPerm, Rank, File
 from chess.constants import FigureColor as Color
 
 from tests import MoveGenerationTestCase
@@ -497,4 +497,57 @@ class Castling(MoveGenerationTestCase):
             self.assertIn(P('c1'), white_king.generate_moves(board, P('e1')))
 
             board.move(from_pos=P('e1'), to_pos=P('c1'))
-            self.assertIsInstance(board[Rank.ONE][File.D], Rook)  # rook has moved
\ No newline at end of file
+            self.assertIsInstance(board[Rank.ONE][File.D], Rook)  # rook has moved
+
+
+class CastlingRightsTests(unittest.TestCase):
+    def perms(self, board):
+        return board.castling_perms[Color.WHITE], board.castling_perms[Color.BLACK]
+
+    def test_moves_from_and_to_the_home_squares(self):
+        fen = 'r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1'
+        cases = [
+            ('a1', 'a5', (CastlingPerm.KING_SIDE, CastlingPerm.ALL)),
+            ('h1', 'h8', (CastlingPerm.QUEEN_SIDE, CastlingPerm.QUEEN_SIDE)),  # takes the rook
+            ('e1', 'e2', (CastlingPerm.NONE, CastlingPerm.ALL)),
+            ('e1', 'g1', (CastlingPerm.NONE, CastlingPerm.ALL)),
+        ]
+
+        for from_square, to_square, expected in cases:
+            with self.subTest(f'{from_square}{to_square}'):
+                board = Board.from_fen(fen)
+                board.move(from_pos=P(from_square), to_pos=P(to_square))
+
+                self.assertEqual(self.perms(board), expected)
+
+    def test_rooks_away_from_home_keep_the_rights(self):
+        board = Board.from_fen('r3k2r/8/8/8/R7/8/8/4K2R w Kkq - 0 1')
+        board.move(from_pos=P('a4'), to_pos=P('a1'))
+
+        self.assertEqual(self.perms(board), (CastlingPerm.KING_SIDE, CastlingPerm.ALL))
+
+    def test_castling_needs_the_king_and_rook_at_home(self):
+        cases = [
+            ('4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1', True, True),
+            ('4k3/8/8/8/8/8/8/R2K3R w KQ - 0 1', False, False),
+            ('4k3/8/8/8/8/8/8/1R2K1R1 w KQ - 0 1', False, False),
+            ('4k3/8/8/8/8/8/8/r3K2r w KQ - 0 1', False, False),
+            ('4k3/8/8/8/8/8/8/RN2K1NR w KQ - 0 1', False, False),
+            ('4k3/8/8/8/8/8/8/R1N1K2R w KQ - 0 1', False, True),
+            ('4k3/8/8/8/8/8/8/R3K2R w - - 0 1', False, False),
+        ]
+
+        for fen, queen_side, king_side in cases:
+            with self.subTest(fen):
+                board = Board.from_fen(fen)
+
+                self.assertEqual(board.is_able_to_castle(Color.WHITE, CastlingPerm.QUEEN_SIDE), queen_side)
+                self.assertEqual(board.is_able_to_castle(Color.WHITE, CastlingPerm.KING_SIDE), king_side)
+
+    def test_only_the_passed_squares_must_be_safe(self):
+        # b1 is attacked, the king does not pass it
+        board = Board.from_fen('1r2k3/8/8/8/8/8/8/R3K3 w Q - 0 1')
+        self.assertTrue(board.is_able_to_castle(Color.WHITE, CastlingPerm.QUEEN_SIDE))
+
+        board = Board.from_fen('2r1k3/8/8/8/8/8/8/R3K3 w Q - 0 1')
+        self.assertFalse(board.is_able_to_castle(Color.WHITE, CastlingPerm.QUEEN_SIDE))
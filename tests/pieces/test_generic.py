@@ -1,8 +1,11 @@
+import copy
+import pickle
 import unittest
 
 from chess.pieces import (
     King, Bishop, Rook, Pawn, Queen, Knight
 )
+from chess.board import Board
 from chess.constants import FigureColor as Color
 
 
@@ -22,3 +25,31 @@ class TestIsEnemy(unittest.TestCase):
                     black.is_enemy(white),
                     msg=f'black {black.type} was not enemy to white {white.type}'
                 )
+
+
+class TestFlyweights(unittest.TestCase):
+    figures = [King, Bishop, Rook, Pawn, Queen, Knight]
+
+    def test_one_instance_per_class_and_color(self):
+        for figure in self.figures:
+            for color in Color:
+                self.assertIs(figure(color), figure(color=color))
+
+        self.assertIsNot(Queen(Color.WHITE), Queen(Color.BLACK))
+        self.assertIsNot(Queen(Color.WHITE), Rook(Color.WHITE))
+
+    def test_pieces_are_immutable_and_have_no_dict(self):
+        for figure in self.figures:
+            piece = figure(Color.WHITE)
+
+            self.assertFalse(hasattr(piece, '__dict__'), msg=f'{piece} has a __dict__')
+            with self.assertRaises(AttributeError):
+                piece.color = Color.BLACK
+
+    def test_copies_share_the_pieces(self):
+        board = Board.standard_configuration()
+        clone = copy.deepcopy(board)
+
+        self.assertIs(clone[2][2], board[2][2])
+        self.assertIs(copy.copy(Pawn(Color.BLACK)), Pawn(Color.BLACK))
+        self.assertIs(pickle.loads(pickle.dumps(Knight(Color.BLACK))), Knight(Color.BLACK))
@@ -314,6 +314,24 @@ class TestPawnMoveGeneration(MoveGenerationTestCase):
                     'black': {Position(Rank.SIX, File.B): {}},
                 }
             },
+            {
+                'name': 'blocked_from_start_should_not_jump_over_the_blocker',
+                'board': Board.from_strings([
+                    # bcdefgh
+                    '........',  # 8
+                    '.p......',  # 7
+                    '.N......',  # 6
+                    '........',  # 5
+                    '........',  # 4
+                    '.n......',  # 3
+                    '.P......',  # 2
+                    '........'   # 1
+                ]),
+                'want': {
+                    'white': {Position(Rank.TWO, File.B): {}},
+                    'black': {Position(Rank.SEVEN, File.B): {}},
+                }
+            },
         ]
         for test_case in test_table:
             self.runMoveGenerationTest(test_case)
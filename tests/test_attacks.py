@@ -0,0 +1,86 @@
+import unittest
+
+from chess import attacks
+from chess.constants import FigureColor as Color
+from chess.position import Position
+
+P = Position.from_str
+
+
+class LeaperTableTests(unittest.TestCase):
+    def test_knight_targets(self):
+        self.assertEqual(set(attacks.KNIGHT_TARGETS[P('a1').square]), {P('b3'), P('c2')})
+        self.assertEqual(
+            set(attacks.KNIGHT_TARGETS[P('d4').square]),
+            {P('c6'), P('e6'), P('f5'), P('f3'), P('e2'), P('c2'), P('b3'), P('b5')}
+        )
+
+    def test_king_targets(self):
+        self.assertEqual(set(attacks.KING_TARGETS[P('h8').square]), {P('g8'), P('g7'), P('h7')})
+        self.assertEqual(len(attacks.KING_TARGETS[P('e4').square]), 8)
+
+    def test_pawn_targets_depend_on_color(self):
+        self.assertEqual(set(attacks.PAWN_TARGETS[Color.WHITE][P('a2').square]), {P('b3')})
+        self.assertEqual(set(attacks.PAWN_TARGETS[Color.BLACK][P('e5').square]), {P('d4'), P('f4')})
+        self.assertEqual(attacks.PAWN_TARGETS[Color.WHITE][P('e8').square], ())
+
+    def test_pawn_pushes(self):
+        self.assertEqual(attacks.PAWN_PUSHES[Color.WHITE][P('c2').square], (P('c3'), P('c4')))
+        self.assertEqual(attacks.PAWN_PUSHES[Color.WHITE][P('c3').square], (P('c4'),))
+        self.assertEqual(attacks.PAWN_PUSHES[Color.BLACK][P('c7').square], (P('c6'), P('c5')))
+        self.assertEqual(attacks.PAWN_PUSHES[Color.BLACK][P('c1').square], ())
+
+    def test_masks_match_targets(self):
+        tables = [
+            (attacks.KNIGHT_ATTACKS, attacks.KNIGHT_TARGETS),
+            (attacks.KING_ATTACKS, attacks.KING_TARGETS),
+            (attacks.PAWN_ATTACKS[Color.WHITE], attacks.PAWN_TARGETS[Color.WHITE]),
+            (attacks.PAWN_ATTACKS[Color.BLACK], attacks.PAWN_TARGETS[Color.BLACK]),
+        ]
+
+        for masks, targets in tables:
+            for square in range(64):
+                self.assertEqual(masks[square], sum(1 << p.square for p in targets[square]))
+
+
+class RayTableTests(unittest.TestCase):
+    def test_rays_are_nearest_first_and_bounds_aware(self):
+        rays = attacks.RAYS[P('c3').square]
+
+        self.assertEqual(rays[attacks.UP], tuple(P(f'c{rank}').square for rank in range(4, 9)))
+        self.assertEqual(rays[attacks.DOWN_LEFT], (P('b2').square, P('a1').square))
+        self.assertEqual(rays[attacks.LEFT], (P('b3').square, P('a3').square))
+        self.assertEqual(attacks.RAYS[P('h8').square][attacks.UP_RIGHT], ())
+
+    def test_every_square_is_covered_once_by_queen_rays(self):
+        for square in range(64):
+            covered = [s for direction in attacks.STRAIGHT + attacks.DIAGONAL for s in attacks.RAYS[square][direction]]
+
+            self.assertEqual(len(covered), len(set(covered)))
+            self.assertNotIn(square, covered)
+
+    def test_ray_masks_match_rays(self):
+        for square in range(64):
+            for direction in range(8):
+                self.assertEqual(
+                    attacks.RAY_ATTACKS[square][direction],
+                    sum(1 << s for s in attacks.RAYS[square][direction])
+                )
+
+
+class SymmetryTableTests(unittest.TestCase):
+    def test_flips_undo_themselves(self):
+        for table in (attacks.FLIP_RANKS, attacks.MIRROR_FILES):
+            self.assertEqual(sorted(table), list(range(64)))
+            self.assertEqual([table[table[square]] for square in range(64)], list(range(64)))
+
+    def test_four_quarter_turns_are_a_full_turn(self):
+        squares = list(range(64))
+        for _ in range(4):
+            squares = [attacks.ROTATE_CLOCKWISE[square] for square in squares]
+
+        self.assertEqual(squares, list(range(64)))
+        self.assertEqual(
+            [Position.from_square(attacks.ROTATE_CLOCKWISE[P(name).square]) for name in ('a1', 'a8', 'h8', 'c2')],
+            [P('a8'), P('h8'), P('h1'), P('b6')],
+        )
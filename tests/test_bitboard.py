@@ -0,0 +1,151 @@
+import random
+import unittest
+
+from chess.bitboard import BitBoard
+from chess.board import Board, OutOfBounds
+from chess.constants import Rank, File, CastlingPerm
+from chess.constants import FigureColor as Color, FigureType as Type
+from chess.pieces import Queen
+from chess.position import Position
+
+P = Position.from_str
+
+FENS = [
+    'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1',
+    'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1',
+    '8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1',
+    'r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1',
+    'rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8',
+    '4k3/8/8/2q5/8/8/3PP3/r3K2R w K - 0 1',
+    'r3k2r/8/8/8/4Q3/8/8/R3K2R b KQkq - 0 1',
+]
+
+
+def all_positions():
+    return [Position(rank, file) for rank in Rank for file in File]
+
+
+class CompatibilityViewTests(unittest.TestCase):
+    def test_padding_is_out_of_bounds(self):
+        board = BitBoard()
+
+        self.assertEqual(len(list(board)), 12)
+        self.assertTrue(all(square is OutOfBounds for square in board[0]))
+        self.assertEqual(board[Rank.ONE][:2], [OutOfBounds, OutOfBounds])
+        self.assertEqual(board[Rank.ONE][2:-2], [None] * 8)
+
+    def test_projection_matches_list_board(self):
+        for fen in FENS:
+            with self.subTest(fen):
+                self.assertEqual(
+                    [[repr(x) for x in row] for row in BitBoard.from_fen(fen).projection],
+                    [[repr(x) for x in row] for row in Board.from_fen(fen).projection],
+                )
+
+    def test_writes_update_the_bitboards(self):
+        board = BitBoard.standard_configuration()
+
+        self.assertEqual(board.pieces_mask(Color.WHITE, Type.PAWN), 0xff00)
+        self.assertEqual(board.pieces_mask(Color.BLACK, Type.KING), 1 << 60)
+        self.assertEqual(board.kings, {Color.WHITE: P('e1'), Color.BLACK: P('e8')})
+
+        board.move(from_pos=P('e2'), to_pos=P('e4'))
+
+        self.assertEqual(board.pieces_mask(Color.WHITE, Type.PAWN), 0xef00 | 1 << 28)
+        self.assertTrue(board.is_empty(P('e2')))
+        self.assertFalse(board.is_empty(P('e4')))
+        self.assertEqual(board.en_passant_pos, P('e3'))
+
+    def test_are_enemies(self):
+        board = BitBoard.standard_configuration()
+
+        self.assertTrue(board.are_enemies(P('a1'), P('a8')))
+        self.assertFalse(board.are_enemies(P('a1'), P('b1')))
+        self.assertFalse(board.are_enemies(P('a1'), P('a4')))
+        self.assertTrue(board.are_enemies(Color.WHITE, P('a7')))
+        self.assertFalse(board.are_enemies(Color.WHITE, P('a2')))
+
+        with self.subTest('square indices'):
+            self.assertTrue(board.are_enemies(0, 56))
+            self.assertFalse(board.are_enemies(0, P('b1')))
+            self.assertTrue(board.are_enemies(Color.BLACK, 0))
+            self.assertTrue(board.is_empty(28))
+            self.assertFalse(board.is_in_bounds(64))
+
+
+class BackendEquivalenceTests(unittest.TestCase):
+    '''BitBoard must answer every query exactly like the list based board.'''
+    backend = BitBoard
+
+    def assertSameBehaviour(self, board, bitboard, msg):
+        for position in all_positions():
+            piece = board[position.rank][position.file]
+
+            if piece is not None:
+                self.assertSetEqual(
+                    set(piece.generate_moves(board, position)),
+                    set(bitboard[position.rank][position.file].generate_moves(bitboard, position)),
+                    msg=f'{msg}: moves of {piece} @ {position}'
+                )
+
+            for color in Color:
+                self.assertSetEqual(
+                    set(board.get_attackers(position, color)),
+                    set(bitboard.get_attackers(position, color)),
+                    msg=f'{msg}: attackers of {position} for {color}'
+                )
+
+        for color in Color:
+            if board.kings[color] is None:
+                continue
+
+            for side in [CastlingPerm.KING_SIDE, CastlingPerm.QUEEN_SIDE]:
+                self.assertEqual(
+                    board.is_able_to_castle(color, side),
+                    bitboard.is_able_to_castle(color, side),
+                    msg=f'{msg}: castling {color} {side}'
+                )
+
+    def test_fen_positions(self):
+        for fen in FENS:
+            with self.subTest(fen):
+                self.assertSameBehaviour(Board.from_fen(fen), self.backend.from_fen(fen), fen)
+
+    def test_random_games(self):
+        rng = random.Random(1234)
+
+        for fen in FENS[:2]:
+            board, bitboard = Board.from_fen(fen), self.backend.from_fen(fen)
+            board.promotion_cb = bitboard.promotion_cb = lambda: Queen
+
+            for ply in range(12):
+                moves = sorted(
+                    (str(position), str(target))
+                    for position in all_positions()
+                    if getattr(board[position.rank][position.file], 'color', None) == board.player
+                    for target in board[position.rank][position.file].generate_moves(board, position)
+                )
+                if not moves:
+                    break
+
+                from_pos, to_pos = map(P, rng.choice(moves))
+                for b in (board, bitboard):
+                    b.move(from_pos=from_pos, to_pos=to_pos)
+                    b.next_turn()
+
+                self.assertSameBehaviour(board, bitboard, f'{fen} after {ply + 1} plies')
+
+    def test_off_board_square_indices(self):
+        fen = '4k2r/8/8/8/8/8/8/4K3 w - - 0 1'
+
+        for board in (Board.from_fen(fen), self.backend.from_fen(fen)):
+            for square in (-1, 64):
+                with self.subTest(f'{type(board).__name__} {square}'):
+                    self.assertTrue(board.is_out_of_bounds(square))
+                    self.assertFalse(board.is_empty(square))
+                    self.assertFalse(board.are_enemies(4, square))
+                    self.assertFalse(board.are_enemies(square, 63))
+                    self.assertFalse(board.are_enemies(Color.WHITE, square))
+
+            self.assertTrue(board.are_enemies(4, 63))
+            self.assertTrue(board.are_enemies(Color.WHITE, 63))
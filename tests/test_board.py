@@ -1,4 +1,6 @@
 import itertools
+import pickle
+import random
 import unittest
 from unittest.mock import (
     MagicMock, patch,
@@ -6,13 +8,22 @@ from unittest.mock import (
     PropertyMock
 )
 
+from chess import attacks, zobrist
+from chess.attack_table import AttackTable
+from chess.bitboard import BitBoard
 from chess.board import Board, OutOfBounds
 from chess.constants import (
+    CastlingPerm,
     Rank, File,
     Direction, Diagonal,
     FigureColor as Color, FigureType as Type
 )
+from chess.magics import slider_attacks
+from chess.move import Move, DOUBLE_PUSH
+from chess.pieces import King, Queen, Rook
 from chess.position import Position
+from tests.test_bitboard import FENS
+from tests.test_utils import BACKENDS, play
 
 P = Position.from_str
 
@@ -352,6 +363,18 @@ class UtilMethods(unittest.TestCase):
                 piece1_mock.color = Color.BLACK
                 self.assertFalse(self.board.are_enemies(Color.BLACK, piece1_pos))
 
+    def test_queries_accept_square_indices(self):
+        board = Board.standard_configuration()
+
+        self.assertTrue(board.is_empty(Position(Rank.FOUR, File.E).square))
+        self.assertFalse(board.is_empty(0))
+        self.assertTrue(board.is_in_bounds(63))
+        self.assertFalse(board.is_in_bounds(64))
+        self.assertTrue(board.are_enemies(0, 63))
+        self.assertTrue(board.are_enemies(0, P('h8')))
+        self.assertFalse(board.are_enemies(P('a1'), 1))
+        self.assertTrue(board.are_enemies(Color.WHITE, 63))
+
     def test_get_attackers_detects_king_attacks(self):
         """The placement of this test must seem off
             The bulk of the use cases are get_attackers are
@@ -378,4 +401,618 @@ class UtilMethods(unittest.TestCase):
 
         with self.subTest('black pawn attacked'):
             attackers = board.get_attackers(P('a8'), Color.BLACK)
-            self.assertEqual([P('a7')], list(attackers))
\ No newline at end of file
+            self.assertEqual([P('a7')], list(attackers))
+
+
+class AttackersOfTests(unittest.TestCase):
+    FENS = [
+        'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1',
+        '8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1',
+        'rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8',
+    ]
+
+    def test_both_colors_in_one_mask(self):
+        board = Board.from_fen('4k3/8/8/8/8/2n5/8/R3K3 w - - 0 1')
+        mask = board.attackers_of(P('d1'))
+
+        self.assertEqual(mask, 1 << P('a1').square | 1 << P('c3').square | 1 << P('e1').square)
+        self.assertEqual(board.attackers_of(P('d1')), board.attackers_of(P('d1').square))
+
+    @staticmethod
+    def reference(board, square):
+        '''Every piece whose own attacks, walked ray by ray, reach `square`.'''
+        reach = {
+            Type.KNIGHT: lambda sq, color: attacks.KNIGHT_ATTACKS[sq],
+            Type.KING: lambda sq, color: attacks.KING_ATTACKS[sq],
+            Type.PAWN: lambda sq, color: attacks.PAWN_ATTACKS[color][sq],
+            Type.BISHOP: lambda sq, color: slider_attacks(sq, board.occupancy, attacks.DIAGONAL),
+            Type.ROOK: lambda sq, color: slider_attacks(sq, board.occupancy, attacks.STRAIGHT),
+            Type.QUEEN: lambda sq, color: slider_attacks(sq, board.occupancy, range(8)),
+        }
+
+        return {
+            position.square
+            for color in Color
+            for position, piece in board._pieces_of(color)
+            if reach[piece.figure_type](position.square, color) >> square & 1
+        }
+
+    def test_matches_a_per_piece_reference(self):
+        for backend in BACKENDS:
+            for fen in self.FENS:
+                board = backend.from_fen(fen)
+
+                for square in range(64):
+                    with self.subTest(f'{backend.__name__} {fen} {square}'):
+                        mask = board.attackers_of(square)
+                        self.assertSetEqual({s for s in range(64) if mask >> s & 1}, self.reference(board, square))
+
+    def test_custom_occupancy(self):
+        rng = random.Random(16)
+
+        for fen in self.FENS:
+            boards = [backend.from_fen(fen) for backend in BACKENDS]
+
+            for _ in range(20):
+                occupancy = boards[0].occupancy & rng.getrandbits(64)
+                square = rng.randrange(64)
+
+                with self.subTest(f'{fen} {square} {occupancy:#x}'):
+                    masks = [board.attackers_of(square, occupancy) for board in boards]
+                    self.assertEqual(masks[0], masks[1])
+                    self.assertEqual(masks[0], masks[2])
+                    self.assertEqual(masks[0] & ~occupancy, 0)
+
+    def test_x_ray_through_a_removed_piece(self):
+        for backend in BACKENDS:
+            with self.subTest(backend.__name__):
+                board = backend.from_fen('3qk3/8/8/8/3r4/8/8/3RK3 w - - 0 1')
+                d1 = 1 << P('d1').square
+
+                self.assertEqual(board.attackers_of(P('d1')), 1 << P('d4').square | 1 << P('e1').square)
+                self.assertEqual(
+                    board.attackers_of(P('d1'), board.occupancy & ~(1 << P('d4').square)) & ~d1,
+                    1 << P('d8').square | 1 << P('e1').square,
+                )
+
+
+class AttackMapTests(unittest.TestCase):
+    def test_matches_attackers_of_every_square(self):
+        for backend in BACKENDS:
+            for fen in AttackersOfTests.FENS:
+                board = backend.from_fen(fen)
+
+                for color in Color:
+                    with self.subTest(f'{backend.__name__} {fen} {color}'):
+                        enemies = board.occupancy ^ board.occupancy_of(color)
+                        without_king = board.occupancy & ~(1 << board.kings[color].square)
+                        expected = {
+                            square for square in range(64)
+                            if board.attackers_of(square, without_king) & enemies
+                        }
+                        attacked = board.attack_map(color)
+
+                        self.assertSetEqual({s for s in range(64) if attacked >> s & 1}, expected)
+
+    def test_king_may_not_step_back_along_a_check(self):
+        for backend in BACKENDS:
+            with self.subTest(backend.__name__):
+                board = backend.from_fen('4k3/8/8/8/8/8/8/r3K3 w - - 0 1')
+                moves = {to_pos for _, to_pos in board.legal_moves()}
+
+                self.assertSetEqual(moves, {P('d2'), P('e2'), P('f2')})
+
+    def test_map_follows_the_position(self):
+        board = Board.from_fen('4k3/8/8/8/8/8/8/4K2R b K - 0 1')
+        before = board.attack_map(Color.BLACK)
+
+        self.assertIs(board.attack_map(Color.BLACK), before)
+        self.assertTrue(board.is_able_to_castle(Color.WHITE, CastlingPerm.KING_SIDE))
+
+        board[Rank.SIX][File.F] = Queen(Color.BLACK)
+
+        self.assertNotEqual(board.attack_map(Color.WHITE), 0)
+        self.assertFalse(board.is_able_to_castle(Color.WHITE, CastlingPerm.KING_SIDE))
+
+
+class AttackTableTests(unittest.TestCase):
+    def assertTableIsCurrent(self, board):
+        self.assertEqual(board._attack_table, AttackTable.of(board))
+
+        reference = board.copy()
+        reference.tracks_attacks = False
+
+        for square in range(64):
+            self.assertEqual(board.attackers_of(square), reference.attackers_of(square))
+        for color in Color:
+            if board.kings[color] is not None:
+                self.assertEqual(board.attack_map(color), reference.attack_map(color))
+
+    def test_follows_random_games(self):
+        rng = random.Random(21)
+
+        for backend in BACKENDS:
+            for fen in AttackersOfTests.FENS:
+                with self.subTest(f'{backend.__name__} {fen}'):
+                    board = backend.from_fen(fen)
+                    board.promotion_cb = lambda: Queen
+                    board.tracks_attacks = True
+
+                    for _ in range(30):
+                        moves = board.legal_moves()
+                        if not moves:
+                            break
+
+                        board.push(moves[rng.randrange(len(moves))])
+                        self.assertTableIsCurrent(board)
+
+                    while board._undo_stack:
+                        board.pop()
+                    self.assertTableIsCurrent(board)
+
+    def test_direct_writes_and_removals(self):
+        board = Board.from_fen('4k3/8/8/8/8/2n5/8/R3K3 w - - 0 1')
+        board.tracks_attacks = True
+
+        board[Rank.ONE][File.C] = Queen(Color.BLACK)
+        self.assertTableIsCurrent(board)
+
+        with board.temporarily_remove_position(P('c1')):
+            self.assertEqual(board.attackers_of(P('f1')), 1 << P('e1').square)
+            self.assertTableIsCurrent(board)
+
+        self.assertTableIsCurrent(board)
+
+    def test_mode_is_optional_and_copied(self):
+        board = Board.standard_configuration()
+        self.assertFalse(board.tracks_attacks)
+
+        board.tracks_attacks = True
+        clone = board.copy()
+        clone.push((P('e2'), P('e4')))
+
+        self.assertTrue(clone.tracks_attacks)
+        self.assertTableIsCurrent(board)
+        self.assertTableIsCurrent(clone)
+
+        board.tracks_attacks = False
+        self.assertIsNone(board._attack_table)
+
+
+class UndoTests(unittest.TestCase):
+    FENS = [
+        'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1',
+        'r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1',
+        '4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1',
+        '1r2k3/P1P5/8/8/8/8/8/4K3 w - - 3 40',
+    ]
+
+    @staticmethod
+    def state(board):
+        return (
+            [[(square.color, square.figure_type) if square else None for square in row] for row in board.projection],
+            dict(board.castling_perms), dict(board.kings), board.en_passant_pos,
+            board.player, board.half_move, board.full_move,
+        )
+
+    def test_push_updates_clocks_and_turn(self):
+        board = Board.standard_configuration()
+
+        board.push((P('g1'), P('f3')))
+        self.assertEqual((board.player, board.half_move, board.full_move), (Color.BLACK, 1, 1))
+
+        board.push((P('e7'), P('e5')))
+        self.assertEqual((board.player, board.half_move, board.full_move), (Color.WHITE, 0, 2))
+        self.assertEqual(board.en_passant_pos, P('e6'))
+
+    def test_plain_int_moves(self):
+        board = Board.from_fen('4k3/8/8/8/8/8/4P3/4K2R w K - 0 1')
+        moves = board.legal_moves()
+        castle = next(index for index, move in enumerate(moves) if move.is_castling)
+        raw = moves._moves[castle]
+
+        self.assertNotIsInstance(raw, Move)
+        board.push(raw)
+        self.assertEqual((board[Rank.ONE][File.G], board[Rank.ONE][File.F]), (King(Color.WHITE), Rook(Color.WHITE)))
+        self.assertEqual(board.player, Color.BLACK)
+
+        board.pop()
+        board.move(int(Move.encode(P('e2').square, P('e4').square, DOUBLE_PUSH)))
+        self.assertEqual(board.en_passant_pos, P('e3'))
+
+    def test_pop_restores_castling_en_passant_and_promotion(self):
+        for backend in BACKENDS:
+            for fen in self.FENS:
+                board = backend.from_fen(fen)
+                board.promotion_cb = lambda: Queen
+                before = self.state(board)
+
+                for move in board.legal_moves():
+                    with self.subTest(f'{backend.__name__} {fen} {move}'):
+                        board.push(move)
+                        board.pop()
+                        self.assertEqual(self.state(board), before)
+
+    def test_pop_unwinds_a_line(self):
+        rng = random.Random(8)
+        board = Board.from_fen(self.FENS[0])
+        states = []
+
+        for _ in range(20):
+            moves = list(board.legal_moves())
+            if not moves:
+                break
+
+            states.append(self.state(board))
+            board.push(rng.choice(moves))
+
+        while states:
+            board.pop()
+            self.assertEqual(self.state(board), states.pop())
+
+        with self.assertRaises(IndexError):
+            board.pop()
+
+
+class CopyTests(unittest.TestCase):
+    state = staticmethod(UndoTests.state)
+
+    def played(self, backend, plies=12):
+        rng = random.Random(14)
+        board = backend.from_fen(UndoTests.FENS[0])
+
+        for _ in range(plies):
+            board.push(rng.choice(list(board.legal_moves())))
+
+        return board
+
+    def test_copy_is_independent(self):
+        for backend in BACKENDS:
+            with self.subTest(backend.__name__):
+                board = self.played(backend)
+                before = self.state(board)
+
+                clone = board.copy()
+                self.assertEqual(self.state(clone), before)
+                self.assertEqual(clone.zobrist_key, board.zobrist_key)
+
+                clone.push(clone.legal_moves()[0])
+                clone[Rank.FOUR][File.D] = Queen(Color.BLACK)
+                clone.castling_perms[Color.WHITE] = 0
+
+                self.assertEqual(self.state(board), before)
+                self.assertEqual(set(board.legal_moves()), set(self.played(backend).legal_moves()))
+
+    def test_copy_keeps_the_history(self):
+        for backend in BACKENDS:
+            with self.subTest(backend.__name__):
+                board = self.played(backend)
+                clone = board.copy()
+
+                while board._undo_stack:
+                    board.pop()
+                    clone.pop()
+                    self.assertEqual(self.state(clone), self.state(board))
+                    self.assertEqual(clone.zobrist_key, board.zobrist_key)
+
+    def test_pickle_round_trips(self):
+        for backend in BACKENDS:
+            for fen in UndoTests.FENS:
+                with self.subTest(f'{backend.__name__} {fen}'):
+                    board = backend.from_fen(fen)
+                    for _ in range(3):
+                        board.push(board.legal_moves()[0])
+
+                    data = pickle.dumps(board)
+                    restored = pickle.loads(data)
+
+                    self.assertIs(type(restored), backend)
+                    self.assertLess(len(data), 200)
+                    self.assertEqual(self.state(restored), self.state(board))
+                    self.assertEqual(restored.zobrist_key, board.zobrist_key)
+                    self.assertEqual(restored._undo_stack, board._undo_stack)
+
+                    while board._undo_stack:
+                        board.pop()
+                        restored.pop()
+                        self.assertEqual(self.state(restored), self.state(board))
+
+    def test_foreign_objects_cannot_be_packed(self):
+        board = Board()
+        board[Rank.ONE][File.A] = MagicMock()
+
+        with self.assertRaises(ValueError):
+            board.to_bytes()
+
+
+class PieceTrackingTests(unittest.TestCase):
+    def squares(self, board, color):
+        return {position for position, _ in board._pieces_of(color)}
+
+    def test_pieces_of_a_color(self):
+        for backend in BACKENDS:
+            with self.subTest(backend.__name__):
+                board = backend.from_fen('4k3/8/8/3pP3/8/8/8/4K2R w K d6 0 1')
+
+                self.assertSetEqual(self.squares(board, Color.WHITE), {P('e1'), P('h1'), P('e5')})
+                self.assertSetEqual(self.squares(board, Color.BLACK), {P('e8'), P('d5')})
+
+                board.move(board.encode_move(P('e5'), P('d6')))
+                board.move(board.encode_move(P('e1'), P('g1')))
+
+                self.assertSetEqual(self.squares(board, Color.WHITE), {P('g1'), P('f1'), P('d6')})
+                self.assertSetEqual(self.squares(board, Color.BLACK), {P('e8')})
+
+    def test_kings_follow_writes(self):
+        board = Board.standard_configuration()
+
+        board[Rank.ONE][File.E] = None
+        self.assertIsNone(board.kings[Color.WHITE])
+
+        board[Rank.FOUR][File.D] = board[Rank.EIGHT][File.E]
+        self.assertEqual(board.kings[Color.BLACK], P('d4'))
+
+        board[Rank.EIGHT][File.E] = None
+        self.assertEqual(board.kings[Color.BLACK], P('d4'))
+
+    def test_writes_of_non_pieces_are_only_stored(self):
+        board = Board()
+        mock = MagicMock()
+
+        board[Rank.ONE][File.A] = mock
+        self.assertIs(board[Rank.ONE][File.A], mock)
+        self.assertEqual(self.squares(board, Color.WHITE) | self.squares(board, Color.BLACK), set())
+
+
+class ProjectionTests(unittest.TestCase):
+    def test_matches_the_board(self):
+        for backend in BACKENDS:
+            with self.subTest(backend.__name__):
+                board = backend.from_fen('r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1')
+                expected = [[board[rank][file] for file in File] for rank in reversed(Rank)]
+
+                self.assertEqual([list(row) for row in board.projection], expected)
+                self.assertEqual(board.projection[-1][-1], expected[-1][-1])
+                self.assertEqual(board.projection[1:3][0][:2], expected[1][:2])
+
+    def test_follows_the_board(self):
+        board = Board.standard_configuration()
+        view = board.projection
+
+        board.push((P('e2'), P('e4')))
+        self.assertIsNone(view[6][4])
+        self.assertEqual(view[4][4].figure_type, Type.PAWN)
+
+        board.pop()
+        self.assertIsNone(view[4][4])
+
+    def test_is_read_only(self):
+        view = Board.standard_configuration().projection
+
+        with self.assertRaises(TypeError):
+            view[0][0] = None
+        with self.assertRaises(IndexError):
+            view[8]
+        with self.assertRaises(IndexError):
+            view[0][8]
+
+
+class SubscriptionTests(unittest.TestCase):
+    def changes(self, board, *moves):
+        reported = []
+        board.subscribe(reported.append)
+        play(board, *moves)
+
+        return [[(str(pos), piece and piece.figure_type) for pos, piece in change] for change in reported]
+
+    def test_castling_reports_the_rook(self):
+        board = Board.from_fen('r3k3/8/8/8/8/8/8/4K2R w Kq - 0 1')
+
+        self.assertEqual(self.changes(board, 'e1g1', 'e8c8'), [
+            [('E1', None), ('G1', Type.KING), ('H1', None), ('F1', Type.ROOK)],
+            [('E8', None), ('C8', Type.KING), ('A8', None), ('D8', Type.ROOK)],
+        ])
+
+    def test_en_passant_reports_the_taken_pawn(self):
+        for backend in BACKENDS:
+            with self.subTest(backend.__name__):
+                board = backend.from_fen('4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1')
+
+                self.assertEqual(self.changes(board, 'e5d6'), [
+                    [('E5', None), ('D6', Type.PAWN), ('D5', None)],
+                ])
+
+    def test_promotion_reports_the_new_piece(self):
+        board = Board.from_fen('4k3/P7/8/8/8/8/8/4K3 w - - 0 1')
+        board.promotion_cb = lambda: Queen
+
+        self.assertEqual(self.changes(board, 'a7a8'), [[('A7', None), ('A8', Type.QUEEN)]])
+
+    def test_pop_and_unsubscribe(self):
+        board = Board.standard_configuration()
+        reported = []
+        callback = board.subscribe(reported.append)
+        clone = board.copy()
+
+        board.push((P('g1'), P('f3')))
+        board.pop()
+        board.unsubscribe(callback)
+        board.push((P('g1'), P('f3')))
+        clone.push((P('g1'), P('f3')))
+
+        self.assertEqual(len(reported), 2)
+        self.assertEqual({str(pos) for pos, _ in reported[1]}, {'G1', 'F3'})
+        self.assertEqual(reported[1][0][1].figure_type, Type.KNIGHT)
+
+    def test_callbacks_see_the_finished_position(self):
+        for backend in BACKENDS:
+            with self.subTest(backend.__name__):
+                board = backend.standard_configuration()
+                seen = []
+                board.subscribe(lambda changes: seen.append(
+                    (board.player, board.half_move, board.full_move, len(board._undo_stack), board.zobrist_key)
+                ))
+
+                board.push((P('e2'), P('e4')))
+                board.push((P('g8'), P('f6')))
+                board.pop()
+
+                self.assertEqual([player for player, *_ in seen], [Color.BLACK, Color.WHITE, Color.BLACK])
+                self.assertEqual([state[1:4] for state in seen], [(0, 1, 1), (1, 2, 2), (0, 1, 1)])
+                self.assertEqual(seen[-1][-1], board.zobrist_key)
+
+
+class SnapshotTests(unittest.TestCase):
+    def test_is_immutable_and_kept_by_readers(self):
+        board = Board.standard_configuration()
+        snapshot = board.snapshot()
+
+        with self.assertRaises(AttributeError):
+            snapshot.player = Color.BLACK
+        with self.assertRaises(TypeError):
+            snapshot.ranks[1] = ()
+
+        play(board, 'e2e4', 'e7e5')
+
+        self.assertEqual(snapshot.piece_at(P('e2')).figure_type, Type.PAWN)
+        self.assertIsNone(snapshot.piece_at(P('e4')))
+        self.assertEqual(snapshot.player, Color.WHITE)
+        self.assertEqual(snapshot, Board.standard_configuration().snapshot())
+
+    def test_transpositions_are_equal_and_hash_alike(self):
+        first = play(Board.standard_configuration(), 'g1f3', 'b8c6', 'b1c3').snapshot()
+        second = play(Board.standard_configuration(), 'b1c3', 'b8c6', 'g1f3').snapshot()
+        other = play(Board.standard_configuration(), 'b1c3', 'g8f6', 'g1f3').snapshot()
+
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertNotEqual(first, other)
+        self.assertEqual(len({first, second, other}), 2)
+
+    def test_unchanged_ranks_are_shared(self):
+        board = Board.standard_configuration()
+        before = board.snapshot()
+        play(board, 'g1f3')
+        after = board.snapshot()
+
+        self.assertIs(board.snapshot(), after)
+        self.assertEqual(
+            [after.ranks[rank] is before.ranks[rank] for rank in range(8)],
+            [False, True, False] + [True] * 5,
+        )
+
+        with board.temporarily_remove_position(P('f3')):
+            pass
+        self.assertIs(board.snapshot(), after)
+
+        clone = board.copy()
+        play(clone, 'e7e5')
+        self.assertIs(board.snapshot(), after)
+        self.assertIs(clone.snapshot().ranks[0], after.ranks[0])
+
+    def test_round_trips_through_every_backend(self):
+        for backend in BACKENDS:
+            for fen in AttackersOfTests.FENS + ['4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1']:
+                with self.subTest(f'{backend.__name__} {fen}'):
+                    board = backend.from_fen(fen)
+                    snapshot = board.snapshot()
+                    restored = backend.from_snapshot(snapshot)
+
+                    self.assertEqual(restored.snapshot(), snapshot)
+                    self.assertEqual(restored.zobrist_key, board.zobrist_key)
+                    self.assertEqual(restored.kings, board.kings)
+                    self.assertEqual(set(restored.legal_moves()), set(board.legal_moves()))
+                    self.assertEqual(
+                        [list(row) for row in board.projection],
+                        [list(row) for row in snapshot.projection],
+                    )
+
+
+class SymmetryTests(unittest.TestCase):
+    FENS = FENS + ['4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1']
+
+    def moves(self, board, table=tuple(range(64))):
+        return {(table[move.from_square], table[move.to_square], move.promotion) for move in board.legal_moves()}
+
+    def test_color_flip_swaps_the_sides(self):
+        for backend in BACKENDS:
+            for fen in self.FENS:
+                with self.subTest(f'{backend.__name__} {fen}'):
+                    board = backend.from_fen(fen)
+                    flipped = board.color_flipped()
+
+                    self.assertIsNot(flipped.player, board.player)
+                    self.assertEqual(flipped.zobrist_key, zobrist.board_key(flipped))
+                    self.assertEqual(self.moves(flipped), self.moves(board, attacks.FLIP_RANKS))
+                    self.assertEqual(flipped.color_flipped().snapshot(), board.snapshot())
+
+    def test_mirror_reflects_the_files(self):
+        for backend in BACKENDS:
+            for fen in self.FENS:
+                with self.subTest(f'{backend.__name__} {fen}'):
+                    board = backend.from_fen(fen)
+                    board.castling_perms = {Color.WHITE: CastlingPerm.NONE, Color.BLACK: CastlingPerm.NONE}
+                    mirrored = board.mirrored()
+
+                    self.assertEqual(mirrored.kings[Color.WHITE].square, board.kings[Color.WHITE].square ^ 7)
+                    self.assertEqual(mirrored.zobrist_key, zobrist.board_key(mirrored))
+                    self.assertEqual(self.moves(mirrored), self.moves(board, attacks.MIRROR_FILES))
+                    self.assertEqual(mirrored.mirrored().snapshot(), board.snapshot())
+
+    def test_mirror_drops_castling_rights(self):
+        board = Board.standard_configuration().mirrored()
+
+        self.assertEqual(dict(board.castling_perms), {Color.WHITE: CastlingPerm.NONE, Color.BLACK: CastlingPerm.NONE})
+        self.assertEqual(board[Rank.ONE][File.D].figure_type, Type.KING)
+
+
+class EqualityTests(unittest.TestCase):
+    def test_transpositions_are_equal_across_backends(self):
+        boards = [
+            play(backend.standard_configuration(), *moves)
+            for backend in BACKENDS
+            for moves in [('g1f3', 'g8f6', 'b1c3'), ('b1c3', 'g8f6', 'g1f3')]
+        ]
+
+        for board in boards:
+            self.assertEqual(board, boards[0])
+            self.assertEqual(hash(board), hash(boards[0]))
+
+        self.assertEqual(len(set(boards)), 1)
+        self.assertEqual({boards[0]: 'seen'}[boards[-1]], 'seen')
+
+    def test_state_is_compared(self):
+        board = Board.from_fen('4k3/8/8/3pP3/8/8/8/R3K3 w Q d6 0 1')
+
+        self.assertEqual(board, Board.from_fen('4k3/8/8/3pP3/8/8/8/R3K3 w Q d6 7 30'))
+        self.assertNotEqual(board, Board.from_fen('4k3/8/8/3pP3/8/8/8/R3K3 b Q d6 0 1'))
+        self.assertNotEqual(board, Board.from_fen('4k3/8/8/3pP3/8/8/8/R3K3 w - d6 0 1'))
+        self.assertNotEqual(board, Board.from_fen('4k3/8/8/3pP3/8/8/8/R3K3 w Q - 0 1'))
+        self.assertNotEqual(board, Board.from_fen('4k3/8/8/3pP3/8/8/8/R2K4 w Q d6 0 1'))
+        self.assertNotEqual(board, board.snapshot())
+
+    def test_equal_keys_are_checked_square_by_square(self):
+        board = Board.standard_configuration()
+        other = play(Board.standard_configuration(), 'e2e4')
+        other._zobrist ^= other.zobrist_key ^ board.zobrist_key
+
+        self.assertEqual(hash(board), hash(other))
+        self.assertNotEqual(board, other)
+
+    def test_comparing_leaves_both_boards_alone(self):
+        board = play(Board.standard_configuration(), 'e2e4')
+        other = play(BitBoard.standard_configuration(), 'e2e4')
+        state = [(b._snapshot, b._dirty_ranks, b._revision) for b in (board, other)]
+
+        self.assertEqual(board, other)
+        self.assertEqual([(b._snapshot, b._dirty_ranks, b._revision) for b in (board, other)], state)
+
+    def test_follows_moves(self):
+        board = Board.standard_configuration()
+        clone = board.copy()
+
+        play(clone, 'e2e4')
+        self.assertNotEqual(board, clone)
+
+        clone.pop()
+        self.assertEqual(board, clone)
@@ -174,23 +174,17 @@ class TestFENParsing(unittest.TestCase):
             board = Board.from_fen('8/8/8/8/8/8/PPPPPPPP/RNBQKBNR b - - 0 1')
             self.assertEqual(board.player, Color.BLACK)
             self.assertEqual(board.enemy, Color.WHITE)
-    
-    @unittest.skipIf(not hasattr(Board(), 'half_move'), 'half move clock not yet supported')
+
     def test_half_move_clock(self):
         board = Board.from_fen('8/8/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1')
-        self.assertEqual(getattr(board, 'half_move'), 0)
+        self.assertEqual(board.half_move, 0)
 
         board = Board.from_fen('8/8/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 12 1')
-        self.assertEqual(getattr(board, 'half_move'), 12)
+        self.assertEqual(board.half_move, 12)
 
-        self.assertTrue(False, 'Refactor this test')  # the getattr with direct attribute access
-
-    @unittest.skipIf(not hasattr(Board(), 'full_move'), 'full move count not yet supported')
     def test_full_move_clock(self):
         board = Board.from_fen('8/8/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1')
-        self.assertEqual(getattr(board, 'full_move'), 1)
+        self.assertEqual(board.full_move, 1)
 
         board = Board.from_fen('8/8/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 42')
-        self.assertEqual(getattr(board, 'full_move'), 42)
-
-        self.assertTrue(False, 'Refactor this test')  # the getattr with direct attribute access
\ No newline at end of file
+        self.assertEqual(board.full_move, 42)
\ No newline at end of file
@@ -0,0 +1,62 @@
+import random
+import unittest
+
+from chess import magics
+from chess.attacks import DIAGONAL, STRAIGHT
+from chess.position import Position
+
+P = Position.from_str
+
+
+def bit(*names):
+    return sum(1 << P(name).square for name in names)
+
+
+class MagicLookupTests(unittest.TestCase):
+    def test_empty_board(self):
+        self.assertEqual(magics.rook_attacks(P('a1').square, 0), 0x01010101010101fe)
+        self.assertEqual(magics.bishop_attacks(P('a1').square, 0), 0x8040201008040200)
+        self.assertEqual(bin(magics.queen_attacks(P('d4').square, 0)).count('1'), 27)
+
+    def test_rays_end_on_the_first_blocker(self):
+        occupancy = bit('d6', 'd7', 'b4', 'f6', 'g7')
+
+        self.assertEqual(
+            magics.rook_attacks(P('d4').square, occupancy),
+            bit('d5', 'd6', 'c4', 'b4', 'e4', 'f4', 'g4', 'h4', 'd3', 'd2', 'd1')
+        )
+        self.assertEqual(
+            magics.bishop_attacks(P('d4').square, occupancy),
+            bit('e5', 'f6', 'c5', 'b6', 'a7', 'c3', 'b2', 'a1', 'e3', 'f2', 'g1')
+        )
+
+    def test_matches_ray_walking(self):
+        rng = random.Random(42)
+
+        for square in range(64):
+            for _ in range(64):
+                occupancy = rng.getrandbits(64) & rng.getrandbits(64)
+
+                self.assertEqual(
+                    magics.rook_attacks(square, occupancy),
+                    magics.slider_attacks(square, occupancy, STRAIGHT),
+                    msg=f'rook on {square}, occupancy {occupancy:#x}'
+                )
+                self.assertEqual(
+                    magics.bishop_attacks(square, occupancy),
+                    magics.slider_attacks(square, occupancy, DIAGONAL),
+                    msg=f'bishop on {square}, occupancy {occupancy:#x}'
+                )
+
+    def test_find_magic(self):
+        square = P('e4').square
+        magic = magics.find_magic(square, DIAGONAL, rng=random.Random(7))
+
+        mask = magics._relevant_mask(square, DIAGONAL)
+        shift = 64 - bin(mask).count('1')
+        seen = {}
+
+        for occupancy in magics._subsets(mask):
+            index = ((occupancy * magic) & magics._U64) >> shift
+            attacks = magics.slider_attacks(square, occupancy, DIAGONAL)
+            self.assertEqual(seen.setdefault(index, attacks), attacks)
@@ -0,0 +1,99 @@
+import pickle
+import random
+import unittest
+
+from chess.board import Board, OutOfBounds
+from chess.constants import Rank, File, CastlingPerm
+from chess.constants import FigureColor as Color
+from chess.mailbox import MailboxBoard, CELLS, OFF_BOARD
+from chess.pieces import Queen
+from chess.position import Position
+from tests import test_bitboard
+from tests.test_bitboard import FENS
+
+P = Position.from_str
+
+
+class CellTests(unittest.TestCase):
+    def test_padding_is_out_of_bounds(self):
+        board = MailboxBoard()
+
+        self.assertEqual(len(board.cells), 120)
+        self.assertEqual(board.cells.count(OFF_BOARD), 120 - 64)
+        self.assertTrue(all(square is OutOfBounds for square in board[0]))
+        self.assertEqual(board[Rank.ONE][:2], [OutOfBounds, OutOfBounds])
+        self.assertEqual(board[Rank.ONE][2:-2], [None] * 8)
+        self.assertFalse(board.is_in_bounds(64))
+
+    def test_projection_matches_list_board(self):
+        for fen in FENS:
+            with self.subTest(fen):
+                self.assertEqual(
+                    [[repr(x) for x in row] for row in MailboxBoard.from_fen(fen).projection],
+                    [[repr(x) for x in row] for row in Board.from_fen(fen).projection],
+                )
+
+    def test_writes_update_the_cells(self):
+        board = MailboxBoard.standard_configuration()
+        e2, e4 = CELLS[P('e2').square], CELLS[P('e4').square]
+        pawn = board.cells[e2]
+
+        board.move(from_pos=P('e2'), to_pos=P('e4'))
+
+        self.assertEqual((board.cells[e2], board.cells[e4]), (0, pawn))
+        self.assertEqual(board.kings, {Color.WHITE: P('e1'), Color.BLACK: P('e8')})
+        self.assertEqual(board.en_passant_pos, P('e3'))
+
+    def test_are_enemies(self):
+        board = MailboxBoard.standard_configuration()
+
+        self.assertTrue(board.are_enemies(P('a1'), P('a8')))
+        self.assertFalse(board.are_enemies(P('a1'), P('b1')))
+        self.assertFalse(board.are_enemies(P('a1'), P('a4')))
+        self.assertTrue(board.are_enemies(Color.WHITE, P('a7')))
+        self.assertFalse(board.are_enemies(Color.WHITE, P('a2')))
+        self.assertTrue(board.are_enemies(0, 56))
+
+    def test_copies_share_nothing(self):
+        board = MailboxBoard.standard_configuration()
+        clone = board.copy()
+        clone[Rank.FOUR][File.D] = Queen(Color.BLACK)
+
+        self.assertTrue(board.is_empty(P('d4')))
+        self.assertNotEqual(clone.cells, board.cells)
+        self.assertEqual(pickle.loads(pickle.dumps(clone)).cells, clone.cells)
+
+
+class MailboxEquivalenceTests(test_bitboard.BackendEquivalenceTests):
+    '''MailboxBoard must answer every query exactly like the list based board.'''
+    backend = MailboxBoard
+
+    def test_castling_through_attacked_squares(self):
+        for fen in ['r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1', 'r3k2r/8/8/8/8/8/6r1/R3K2R w KQkq - 0 1']:
+            board = MailboxBoard.from_fen(fen)
+
+            for side in [CastlingPerm.KING_SIDE, CastlingPerm.QUEEN_SIDE]:
+                with self.subTest(f'{fen} {side}'):
+                    self.assertEqual(
+                        board.is_able_to_castle(Color.WHITE, side),
+                        Board.from_fen(fen).is_able_to_castle(Color.WHITE, side),
+                    )
+
+    def test_legal_moves_match(self):
+        rng = random.Random(15)
+
+        for fen in FENS:
+            board, mailbox = Board.from_fen(fen), MailboxBoard.from_fen(fen)
+            board.promotion_cb = mailbox.promotion_cb = lambda: Queen
+
+            for ply in range(8):
+                with self.subTest(f'{fen} ply {ply}'):
+                    moves = sorted(board.legal_moves())
+                    self.assertEqual(sorted(mailbox.legal_moves()), moves)
+
+                if not moves:
+                    break
+
+                move = rng.choice(moves)
+                board.push(move)
+                mailbox.push(move)
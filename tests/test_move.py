@@ -0,0 +1,49 @@
+import unittest
+
+from chess.constants import FigureType as Type
+from chess.move import Move, PROMOTION_TYPES
+from chess.move import QUIET, DOUBLE_PUSH, KING_CASTLE, QUEEN_CASTLE, CAPTURE, EN_PASSANT
+from chess.position import Position
+
+P = Position.from_str
+
+
+class MoveEncodingTests(unittest.TestCase):
+    def test_fits_in_16_bits(self):
+        move = Move.encode(63, 63, CAPTURE).with_promotion(Type.QUEEN)
+        self.assertLess(move, 1 << 16)
+
+    def test_round_trip(self):
+        for from_square in range(0, 64, 7):
+            for to_square in range(0, 64, 5):
+                for flags in (QUIET, DOUBLE_PUSH, KING_CASTLE, QUEEN_CASTLE, CAPTURE, EN_PASSANT):
+                    move = Move.encode(from_square, to_square, flags)
+
+                    self.assertEqual((move.from_square, move.to_square, move.flags), (from_square, to_square, flags))
+                    self.assertEqual(tuple(move), (Position.from_square(from_square), Position.from_square(to_square)))
+
+    def test_flags(self):
+        self.assertTrue(Move.encode(12, 28, DOUBLE_PUSH).is_double_push)
+        self.assertTrue(Move.encode(4, 6, KING_CASTLE).is_castling)
+        self.assertTrue(Move.encode(4, 2, QUEEN_CASTLE).is_castling)
+        self.assertTrue(Move.encode(36, 43, EN_PASSANT).is_en_passant)
+        self.assertTrue(Move.encode(36, 43, EN_PASSANT).is_capture)
+        self.assertFalse(Move.encode(4, 6, KING_CASTLE).is_capture)
+
+    def test_promotions(self):
+        quiet, capture = Move.encode(52, 60), Move.encode(52, 61, CAPTURE)
+
+        self.assertIsNone(quiet.promotion)
+        for figure_type in PROMOTION_TYPES:
+            self.assertEqual(quiet.with_promotion(figure_type).promotion, figure_type)
+            self.assertFalse(quiet.with_promotion(figure_type).is_capture)
+            self.assertTrue(capture.with_promotion(figure_type).is_capture)
+
+        self.assertEqual(len({quiet.with_promotion(t) for t in PROMOTION_TYPES}), 4)
+
+    def test_is_an_int(self):
+        move = Move.encode(12, 28, DOUBLE_PUSH)
+
+        self.assertEqual(move, 12 | 28 << 6 | DOUBLE_PUSH << 12)
+        self.assertEqual(hash(move), hash(int(move)))
+        self.assertEqual(str(move), 'e2e4')
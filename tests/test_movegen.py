@@ -0,0 +1,238 @@
+import unittest
+from copy import deepcopy
+
+from chess.board import Board
+from chess.constants import Rank, File
+from chess.constants import FigureColor as Color, FigureType as Type
+from chess.movegen import ALL_SQUARES, MoveList
+from chess.pieces import Queen, Rook
+from chess.position import Position
+from tests.test_bitboard import FENS
+from tests.test_utils import BACKENDS
+
+P = Position.from_str
+
+
+def bits(*names):
+    return sum(1 << P(name).square for name in names)
+
+
+def brute_force_moves(board, position):
+    '''Tries every pseudo legal move and keeps those that do not leave the own king attacked.'''
+    piece = board[position.rank][position.file]
+    pseudo_legal = type(piece).generate_moves.__wrapped__(piece, board, position)
+    legal = set()
+
+    for target in pseudo_legal:
+        after = deepcopy(board)
+        after.promotion_cb = lambda: Queen
+        after.move(from_pos=position, to_pos=target)
+
+        if not any(after.get_attackers(after.kings[piece.color], piece.color)):
+            legal.add(target)
+
+    return legal
+
+
+class CheckInfoTests(unittest.TestCase):
+    def test_pins_and_checks(self):
+        for backend in BACKENDS:
+            with self.subTest(backend.__name__):
+                board = backend.from_fen('4k3/8/8/b7/4r3/8/3P4/4K3 w - - 0 1')
+                info = board.check_info(Color.WHITE)
+
+                self.assertEqual(info.checkers, bits('e4'))
+                self.assertEqual(info.evasions, bits('e2', 'e3', 'e4'))
+                self.assertEqual(info.pins, {P('d2').square: bits('d2', 'c3', 'b4', 'a5')})
+                self.assertEqual(info.allowed(P('d2').square), 0)
+
+    def test_double_check_allows_no_evasions(self):
+        for backend in BACKENDS:
+            with self.subTest(backend.__name__):
+                board = backend.from_fen('4k3/8/8/8/4r3/5n2/8/4K3 w - - 0 1')
+                self.assertEqual(board.check_info(Color.WHITE).evasions, 0)
+
+    def test_cache_follows_the_board(self):
+        for backend in BACKENDS:
+            with self.subTest(backend.__name__):
+                board = backend.from_fen('4k3/8/8/8/8/8/8/4K3 w - - 0 1')
+                self.assertEqual(board.check_info(Color.WHITE).evasions, ALL_SQUARES)
+
+                board[Rank.FIVE][File.E] = Rook(Color.BLACK)
+                self.assertEqual(board.check_info(Color.WHITE).checkers, bits('e5'))
+
+                board.move(from_pos=P('e1'), to_pos=P('d1'))
+                self.assertFalse(board.check_info(Color.WHITE).in_check)
+
+    def test_en_passant_may_capture_the_checker(self):
+        for backend in BACKENDS:
+            with self.subTest(backend.__name__):
+                board = backend.from_fen('8/8/8/2k5/3Pp3/8/8/4K3 b - d3 0 1')
+                pawn = board[Rank.FOUR][File.E]
+
+                self.assertEqual(set(pawn.generate_moves(board, P('e4'))), {P('d3')})
+
+
+class LegalMoveTests(unittest.TestCase):
+    def test_matches_brute_force(self):
+        fens = FENS + [
+            '4k3/8/8/b7/4r3/8/3P4/4K3 w - - 0 1',
+            'r3k3/8/8/1B6/8/8/8/4K2R b - - 0 1',
+            '4k3/4q3/8/8/4Q3/8/3PRP2/3NKN2 w - - 0 1',
+        ]
+
+        for backend in BACKENDS:
+            for fen in fens:
+                board = backend.from_fen(fen)
+
+                for rank in Rank:
+                    for file in File:
+                        position = Position(rank, file)
+                        piece = board[rank][file]
+
+                        if piece is None or piece.figure_type is Type.KING:
+                            continue
+
+                        with self.subTest(f'{backend.__name__} {fen} {piece} @ {position}'):
+                            self.assertSetEqual(
+                                set(piece.generate_moves(board, position)),
+                                brute_force_moves(board, position)
+                            )
+
+
+class SideMoveListTests(unittest.TestCase):
+    def per_piece_moves(self, board):
+        return {
+            (Position(rank, file), target)
+            for rank in Rank for file in File
+            if getattr(board[rank][file], 'color', None) == board.player
+            for target in board[rank][file].generate_moves(board, Position(rank, file))
+        }
+
+    def test_matches_per_piece_generation(self):
+        for backend in BACKENDS:
+            for fen in FENS:
+                with self.subTest(f'{backend.__name__} {fen}'):
+                    board = backend.from_fen(fen)
+
+                    moves = board.legal_moves()
+                    captures, quiets = board.legal_captures(), board.legal_quiet_moves()
+
+                    self.assertEqual(len(set(moves)), len(moves))
+                    self.assertSetEqual({tuple(move) for move in moves}, self.per_piece_moves(board))
+                    self.assertSetEqual(set(captures) | set(quiets), set(moves))
+                    self.assertFalse(set(captures) & set(quiets))
+                    self.assertTrue(all(not board.is_empty(to_pos) for _, to_pos in captures))
+
+    def test_known_move_counts(self):
+        for fen, count in [
+            (FENS[0], 20),
+            (FENS[1], 48),
+            (FENS[2], 14),
+            (FENS[3], 6),
+            (FENS[4], 44),
+        ]:
+            with self.subTest(fen):
+                self.assertEqual(len(Board.from_fen(fen).legal_moves()), count)
+
+    def test_promotions_are_expanded(self):
+        board = Board.from_fen('1r2k3/P7/8/8/8/8/8/4K3 w - - 0 1')
+        promotions = [move for move in board.legal_moves() if move.is_promotion]
+
+        self.assertEqual(len(promotions), 8)
+        self.assertEqual(
+            {(str(move), move.is_capture) for move in promotions},
+            {(f'a7{to}{piece}', to == 'b8') for to in ('a8', 'b8') for piece in 'nbrq'}
+        )
+
+    def test_en_passant_is_a_capture(self):
+        board = Board.from_fen('4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1')
+
+        self.assertIn((P('e5'), P('d6')), board.legal_captures())
+        self.assertNotIn((P('e5'), P('d6')), board.legal_quiet_moves())
+
+    def test_en_passant_uncovering_the_king_along_the_rank(self):
+        for backend in BACKENDS:
+            for fen, pawn, target in [
+                ('8/8/8/KPp4r/8/8/8/4k3 w - c6 0 1', 'b5', 'c6'),
+                ('4K3/8/8/8/R4Ppk/8/8/8 b - f3 0 1', 'g4', 'f3'),
+                ('4K3/8/8/8/k4PpR/8/8/8 b - f3 0 1', 'g4', 'f3'),
+            ]:
+                with self.subTest(f'{backend.__name__} {fen}'):
+                    board = backend.from_fen(fen)
+                    moves = board.legal_moves()
+
+                    self.assertNotIn((P(pawn), P(target)), moves)
+                    self.assertNotIn(P(target), board[P(pawn).rank][P(pawn).file].generate_moves(board, P(pawn)))
+                    self.assertSetEqual({tuple(move) for move in moves}, self.per_piece_moves(board))
+
+    def test_both_pawns_may_take_en_passant(self):
+        board = Board.from_fen('4k3/8/8/2PpP3/8/8/8/4K3 w - d6 0 1')
+
+        self.assertEqual(
+            {str(move) for move in board.legal_captures()},
+            {'c5d6', 'e5d6'},
+        )
+
+    def test_move_list_is_reused(self):
+        board = Board.standard_configuration()
+        moves = board.legal_moves()
+
+        self.assertIs(board.legal_captures(moves), moves)
+        self.assertEqual(len(moves), 0)
+        self.assertIs(board.legal_moves(moves), moves)
+        self.assertEqual(len(moves), 20)
+        self.assertEqual(moves[19], list(moves)[-1])
+        self.assertIn((P('a2'), P('a3')), moves)
+
+    def test_slices_are_move_lists(self):
+        board = Board.standard_configuration()
+        moves = board.legal_moves()
+        first = moves[:2]
+
+        self.assertIsInstance(first, MoveList)
+        self.assertEqual(list(first), list(moves)[:2])
+        self.assertEqual(list(moves[::-1]), list(reversed(list(moves))))
+
+        board.legal_captures(moves)
+        self.assertEqual(len(first), 2)
+
+
+class IsLegalTests(unittest.TestCase):
+    def test_matches_the_generated_moves(self):
+        for backend in BACKENDS:
+            for fen in FENS + ['4k3/8/8/8/4r3/5n2/8/4K3 w - - 0 1', '4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1']:
+                board = backend.from_fen(fen)
+                legal = {(from_pos.square, to_pos.square) for from_pos, to_pos in board.legal_moves()}
+
+                with self.subTest(f'{backend.__name__} {fen}'):
+                    self.assertSetEqual(
+                        {(a, b) for a in range(64) for b in range(64) if board.is_legal(a, b)},
+                        legal,
+                    )
+
+    def test_promotions(self):
+        board = Board.from_fen('1r2k3/P7/8/8/8/8/8/4K3 w - - 0 1')
+
+        self.assertTrue(board.is_legal(P('a7'), P('a8')))
+        self.assertTrue(board.is_legal(P('a7'), P('b8'), Type.KNIGHT))
+        self.assertTrue(board.is_legal(P('a7'), P('a8'), Type.QUEEN))
+        self.assertFalse(board.is_legal(P('a7'), P('a8'), Type.KING))
+        self.assertFalse(board.is_legal(P('a7'), P('a8'), Type.PAWN))
+        self.assertFalse(board.is_legal(P('e1'), P('e2'), Type.QUEEN))
+
+    def test_en_passant_uncovering_the_king_along_the_rank(self):
+        for backend in BACKENDS:
+            with self.subTest(backend.__name__):
+                board = backend.from_fen('8/8/8/KPp4r/8/8/8/4k3 w - c6 0 1')
+
+                self.assertFalse(board.is_legal(P('b5'), P('c6')))
+                self.assertTrue(board.is_legal(P('b5'), P('b6')))
+
+    def test_only_the_side_to_move(self):
+        board = Board.standard_configuration()
+
+        self.assertTrue(board.is_legal(P('g1'), P('f3')))
+        self.assertFalse(board.is_legal(P('g8'), P('f6')))
+        self.assertFalse(board.is_legal(P('e4'), P('e5')))
+        self.assertFalse(board.is_legal(P('a1'), P('a2')))
@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 
 from chess.constants import Rank, File
@@ -60,3 +62,37 @@ class PositionTests(unittest.TestCase):
 
         self.assertEqual(hash(h8_1), hash(h8_2))
         self.assertEqual(hash(a1_1), hash(a1_2))
+
+    def test_positions_are_interned(self):
+        self.assertIs(Position(Rank.ONE, File.A), Position.from_str('a1'))
+        self.assertIs(Position.from_str('E4'), Position.from_str('e4'))
+        self.assertIs(Position(Rank.TWO, File.B) + (1, 1), Position(Rank.THREE, File.C))
+        self.assertIs(Position(9, 2), Position(Rank.ONE, File.A))
+
+    def test_positions_are_immutable(self):
+        pos = Position(Rank.FOUR, File.D)
+
+        with self.assertRaises(AttributeError):
+            pos.rank = Rank.FIVE
+
+    def test_copies_and_pickles_keep_identity(self):
+        pos = Position(Rank.FOUR, File.D)
+
+        self.assertIs(copy.copy(pos), pos)
+        self.assertIs(copy.deepcopy(pos), pos)
+        self.assertIs(pickle.loads(pickle.dumps(pos)), pos)
+
+    def test_square_indices(self):
+        self.assertEqual(Position(Rank.ONE, File.A).square, 0)
+        self.assertEqual(Position(Rank.ONE, File.H).square, 7)
+        self.assertEqual(Position(Rank.EIGHT, File.A).square, 56)
+        self.assertIsNone(Position(1, File.A).square)
+
+        for square in range(64):
+            self.assertEqual(Position.from_square(square).square, square)
+
+    def test_padding_positions_are_not_equal_to_board_positions(self):
+        self.assertNotEqual(Position(0, 0), Position(Rank.ONE, File.A))
+        self.assertEqual(Position(0, 0), Position(0, 0))
+        self.assertEqual(Position(-1, 14), Position(-1, 14))
+        self.assertNotEqual(Position(-1, 14), Position(0, 2))
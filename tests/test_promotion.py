@@ -3,7 +3,9 @@ import unittest
 from chess.board      import Board
 from chess.position   import Position
 from chess.constants  import Rank, File
-from chess.constants  import FigureColor as Color
+from chess.constants  import FigureColor as Color, FigureType as Type
+
+P = Position.from_str
 
 
 class PromotionTests(unittest.TestCase):
@@ -59,3 +61,13 @@ class PromotionTests(unittest.TestCase):
 
         board.move(from_pos=f, to_pos=t)
         self.assertEqual(board[t.rank][t.file], piece_cls_mock.return_value)
+
+    def test_promotion_carried_by_the_move_skips_the_callback(self):
+        board = Board.from_fen('4k3/1P6/8/8/8/8/8/4K3 w - - 0 1')
+        board.promotion_cb = unittest.mock.Mock()
+
+        board.move(board.encode_move(P('b7'), P('b8'), Type.KNIGHT))
+
+        board.promotion_cb.assert_not_called()
+        self.assertEqual(board[Rank.EIGHT][File.B].figure_type, Type.KNIGHT)
+        self.assertEqual(board[Rank.EIGHT][File.B].color, Color.WHITE)
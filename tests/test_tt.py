@@ -0,0 +1,129 @@
+import unittest
+
+from chess.move import Move, CAPTURE
+from chess.tt import TranspositionTable, Bound, Replacement, BUCKET_SIZE
+
+
+def colliding_keys(tt, count, index=5):
+    '''Keys that land in the same bucket but belong to different positions.'''
+    return [index + tt._buckets * i + (i + 1 << 48) for i in range(count)]
+
+
+class TranspositionTableTests(unittest.TestCase):
+    def test_size_is_fixed(self):
+        tt = TranspositionTable(size_mb=1)
+
+        self.assertEqual(tt.size_bytes, 2 ** 20)
+        self.assertEqual(tt.capacity, 2 ** 20 // 8)
+        for key in range(10000):
+            tt.store(key * 0x9e3779b97f4a7c15, depth=1, bound=Bound.LOWER, score=key % 100)
+        self.assertEqual(tt.size_bytes, 2 ** 20)
+        self.assertEqual(tt.capacity, 2 ** 20 // 8)
+
+        with self.assertRaises(ValueError):
+            TranspositionTable(size_mb=0)
+
+    def test_len_counts_the_filled_slots(self):
+        tt = TranspositionTable(size_mb=1)
+        self.assertEqual(len(tt), 0)
+
+        tt.store(42, depth=1, bound=Bound.EXACT, score=0)
+        tt.store(42, depth=2, bound=Bound.EXACT, score=0)
+        self.assertEqual(len(tt), 1)
+
+        for key in colliding_keys(tt, BUCKET_SIZE + 2):
+            tt.store(key, depth=1, bound=Bound.LOWER, score=0)
+        self.assertEqual(len(tt), 1 + BUCKET_SIZE)
+
+        tt.clear()
+        self.assertEqual(len(tt), 0)
+
+    def test_round_trip(self):
+        tt = TranspositionTable(size_mb=1)
+        move = Move.encode(12, 28, CAPTURE)
+
+        for score in (-2 ** 15, -1, 0, 2 ** 15 - 1):
+            tt.store(0xdead_beef_0000_0042, depth=255, bound=Bound.UPPER, score=score, move=move)
+            entry = tt.probe(0xdead_beef_0000_0042)
+
+            self.assertEqual((entry.depth, entry.bound, entry.score, entry.move), (255, Bound.UPPER, score, move))
+            self.assertIsInstance(entry.move, Move)
+
+        with self.assertRaises(ValueError):
+            tt.store(1, depth=1, bound=Bound.EXACT, score=2 ** 15)
+
+    def test_verification_bits_reject_other_positions(self):
+        tt = TranspositionTable(size_mb=1)
+        tt.store(7 | 1 << 48, depth=3, bound=Bound.EXACT, score=10)
+
+        self.assertIsNone(tt.probe(7 | 2 << 48))
+        self.assertIsNotNone(tt.probe(7 | 1 << 48))
+
+    def test_best_move_survives_a_store_without_one(self):
+        tt = TranspositionTable(size_mb=1)
+        move = Move.encode(1, 18)
+
+        tt.store(99, depth=2, bound=Bound.LOWER, score=5, move=move)
+        tt.store(99, depth=3, bound=Bound.EXACT, score=7)
+
+        self.assertEqual(tt.probe(99).move, move)
+
+    def test_depth_preferred_keeps_deep_entries(self):
+        tt = TranspositionTable(size_mb=1)
+        keys = colliding_keys(tt, BUCKET_SIZE + 1)
+
+        for depth, key in enumerate(keys[:BUCKET_SIZE], start=5):
+            tt.store(key, depth=depth, bound=Bound.EXACT, score=0)
+
+        tt.store(keys[-1], depth=1, bound=Bound.EXACT, score=0)
+
+        self.assertIsNone(tt.probe(keys[0]))  # the shallowest was replaced
+        self.assertTrue(all(tt.probe(key) for key in keys[1:]))
+        self.assertEqual(tt.overwrites, 1)
+
+        with self.subTest('same position, shallower search'):
+            stores = tt.stores
+            tt.store(keys[1], depth=2, bound=Bound.LOWER, score=1)
+
+            self.assertEqual(tt.probe(keys[1]).depth, 6)
+            self.assertEqual((tt.stores, tt.rejected), (stores, 1))
+
+    def test_age_makes_entries_replaceable(self):
+        tt = TranspositionTable(size_mb=1)
+        keys = colliding_keys(tt, BUCKET_SIZE + 1)
+
+        for key in keys[:BUCKET_SIZE - 1]:
+            tt.store(key, depth=6, bound=Bound.EXACT, score=0)
+
+        tt.new_search()
+        tt.new_search()
+        tt.store(keys[BUCKET_SIZE - 1], depth=2, bound=Bound.EXACT, score=0)
+        tt.store(keys[-1], depth=1, bound=Bound.EXACT, score=0)
+
+        self.assertIsNotNone(tt.probe(keys[BUCKET_SIZE - 1]))
+        self.assertIsNone(tt.probe(keys[0]))
+
+    def test_always_replace(self):
+        tt = TranspositionTable(size_mb=1, replacement=Replacement.ALWAYS)
+        keys = colliding_keys(tt, BUCKET_SIZE + 1)
+
+        for key in keys[:BUCKET_SIZE]:
+            tt.store(key, depth=30, bound=Bound.EXACT, score=0)
+        tt.store(keys[-1], depth=1, bound=Bound.EXACT, score=0)
+        tt.store(keys[1], depth=1, bound=Bound.LOWER, score=3)
+
+        self.assertIsNotNone(tt.probe(keys[-1]))
+        self.assertEqual(tt.probe(keys[1]).depth, 1)
+
+    def test_counters(self):
+        tt = TranspositionTable(size_mb=1)
+        tt.store(1, depth=1, bound=Bound.EXACT, score=0)
+        tt.probe(1)
+        tt.probe(2)
+
+        self.assertEqual((tt.stores, tt.probes, tt.hits), (1, 2, 1))
+        self.assertEqual(tt.hit_rate, 0.5)
+
+        tt.clear()
+        self.assertEqual((tt.stores, tt.rejected, tt.probes, tt.hit_rate), (0, 0, 0, 0.0))
+        self.assertIsNone(tt.probe(1))
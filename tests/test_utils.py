@@ -1,32 +1,38 @@
-from copy import deepcopy
-
+from chess.attacks import ROTATE_CLOCKWISE
+from chess.bitboard import BitBoard
+from chess.board import Board
+from chess.mailbox import MailboxBoard
 from chess.position import Position
 
+# every board backend, tests that run on all of them loop over these
+BACKENDS = (Board, BitBoard, MailboxBoard)
 
-def rotate_board(board, times=1):
-    board = deepcopy(board)
-    for k, v in board.kings.items():
-        if v is not None:
-            board.kings[k] = rotate_position(v, times)
 
-    for _ in range(times):  # ¯\_(ツ)_/¯
-        board._board = (zip(*reversed(board._board)))  # rotate 90 deg == transpose + reverse columns
-        board._board = [list(elem) for elem in board._board]
+def _rotations():
+    '''Per number of clockwise quarter turns, the square every square goes to.'''
+    rotations = [tuple(range(64))]
+
+    for _ in range(3):
+        rotations.append(tuple(ROTATE_CLOCKWISE[square] for square in rotations[-1]))
+
+    return rotations
 
-    return board
+
+_ROTATIONS = _rotations()
+
+
+def rotate_board(board, times=1):
+    '''A copy of the board turned `times` quarter turns clockwise, see `Board.transformed`.'''
+    return board.transformed(_ROTATIONS[times % 4])
 
 
 def rotate_position(position: Position, times=1):
-    new_pos = deepcopy(position)
+    return Position.from_square(_ROTATIONS[times % 4][position.square])
 
-    for _ in range(times):
-        rank, file = new_pos.coordinates
 
-        new_rank, new_file = 7 - rank, file
-        new_rank, new_file = new_file, new_rank
-        # new_rank, new_file = 7 - file, rank
-        # new_rank = 7 - new_rank
-        new_rank, new_file = chr(7 - new_rank + ord('1')), chr(new_file + ord('a'))
-        new_pos = Position.from_str(new_file + new_rank)
+def play(board, *moves):
+    '''Pushes `moves`, given like 'e2e4', on `board` and returns it.'''
+    for move in moves:
+        board.push((Position.from_str(move[:2]), Position.from_str(move[2:])))
+    return board
 
-    return new_pos
@@ -0,0 +1,108 @@
+import random
+import unittest
+from copy import deepcopy
+
+from chess import zobrist
+from chess.bitboard import BitBoard
+from chess.board import Board
+from chess.constants import Rank, File, CastlingPerm
+from chess.constants import FigureColor as Color
+from chess.pieces import Queen, Knight
+from chess.position import Position
+from tests.test_bitboard import FENS
+from tests.test_utils import BACKENDS, play
+
+P = Position.from_str
+
+
+class ZobristKeyTests(unittest.TestCase):
+    def test_fen_and_standard_configuration_agree(self):
+        self.assertEqual(
+            Board.standard_configuration().zobrist_key,
+            Board.from_fen('rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1').zobrist_key
+        )
+
+    def test_backends_agree(self):
+        for fen in FENS:
+            with self.subTest(fen):
+                self.assertEqual(Board.from_fen(fen).zobrist_key, BitBoard.from_fen(fen).zobrist_key)
+                self.assertEqual(Board.from_fen(fen).zobrist_key, zobrist.board_key(Board.from_fen(fen)))
+
+    def test_state_changes_are_keyed(self):
+        board = Board.standard_configuration()
+        keys = {board.zobrist_key}
+
+        board.next_turn()
+        keys.add(board.zobrist_key)
+        board.next_turn()
+
+        board.en_passant_pos = P('e3')
+        keys.add(board.zobrist_key)
+        board.en_passant_pos = None
+
+        board.castling_perms[Color.WHITE] &= ~CastlingPerm.KING_SIDE
+        keys.add(board.zobrist_key)
+        board.castling_perms[Color.WHITE] = CastlingPerm.ALL
+
+        self.assertEqual(len(keys), 4)
+        self.assertEqual(board.zobrist_key, Board.standard_configuration().zobrist_key)
+
+    def test_transpositions_share_a_key(self):
+        first = play(Board.standard_configuration(), 'g1f3', 'g8f6', 'b1c3')
+        second = play(Board.standard_configuration(), 'b1c3', 'g8f6', 'g1f3')
+
+        self.assertEqual(first.zobrist_key, second.zobrist_key)
+
+    def test_incremental_key_matches_recomputation(self):
+        rng = random.Random(99)
+
+        for backend in BACKENDS:
+            for fen in FENS + ['1r2k3/P1P5/8/8/8/8/8/4K3 w - - 0 1', '4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1']:
+                board = backend.from_fen(fen)
+                board.promotion_cb = lambda: Knight
+                keys = []
+
+                for ply in range(16):
+                    moves = list(board.legal_moves())
+                    if not moves:
+                        break
+
+                    keys.append(board.zobrist_key)
+                    board.push(rng.choice(moves))
+
+                    with self.subTest(f'{backend.__name__} {fen} ply {ply}'):
+                        self.assertEqual(board.zobrist_key, zobrist.board_key(board))
+
+                while keys:
+                    board.pop()
+                    self.assertEqual(board.zobrist_key, keys.pop())
+
+    def test_direct_writes_and_copies(self):
+        board = Board.standard_configuration()
+        board[Rank.FOUR][File.D] = Queen(Color.BLACK)
+        board.castling_perms = {Color.WHITE: CastlingPerm.NONE, Color.BLACK: CastlingPerm.QUEEN_SIDE}
+
+        self.assertEqual(board.zobrist_key, zobrist.board_key(board))
+        self.assertEqual(deepcopy(board).zobrist_key, board.zobrist_key)
+
+    def test_every_castling_mutation_is_keyed(self):
+        board = Board.standard_configuration()
+        start = board.zobrist_key
+
+        self.assertEqual(board.castling_perms.pop(Color.WHITE), CastlingPerm.ALL)
+        self.assertEqual(board.zobrist_key, zobrist.board_key(board))
+
+        self.assertEqual(board.castling_perms.setdefault(Color.WHITE, CastlingPerm.KING_SIDE), CastlingPerm.KING_SIDE)
+        self.assertEqual(board.castling_perms.setdefault(Color.WHITE, CastlingPerm.ALL), CastlingPerm.KING_SIDE)
+        self.assertEqual(board.zobrist_key, zobrist.board_key(board))
+
+        del board.castling_perms[Color.BLACK]
+        board.castling_perms.popitem()
+        self.assertEqual(board.zobrist_key, zobrist.board_key(board))
+
+        board.castling_perms.update({Color.WHITE: CastlingPerm.ALL})
+        board.castling_perms.clear()
+        self.assertEqual(board.zobrist_key, zobrist.board_key(board))
+
+        board.castling_perms.update({Color.WHITE: CastlingPerm.ALL, Color.BLACK: CastlingPerm.ALL})
+        self.assertEqual(board.zobrist_key, start)
@@ -29,6 +29,9 @@ class TuiBoard:
         else:
             self._board = Board.standard_configuration()
 
+        # the move highlighting asks about attacked squares over and over in one position
+        self._board.tracks_attacks = True
+
         # ncurses screen object
         self.screen = screen
         self.centered = centered
@@ -58,8 +61,7 @@ class TuiBoard:
 
         to_pos = self._cursor_to_position(to_pos)
 
-        assert to_pos in self._selected_legal_moves
-
+        assert self._board.is_legal(from_pos, to_pos)
 
         self._board.move(from_pos=from_pos, to_pos=to_pos)
 